@@ -10,44 +10,285 @@ It writes separate markdown result files for each test, named:
 """
 
 import argparse
+import asyncio
 import datetime as dt
-import json
+import hashlib
+import io
+import os
 import pathlib
 import re
+import shelve
+import string
 import textwrap
-from typing import Dict, List, Tuple
+import threading
+from collections import Counter, defaultdict
+from concurrent.futures import ThreadPoolExecutor
+from typing import Awaitable, Dict, List, Optional, Tuple
 
 import requests
+from requests.adapters import HTTPAdapter
+
+try:
+    # Optional: orjson parses the test files noticeably faster
+    from orjson import loads as json_loads
+except ImportError:
+    from json import loads as json_loads
 
 
 # Default Ollama HTTP endpoint
 OLLAMA_URL = "http://localhost:11434/api/generate"
 
 
+def concurrency_from_env(default: int = 4) -> int:
+    """
+    Read OLLAMA_NUM_PARALLEL as a number of requests to keep in flight.
+    Unset, empty, non-numeric and values below 1 (Ollama's own 0 means
+    "auto") all give `default`.
+    """
+    try:
+        value = int(os.environ.get("OLLAMA_NUM_PARALLEL", ""))
+    except ValueError:
+        return default
+    return value if value >= 1 else default
+
+
+# Maximum number of questions in flight at once. Matches the server's
+# OLLAMA_NUM_PARALLEL so requests fill its slots without piling up; it sizes
+# the worker pool main() creates for the blocking HTTP calls.
+MAX_CONCURRENCY = concurrency_from_env()
+
+# Shared keep-alive session so every question reuses an open connection,
+# with one pooled connection per worker thread.
+_SESSION = requests.Session()
+_SESSION.mount(
+    "http://", HTTPAdapter(pool_connections=10, pool_maxsize=MAX_CONCURRENCY)
+)
+_SESSION.headers.update(
+    {"Connection": "keep-alive", "Accept-Encoding": "gzip, deflate"}
+)
+
+# (connect, read) timeouts: fail fast if Ollama is down, but let slow
+# generations take as long as they need.
+OLLAMA_TIMEOUT = (10, 600)
+
+# Single-answer questions only need a letter or digit back, so cap decoding.
+# A few spare tokens leave room for replies like "Answer: B".
+_ANSWER_OPTIONS = {"num_predict": 8}
+
+# Markdown table sections: heading plus header rows, ready to write as-is
+_LIKERT_TYPE_SCORES_HDR = (
+    "## Scores by Personality Type (A–I)\n"
+    "\n"
+    "| Type key | Label | Enneagram type | Total score |\n"
+    "|----------|-------|----------------|-------------|\n"
+)
+_LIKERT_ENNEAGRAM_SCORES_HDR = (
+    "## Scores by Enneagram Type\n"
+    "\n"
+    "| Enneagram type | Total score |\n"
+    "|----------------|-------------|\n"
+)
+_LIKERT_ANSWERS_HDR = (
+    "## Question-by-question ratings\n"
+    "\n"
+    "| # | Type | Statement | Rating (1–5) |\n"
+    "|---|------|-----------|--------------|\n"
+)
+_PAIRED_COLUMNS_HDR = (
+    "## Column → Enneagram type mapping\n"
+    "\n"
+    "| Column | Enneagram type | Label | Total selections |\n"
+    "|--------|----------------|-------|------------------|\n"
+)
+_PAIRED_ENNEAGRAM_SCORES_HDR = (
+    "## Scores by Enneagram type\n"
+    "\n"
+    "| Enneagram type | Total selections |\n"
+    "|----------------|------------------|\n"
+)
+_PAIRED_ANSWERS_HDR = (
+    "## Question-by-question choices\n"
+    "\n"
+    "| # | Choice | Column | Enneagram type | Statement chosen | A (column) | B (column) |\n"
+    "|---|--------|--------|----------------|------------------|-----------|-----------|\n"
+)
+
+# On-disk response cache keyed by (model, format, prompt); opened by main()
+# unless --no-cache is given. Worker threads share it behind a lock.
+_CACHE: Optional[shelve.Shelf] = None
+_CACHE_LOCK = threading.Lock()
+
+# Prompt templates, dedented once at import and filled in per question
+_PROMPT_AB = textwrap.dedent(
+    """
+    You are taking a two-choice (A/B) personality test.
+
+    For each item you will be given two statements, labeled A and B.
+    Pick whichever statement fits you better OVER MOST OF YOUR LIFE.
+
+    Respond with ONLY a single letter:
+    - 'A' if statement A fits better
+    - 'B' if statement B fits better
+
+    Do NOT include any explanation or extra text.
+
+    {q}
+
+    Your answer (A or B only):
+    """
+).strip()
+
+_PROMPT_LIKERT = textwrap.dedent(
+    """
+    You are taking a personality test that uses a 1–5 Likert scale.
+
+    For each statement, answer with a number from 1 to 5:
+    1 = Almost Never
+    2 = Rarely
+    3 = Sometimes
+    4 = Frequently
+    5 = Almost Always
+
+    Respond with ONLY the digit 1, 2, 3, 4, or 5.
+    Do NOT include any explanation or extra text.
+
+    Statement:
+    {q}
+
+    Your answer (1–5 only):
+    """
+).strip()
+
+_PAIRED_QUESTION = "Question {qid}:\n\nA) {a_text}\nB) {b_text}"
+
+# Prompts for --batch-mode: all paired questions, or all statements of one
+# personality type, at once
+_AB_BATCH_PROMPT = textwrap.dedent(
+    """
+    You are taking a two-choice (A/B) personality test.
+
+    For each of the {count} questions below you are given two statements,
+    labeled A and B. Pick whichever statement fits you better OVER MOST OF
+    YOUR LIFE.
+
+    Respond with ONLY a JSON object of the form
+    {{"answers": [{{"id": <question number>, "choice": "A" or "B"}}, ...]}}
+    with exactly one entry per question.
+    Do NOT include any explanation or extra text.
+
+    {questions}
+    """
+).strip()
+
+_LIKERT_BATCH_PROMPT = textwrap.dedent(
+    """
+    You are taking a personality test that uses a 1–5 Likert scale.
+
+    Rate EACH of the {count} numbered statements below with a number from 1 to 5:
+    1 = Almost Never
+    2 = Rarely
+    3 = Sometimes
+    4 = Frequently
+    5 = Almost Always
+
+    Respond with ONLY a JSON object of the form {{"ratings": [r1, r2, ...]}}
+    containing exactly {count} integers, in the same order as the statements.
+    Do NOT include any explanation or extra text.
+
+    Statements:
+    {statements}
+    """
+).strip()
+
+
+# Answer patterns, compiled once at import
+_RE_AB = re.compile(r"\b([AB])\b")
+_RE_15 = re.compile(r"\b([1-5])\b")
+
+# Escapes "|" so statement text can't break markdown table cells
+_PIPE_ESCAPE = str.maketrans({"|": "\\|"})
+
+# Keeps the digits 1–5 and deletes every other code point
+_KEEP_1_TO_5 = defaultdict(lambda: None, {ord(c): c for c in "12345"})
+
+# Maps a-z / 0-9 to themselves and every other code point to "-"
+_SLUG_TABLE = defaultdict(
+    lambda: "-", {ord(c): c for c in string.ascii_lowercase + string.digits}
+)
+
+
+def _quiet(*args, **kwargs) -> None:
+    """
+    Stand-in for print() when per-answer output is turned off.
+    """
+
+
 def slugify(value: str) -> str:
-    value = value.strip().lower()
-    value = re.sub(r"[^a-z0-9]+", "-", value)
-    value = re.sub(r"-{2,}", "-", value)
-    return value.strip("-")
+    # Splitting on "-" and dropping empty parts collapses runs of dashes and
+    # trims leading/trailing ones in a single pass.
+    value = value.strip().lower().translate(_SLUG_TABLE)
+    return "-".join(filter(None, value.split("-")))
 
 
 # ---------------------------------------------------------------------------
 # Ollama helpers
 # ---------------------------------------------------------------------------
 
-def ollama_generate(model: str, prompt: str) -> str:
+def open_prompt_cache(path: pathlib.Path) -> None:
+    """
+    Enable the on-disk response cache stored at `path`.
+    """
+    global _CACHE
+    _CACHE = shelve.open(str(path))
+
+
+def close_prompt_cache() -> None:
+    global _CACHE
+    if _CACHE is not None:
+        _CACHE.close()
+        _CACHE = None
+
+
+def ollama_generate(
+    model: str,
+    prompt: str,
+    fmt: Optional[str] = None,
+    options: Optional[Dict] = None,
+) -> str:
     """
     Call Ollama's /api/generate endpoint (non-streaming) and return the response text.
+    Pass fmt="json" to have Ollama constrain the output to valid JSON, and
+    `options` to forward model options such as num_predict.
+    Responses are served from / stored in the prompt cache when it is open.
     """
+    key = None
+    if _CACHE is not None:
+        key = hashlib.blake2b(
+            f"{model}|{fmt or ''}|{options or ''}|{prompt}".encode("utf-8")
+        ).hexdigest()
+        with _CACHE_LOCK:
+            cached = _CACHE.get(key)
+        if cached is not None:
+            return cached
+
     payload = {
         "model": model,
         "prompt": prompt,
         "stream": False,
     }
-    resp = requests.post(OLLAMA_URL, json=payload, timeout=600)
+    if fmt:
+        payload["format"] = fmt
+    if options:
+        payload["options"] = options
+    resp = _SESSION.post(OLLAMA_URL, json=payload, timeout=OLLAMA_TIMEOUT)
     resp.raise_for_status()
     data = resp.json()
-    return data.get("response", "").strip()
+    text = data.get("response", "").strip()
+
+    if key is not None:
+        with _CACHE_LOCK:
+            _CACHE[key] = text
+    return text
 
 
 def ask_choice_ab(model: str, question_text: str) -> str:
@@ -55,27 +296,10 @@ def ask_choice_ab(model: str, question_text: str) -> str:
     Ask the model to choose A or B.
     Returns normalized "A" or "B".
     """
-    prompt = textwrap.dedent(
-        f"""
-        You are taking a two-choice (A/B) personality test.
-
-        For each item you will be given two statements, labeled A and B.
-        Pick whichever statement fits you better OVER MOST OF YOUR LIFE.
-
-        Respond with ONLY a single letter:
-        - 'A' if statement A fits better
-        - 'B' if statement B fits better
-
-        Do NOT include any explanation or extra text.
-
-        {question_text}
-
-        Your answer (A or B only):
-        """
-    ).strip()
+    prompt = _PROMPT_AB.format(q=question_text)
 
-    raw = ollama_generate(model, prompt).upper()
-    match = re.search(r"\b([AB])\b", raw)
+    raw = ollama_generate(model, prompt, options=_ANSWER_OPTIONS).upper()
+    match = _RE_AB.search(raw)
     if match:
         return match.group(1)
 
@@ -92,59 +316,149 @@ def ask_likert_1_to_5(model: str, question_text: str) -> int:
     Ask the model to rate from 1 to 5.
     Returns an integer 1..5.
     """
-    prompt = textwrap.dedent(
-        f"""
-        You are taking a personality test that uses a 1–5 Likert scale.
+    prompt = _PROMPT_LIKERT.format(q=question_text)
 
-        For each statement, answer with a number from 1 to 5:
-        1 = Almost Never
-        2 = Rarely
-        3 = Sometimes
-        4 = Frequently
-        5 = Almost Always
+    raw = ollama_generate(model, prompt, options=_ANSWER_OPTIONS)
+    # Extract first digit 1–5
+    match = _RE_15.search(raw)
+    if match:
+        return int(match.group(1))
+
+    # Fallback: first 1–5 digit anywhere; very defensive default of 3
+    digits = raw.translate(_KEEP_1_TO_5)
+    return int(digits[0]) if digits else 3
 
-        Respond with ONLY the digit 1, 2, 3, 4, or 5.
-        Do NOT include any explanation or extra text.
 
-        Statement:
-        {question_text}
+def ask_likert_batch(model: str, type_key: str, stmts: List[str]) -> List[int]:
+    """
+    Ask the model to rate a whole block of statements from 1 to 5 in one call.
+    Returns one integer 1..5 per statement. If the JSON reply is malformed or
+    has the wrong length, or a single rating is out of range, the affected
+    statements are asked again one at a time.
+    """
+    numbered = "\n".join(f"{i}. {stmt}" for i, stmt in enumerate(stmts, start=1))
+    prompt = _LIKERT_BATCH_PROMPT.format(count=len(stmts), statements=numbered)
+
+    raw = ollama_generate(model, prompt, fmt="json")
+    try:
+        parsed = json_loads(raw).get("ratings")
+    except (ValueError, AttributeError):
+        parsed = None
+    if not isinstance(parsed, list) or len(parsed) != len(stmts):
+        parsed = [None] * len(stmts)
+
+    ratings: List[int] = []
+    for idx, (stmt, value) in enumerate(zip(stmts, parsed), start=1):
+        if type(value) is int and 1 <= value <= 5:
+            ratings.append(value)
+        else:
+            ratings.append(
+                ask_likert_1_to_5(model, f"[Type {type_key}] Item {idx}:\n{stmt}")
+            )
+    return ratings
+
+
+def ask_choice_ab_batch(model: str, questions: List[Tuple[int, str]]) -> List[str]:
+    """
+    Ask the model to answer every (id, question_text) pair in one call.
+    Returns "A" or "B" per question, in order. Questions missing from the
+    JSON reply, or answered with anything but A/B, are asked again one at
+    a time.
+    """
+    prompt = _AB_BATCH_PROMPT.format(
+        count=len(questions),
+        questions="\n\n".join(text for _, text in questions),
+    )
 
-        Your answer (1–5 only):
-        """
-    ).strip()
+    raw = ollama_generate(model, prompt, fmt="json")
+    try:
+        parsed = json_loads(raw).get("answers")
+    except (ValueError, AttributeError):
+        parsed = None
+
+    by_id: Dict[str, str] = {}
+    if isinstance(parsed, list):
+        for entry in parsed:
+            if isinstance(entry, dict):
+                choice = str(entry.get("choice", "")).strip().upper()
+                by_id[str(entry.get("id"))] = choice
+
+    choices: List[str] = []
+    for qid, question_text in questions:
+        choice = by_id.get(str(qid))
+        if choice not in ("A", "B"):
+            choice = ask_choice_ab(model, question_text)
+        choices.append(choice)
+    return choices
+
+
+async def ask_choice_ab_async(model: str, question_text: str) -> str:
+    """
+    Awaitable variant of ask_choice_ab.
+
+    The blocking HTTP call runs on the worker pool run_tests() installs as
+    the loop's default executor, so up to MAX_CONCURRENCY questions are in
+    flight at once.
+    """
+    return await asyncio.get_running_loop().run_in_executor(
+        None, ask_choice_ab, model, question_text
+    )
+
+
+async def ask_likert_1_to_5_async(model: str, question_text: str) -> int:
+    """
+    Awaitable variant of ask_likert_1_to_5.
+    """
+    return await asyncio.get_running_loop().run_in_executor(
+        None, ask_likert_1_to_5, model, question_text
+    )
 
-    raw = ollama_generate(model, prompt)
-    # Extract first digit 1–5
-    match = re.search(r"\b([1-5])\b", raw)
-    if match:
-        return int(match.group(1))
 
-    # Fallback: try first char
-    for ch in raw:
-        if ch in "12345":
-            return int(ch)
+async def ask_likert_batch_async(
+    model: str, type_key: str, stmts: List[str]
+) -> List[int]:
+    """
+    Awaitable variant of ask_likert_batch.
+    """
+    return await asyncio.get_running_loop().run_in_executor(
+        None, ask_likert_batch, model, type_key, stmts
+    )
+
 
-    # Very defensive fallback
-    return 3
+async def ask_choice_ab_batch_async(
+    model: str, questions: List[Tuple[int, str]]
+) -> List[str]:
+    """
+    Awaitable variant of ask_choice_ab_batch.
+    """
+    return await asyncio.get_running_loop().run_in_executor(
+        None, ask_choice_ab_batch, model, questions
+    )
 
 
 # ---------------------------------------------------------------------------
 # Likert-style test logic (tests/enneagram_likert.json)
 # ---------------------------------------------------------------------------
 
-def run_likert_test(
+async def run_likert_test(
     model: str,
     json_path: pathlib.Path,
     outdir: pathlib.Path,
+    batch_mode: bool = False,
+    verbose: bool = False,
 ) -> pathlib.Path:
     """
     Run the Likert-style Enneagram test and write a markdown report.
+    With batch_mode, each personality type's statements are rated in one call;
+    with verbose, every rating is printed as well.
     Returns the path to the output .md file.
     """
-    data = json.loads(json_path.read_text(encoding="utf-8"))
+    log = print if verbose else _quiet
+    data = json_loads(json_path.read_bytes())
     test_name: str = data["test_name"]
     instructions: str = data.get("instructions", "")
     types: Dict[str, Dict] = data["types"]
+    sorted_type_keys = sorted(types.keys())
 
     today = dt.date.today().isoformat()
     slug_test = slugify(test_name)
@@ -152,94 +466,101 @@ def run_likert_test(
     out_path = outdir / f"{slug_test}_{slug_model}_{today}.md"
 
     # Prepare result containers
-    type_scores: Dict[str, int] = {k: 0 for k in types.keys()}
+    type_scores: Counter = Counter(dict.fromkeys(types, 0))
     # Also score by Enneagram type number
-    enneagram_scores: Dict[int, int] = {}
+    enneagram_scores: Counter = Counter()
     # Detailed answers: (type_key, idx, statement, rating)
     answers: List[Tuple[str, int, str, int]] = []
 
     print(f"\n=== Running Likert test: {test_name} ===")
 
-    for type_key in sorted(types.keys()):
-        tinfo = types[type_key]
-        label = tinfo.get("label", "")
-        stmts = tinfo["statements"]
+    # Flatten every statement up front so all questions can be sent at once
+    questions: List[Tuple[str, int, str]] = [
+        (type_key, idx, stmt)
+        for type_key in sorted_type_keys
+        for idx, stmt in enumerate(types[type_key]["statements"], start=1)
+    ]
+    if batch_mode:
+        batches = await asyncio.gather(
+            *(
+                ask_likert_batch_async(model, type_key, types[type_key]["statements"])
+                for type_key in sorted_type_keys
+            )
+        )
+        ratings = [rating for batch in batches for rating in batch]
+    else:
+        ratings = await asyncio.gather(
+            *(
+                ask_likert_1_to_5_async(model, f"[Type {type_key}] Item {idx}:\n{stmt}")
+                for type_key, idx, stmt in questions
+            )
+        )
 
-        print(f"\nPersonality Type {type_key} ({label}) — {len(stmts)} items")
+    for (type_key, idx, stmt), rating in zip(questions, ratings):
+        if idx == 1:
+            tinfo = types[type_key]
+            label = tinfo.get("label", "")
+            log(
+                f"\nPersonality Type {type_key} ({label}) — "
+                f"{len(tinfo['statements'])} items"
+            )
 
-        for idx, stmt in enumerate(stmts, start=1):
-            question_text = f"[Type {type_key}] Item {idx}:\n{stmt}"
-            rating = ask_likert_1_to_5(model, question_text)
-            type_scores[type_key] += rating
-            answers.append((type_key, idx, stmt, rating))
+        type_scores[type_key] += rating
+        answers.append((type_key, idx, stmt, rating))
 
-            print(f"Type {type_key} item {idx:02d}: {rating}")
+        log(f"Type {type_key} item {idx:02d}: {rating}")
 
     # aggregate by Enneagram type
     for type_key, score in type_scores.items():
         e_type = types[type_key].get("maps_to_enneagram_type")
         if e_type is None:
             continue
-        enneagram_scores[e_type] = enneagram_scores.get(e_type, 0) + score
+        enneagram_scores[e_type] += score
 
-    # Sort for top 3
-    top_types = sorted(
-        enneagram_scores.items(), key=lambda x: x[1], reverse=True
-    )
+    # Top 3 by score
+    top_types = enneagram_scores.most_common(3)
 
     # Build markdown
-    lines: List[str] = []
-    lines.append(f"# {test_name} – Likert Results")
-    lines.append("")
-    lines.append(f"- **Model:** `{model}`")
-    lines.append(f"- **Date:** {today}")
-    lines.append("")
+    buf = io.StringIO()
+    w = buf.write
+    w(f"# {test_name} – Likert Results\n")
+    w("\n")
+    w(f"- **Model:** `{model}`\n")
+    w(f"- **Date:** {today}\n")
+    w("\n")
     if instructions:
-        lines.append("## Test instructions")
-        lines.append("")
-        lines.append(instructions)
-        lines.append("")
-
-    lines.append("## Scores by Personality Type (A–I)")
-    lines.append("")
-    lines.append("| Type key | Label | Enneagram type | Total score |")
-    lines.append("|----------|-------|----------------|-------------|")
-    for type_key in sorted(types.keys()):
+        w("## Test instructions\n")
+        w("\n")
+        w(f"{instructions}\n")
+        w("\n")
+
+    w(_LIKERT_TYPE_SCORES_HDR)
+    for type_key in sorted_type_keys:
         tinfo = types[type_key]
         label = tinfo.get("label", "")
         e_type = tinfo.get("maps_to_enneagram_type", "")
         score = type_scores[type_key]
-        lines.append(f"| {type_key} | {label} | {e_type} | {score} |")
+        w(f"| {type_key} | {label} | {e_type} | {score} |\n")
 
-    lines.append("")
-    lines.append("## Scores by Enneagram Type")
-    lines.append("")
-    lines.append("| Enneagram type | Total score |")
-    lines.append("|----------------|-------------|")
+    w("\n")
+    w(_LIKERT_ENNEAGRAM_SCORES_HDR)
     for e_type in sorted(enneagram_scores.keys()):
-        lines.append(f"| {e_type} | {enneagram_scores[e_type]} |")
-
-    lines.append("")
-    lines.append("## Top 3 Candidate Types (by score)")
-    lines.append("")
-    for rank, (e_type, score) in enumerate(top_types[:3], start=1):
-        lines.append(f"**#{rank} – Type {e_type}** (score: {score})")
-        lines.append("")
-
-    lines.append("")
-    lines.append("## Question-by-question ratings")
-    lines.append("")
-    lines.append("| # | Type | Statement | Rating (1–5) |")
-    lines.append("|---|------|-----------|--------------|")
-    counter = 1
-    for type_key, idx, stmt, rating in answers:
-        safe_stmt = stmt.replace("|", "\\|")
-        lines.append(
-            f"| {counter} | {type_key} | {safe_stmt} | {rating} |"
-        )
-        counter += 1
-
-    out_path.write_text("\n".join(lines), encoding="utf-8")
+        w(f"| {e_type} | {enneagram_scores[e_type]} |\n")
+
+    w("\n")
+    w("## Top 3 Candidate Types (by score)\n")
+    w("\n")
+    for rank, (e_type, score) in enumerate(top_types, start=1):
+        w(f"**#{rank} – Type {e_type}** (score: {score})\n")
+        w("\n")
+
+    w("\n")
+    w(_LIKERT_ANSWERS_HDR)
+    for counter, (type_key, idx, stmt, rating) in enumerate(answers, start=1):
+        safe_stmt = stmt.translate(_PIPE_ESCAPE)
+        w(f"| {counter} | {type_key} | {safe_stmt} | {rating} |\n")
+
+    out_path.write_bytes(buf.getvalue().encode("utf-8"))
     print(f"\nLikert test results saved to: {out_path}")
     return out_path
 
@@ -248,19 +569,25 @@ def run_likert_test(
 # Paired-question test logic (tests/enneagram_test.json)
 # ---------------------------------------------------------------------------
 
-def run_paired_test(
+async def run_paired_test(
     model: str,
     json_path: pathlib.Path,
     outdir: pathlib.Path,
+    batch_mode: bool = False,
+    verbose: bool = False,
 ) -> pathlib.Path:
     """
     Run the paired-question Enneagram test and write a markdown report.
+    With batch_mode, all questions are answered in a single call;
+    with verbose, every choice is printed as well.
     Returns the path to the output .md file.
     """
-    data = json.loads(json_path.read_text(encoding="utf-8"))
+    log = print if verbose else _quiet
+    data = json_loads(json_path.read_bytes())
     test_name: str = data["test_name"]
     columns = data["columns"]
     items = data["items"]
+    sorted_cols = sorted(columns.keys())
 
     today = dt.date.today().isoformat()
     slug_test = slugify(test_name)
@@ -268,37 +595,44 @@ def run_paired_test(
     out_path = outdir / f"{slug_test}_{slug_model}_{today}.md"
 
     # Initialize counts
-    counts_by_column: Dict[str, int] = {c: 0 for c in columns.keys()}
-    counts_by_type: Dict[int, int] = {}
+    counts_by_column: Counter = Counter(dict.fromkeys(columns, 0))
+    counts_by_type: Counter = Counter()
 
     answers_detail = []  # list of dicts per question
 
     print(f"\n=== Running paired-question test: {test_name} ===")
 
+    # Resolve every pair and build its question text before asking anything
+    questions = []
     for item in items:
         qid = item["id"]
         pair = item["pair"]
 
-        # Expect exactly two entries in pair
-        a = next(p for p in pair if p["side"].upper() == "A")
-        b = next(p for p in pair if p["side"].upper() == "B")
+        # Expect exactly two entries in pair, one per side
+        p0, p1 = pair
+        a, b = (p0, p1) if p0["side"].upper() == "A" else (p1, p0)
 
-        question_text = textwrap.dedent(
-            f"""
-            Question {qid}:
+        question_text = _PAIRED_QUESTION.format(
+            qid=qid, a_text=a["text"], b_text=b["text"]
+        )
+        questions.append((qid, a, b, question_text))
 
-            A) {a['text']}
-            B) {b['text']}
-            """
-        ).strip()
+    if batch_mode:
+        choices = await ask_choice_ab_batch_async(
+            model, [(q[0], q[3]) for q in questions]
+        )
+    else:
+        choices = await asyncio.gather(
+            *(ask_choice_ab_async(model, q[3]) for q in questions)
+        )
 
-        choice = ask_choice_ab(model, question_text)
+    for (qid, a, b, _), choice in zip(questions, choices):
         chosen = a if choice == "A" else b
         col = chosen["column"]
         counts_by_column[col] += 1
 
         e_type = columns[col]["type"]
-        counts_by_type[e_type] = counts_by_type.get(e_type, 0) + 1
+        counts_by_type[e_type] += 1
 
         answers_detail.append(
             {
@@ -314,63 +648,49 @@ def run_paired_test(
             }
         )
 
-        print(f"Q{qid:02d}: choice={choice}, column={col}, type={e_type}")
+        log(f"Q{qid:02d}: choice={choice}, column={col}, type={e_type}")
 
-    # sort types for top 3
-    top_types = sorted(
-        counts_by_type.items(), key=lambda x: x[1], reverse=True
-    )
+    # top 3 types by count
+    top_types = counts_by_type.most_common(3)
 
     # Build markdown
-    lines: List[str] = []
-    lines.append(f"# {test_name} – Paired-Question Results")
-    lines.append("")
-    lines.append(f"- **Model:** `{model}`")
-    lines.append(f"- **Date:** {today}")
-    lines.append("")
-
-    lines.append("## Column → Enneagram type mapping")
-    lines.append("")
-    lines.append("| Column | Enneagram type | Label | Total selections |")
-    lines.append("|--------|----------------|-------|------------------|")
-    for col in sorted(columns.keys()):
+    buf = io.StringIO()
+    w = buf.write
+    w(f"# {test_name} – Paired-Question Results\n")
+    w("\n")
+    w(f"- **Model:** `{model}`\n")
+    w(f"- **Date:** {today}\n")
+    w("\n")
+
+    w(_PAIRED_COLUMNS_HDR)
+    for col in sorted_cols:
         e_type = columns[col]["type"]
         label = columns[col].get("label", "")
         count = counts_by_column[col]
-        lines.append(f"| {col} | {e_type} | {label} | {count} |")
+        w(f"| {col} | {e_type} | {label} | {count} |\n")
 
-    lines.append("")
-    lines.append("## Scores by Enneagram type")
-    lines.append("")
-    lines.append("| Enneagram type | Total selections |")
-    lines.append("|----------------|------------------|")
+    w("\n")
+    w(_PAIRED_ENNEAGRAM_SCORES_HDR)
     for e_type in sorted(counts_by_type.keys()):
-        lines.append(f"| {e_type} | {counts_by_type[e_type]} |")
-
-    lines.append("")
-    lines.append("## Top 3 Candidate Types (by count)")
-    lines.append("")
-    for rank, (e_type, count) in enumerate(top_types[:3], start=1):
-        lines.append(f"**#{rank} – Type {e_type}** (selections: {count})")
-        lines.append("")
-
-    lines.append("")
-    lines.append("## Question-by-question choices")
-    lines.append("")
-    lines.append(
-        "| # | Choice | Column | Enneagram type | Statement chosen | A (column) | B (column) |"
-    )
-    lines.append(
-        "|---|--------|--------|----------------|------------------|-----------|-----------|"
-    )
+        w(f"| {e_type} | {counts_by_type[e_type]} |\n")
+
+    w("\n")
+    w("## Top 3 Candidate Types (by count)\n")
+    w("\n")
+    for rank, (e_type, count) in enumerate(top_types, start=1):
+        w(f"**#{rank} – Type {e_type}** (selections: {count})\n")
+        w("\n")
+
+    w("\n")
+    w(_PAIRED_ANSWERS_HDR)
     for q in sorted(answers_detail, key=lambda x: x["id"]):
-        short_chosen = q["chosen_text"].replace("|", "\\|")
-        lines.append(
+        short_chosen = q["chosen_text"].translate(_PIPE_ESCAPE)
+        w(
             f"| {q['id']} | {q['choice']} | {q['column']} | {q['enneagram_type']} "
-            f"| {short_chosen} | {q['a_column']} | {q['b_column']} |"
+            f"| {short_chosen} | {q['a_column']} | {q['b_column']} |\n"
         )
 
-    out_path.write_text("\n".join(lines), encoding="utf-8")
+    out_path.write_bytes(buf.getvalue().encode("utf-8"))
     print(f"\nPaired test results saved to: {out_path}")
     return out_path
 
@@ -379,6 +699,18 @@ def run_paired_test(
 # Main
 # ---------------------------------------------------------------------------
 
+async def run_tests(
+    tests: List[Awaitable[pathlib.Path]], executor: ThreadPoolExecutor
+) -> List[pathlib.Path]:
+    """
+    Run the selected tests concurrently so their questions share the
+    server's parallel slots, with their blocking HTTP calls on `executor`.
+    Returns the report paths in the given order.
+    """
+    asyncio.get_running_loop().set_default_executor(executor)
+    return list(await asyncio.gather(*tests))
+
+
 def main():
     parser = argparse.ArgumentParser(
         description="Have an Ollama LLM take two Enneagram tests (Likert + paired) "
@@ -405,6 +737,24 @@ def main():
         default="both",
         help="Which tests to run (default: both).",
     )
+    parser.add_argument(
+        "--batch-mode",
+        action="store_true",
+        help="Ask all statements of a Likert personality type, and all paired "
+             "questions, in a single JSON-mode call each instead of one call "
+             "per question.",
+    )
+    parser.add_argument(
+        "--verbose",
+        action="store_true",
+        help="Print every individual answer while the tests run.",
+    )
+    parser.add_argument(
+        "--no-cache",
+        action="store_true",
+        help="Always query the model instead of reusing cached answers "
+             "from <outdir>/.prompt_cache.",
+    )
     args = parser.parse_args()
 
     tests_dir = pathlib.Path(args.tests_dir)
@@ -414,15 +764,35 @@ def main():
     likert_path = tests_dir / "enneagram_likert.json"
     paired_path = tests_dir / "enneagram_test.json"
 
-    if args.run in ("likert", "both"):
-        if not likert_path.exists():
-            raise FileNotFoundError(f"Likert test file not found: {likert_path}")
-        run_likert_test(args.model, likert_path, outdir)
-
-    if args.run in ("paired", "both"):
-        if not paired_path.exists():
-            raise FileNotFoundError(f"Paired test file not found: {paired_path}")
-        run_paired_test(args.model, paired_path, outdir)
+    run_likert = args.run in ("likert", "both")
+    run_paired = args.run in ("paired", "both")
+    if run_likert and not likert_path.exists():
+        raise FileNotFoundError(f"Likert test file not found: {likert_path}")
+    if run_paired and not paired_path.exists():
+        raise FileNotFoundError(f"Paired test file not found: {paired_path}")
+
+    if not args.no_cache:
+        open_prompt_cache(outdir / ".prompt_cache")
+
+    try:
+        tests = []
+        if run_likert:
+            tests.append(
+                run_likert_test(
+                    args.model, likert_path, outdir, args.batch_mode, args.verbose
+                )
+            )
+        if run_paired:
+            tests.append(
+                run_paired_test(
+                    args.model, paired_path, outdir, args.batch_mode, args.verbose
+                )
+            )
+        # Worker threads for the blocking HTTP calls; the pool size is the throttle
+        executor = ThreadPoolExecutor(max_workers=MAX_CONCURRENCY)
+        asyncio.run(run_tests(tests, executor))
+    finally:
+        close_prompt_cache()
 
 
 if __name__ == "__main__":
@@ -13,15 +13,35 @@ JSON files expected in tests/:
 """
 
 import argparse
+import asyncio
 import datetime as dt
+import functools
+import hashlib
+import itertools
 import json
+import os
 import pathlib
 import re
-import statistics
+import shelve
+import shutil
 import textwrap
-from typing import Dict, List, Tuple, Any
-
+import sys
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from typing import (
+    Any, Awaitable, Callable, Dict, Iterator, List, Optional, Tuple
+)
+
+import numpy as np
 import requests
+from requests.adapters import HTTPAdapter
+
+try:
+    # Optional: orjson decodes responses and test files noticeably faster
+    from orjson import loads as json_loads
+except ImportError:
+    from json import loads as json_loads
 
 # ---------------------------------------------------------------------------
 # Config
@@ -30,6 +50,109 @@ import requests
 OLLAMA_URL = "http://localhost:11434/api/generate"
 
 
+def _concurrency_from_env(default: int = 4) -> int:
+    """
+    OLLAMA_NUM_PARALLEL as a request count, or `default` when it is unset,
+    empty, not a number or below 1 (Ollama reads 0 as "auto").
+    """
+    try:
+        value = int(os.environ.get("OLLAMA_NUM_PARALLEL", ""))
+    except ValueError:
+        return default
+    return value if value >= 1 else default
+
+
+# Default for --concurrency: as many requests as the server runs side by side
+DEFAULT_CONCURRENCY = _concurrency_from_env()
+
+# Answer-parsing patterns, compiled once
+_AB_RE = re.compile(r"\b([AB])\b")
+_AB_FALLBACK_RE = re.compile(r"[AB]")
+_LIKERT_RE = re.compile(r"\b([1-5])\b")
+_LIKERT_FALLBACK_RE = re.compile(r"[1-5]")
+_LIKERT_BATCH_RE = re.compile(r'"i"\s*:\s*(\d+)[^}]*"r"\s*:\s*([1-5])\b')
+
+# Markdown table-cell escaping: raw answers may also contain newlines
+_MD_ESCAPE = str.maketrans({"|": "\\|", "\n": "\\n"})
+_PIPE_ESCAPE = str.maketrans({"|": "\\|"})
+
+# Keep the model loaded between calls (and between runs)
+OLLAMA_KEEP_ALIVE = "30m"
+
+# Static test instructions, sent as the system prompt of every question so
+# only the short per-item part of the prompt changes between calls.
+STATIC_AB_SYSTEM = textwrap.dedent(
+    """
+    You are taking a two-choice (A/B) personality test.
+
+    For each item you will be given two statements, labeled A and B.
+    Pick whichever statement fits you better OVER MOST OF YOUR LIFE.
+
+    Respond with ONLY a single letter:
+    - 'A' if statement A fits better
+    - 'B' if statement B fits better
+
+    Do NOT include any explanation or extra text.
+    """
+).strip()
+
+STATIC_LIKERT_SYSTEM = textwrap.dedent(
+    """
+    You are taking a personality test that uses a 1–5 Likert scale.
+
+    For each statement, answer with a number from 1 to 5:
+    1 = Almost Never
+    2 = Rarely
+    3 = Sometimes
+    4 = Frequently
+    5 = Almost Always
+
+    Respond with ONLY the digit 1, 2, 3, 4, or 5.
+    Do NOT include any explanation or extra text.
+    """
+).strip()
+
+STATIC_LIKERT_BATCH_SYSTEM = textwrap.dedent(
+    """
+    You are taking a personality test that uses a 1–5 Likert scale.
+
+    You will be given several numbered statements. Rate EACH one with a
+    number from 1 to 5:
+    1 = Almost Never
+    2 = Rarely
+    3 = Sometimes
+    4 = Frequently
+    5 = Almost Always
+
+    Respond with ONLY a JSON object of the form
+    {"ratings": [{"i": <statement number>, "r": <rating>}, ...]}
+    with exactly one entry per statement.
+    Do NOT include any explanation or extra text.
+    """
+).strip()
+
+# Single-answer calls only keep the first letter/digit, so cap the decode
+# length instead of letting the model run to its default token limit.
+# Sampling settings are deliberately left alone: run-to-run variation is
+# what the multi-run report measures.
+_ANSWER_OPTIONS = {"num_predict": 8}
+
+# Per-item part of each paired question
+_PAIRED_ITEM_TMPL = "Question {qid}:\n\nA) {a_text}\nB) {b_text}"
+
+# Optional on-disk response cache (see --cache), keyed by model, seed and
+# prompt. Opened by main(); worker threads share it behind a lock.
+_CACHE: Optional[shelve.Shelf] = None
+_CACHE_LOCK = threading.Lock()
+
+# Shared keep-alive session; run_all() sizes its connection pool to match
+# the number of worker threads.
+_SESSION = requests.Session()
+_SESSION.headers.update(
+    {"Connection": "keep-alive", "Accept-Encoding": "gzip, deflate"}
+)
+
+
 def slugify(value: str) -> str:
     value = value.strip().lower()
     value = re.sub(r"[^a-z0-9]+", "-", value)
@@ -41,146 +164,293 @@ def slugify(value: str) -> str:
 # Ollama helpers
 # ---------------------------------------------------------------------------
 
-def ollama_generate(model: str, prompt: str) -> str:
+def ollama_generate(
+    model: str,
+    prompt: str,
+    system: str = "",
+    seed: Optional[int] = None,
+    fmt: str = "",
+    options: Optional[Dict[str, Any]] = None,
+) -> str:
     """
     Call Ollama's /api/generate endpoint (non-streaming) and return the response text.
+    A static `system` prompt is sent separately so Ollama can reuse its KV cache
+    across calls that share it. A `seed` makes the sampling reproducible,
+    fmt="json" constrains the output to valid JSON, and `options` forwards
+    model options such as num_predict.
+    Responses are served from / stored in the response cache when it is open.
     """
+    key = None
+    if _CACHE is not None:
+        key = hashlib.sha256(
+            f"{model}|{seed}|{fmt}|{options}|{system}|{prompt}".encode("utf-8")
+        ).hexdigest()
+        with _CACHE_LOCK:
+            cached = _CACHE.get(key)
+        if cached is not None:
+            return cached
+
     payload = {
         "model": model,
         "prompt": prompt,
         "stream": False,
+        "keep_alive": OLLAMA_KEEP_ALIVE,
     }
-    resp = requests.post(OLLAMA_URL, json=payload, timeout=600)
+    if system:
+        payload["system"] = system
+    opts = dict(options or {})
+    if seed is not None:
+        opts["seed"] = seed
+    if opts:
+        payload["options"] = opts
+    if fmt:
+        payload["format"] = fmt
+    resp = _SESSION.post(OLLAMA_URL, json=payload, timeout=600)
     resp.raise_for_status()
-    data = resp.json()
-    return data.get("response", "").strip()
+    data = json_loads(resp.content)
+    text = data.get("response", "").strip()
+
+    if key is not None:
+        with _CACHE_LOCK:
+            _CACHE[key] = text
+    return text
 
 
-def ask_choice_ab(model: str, item_prompt: str) -> Tuple[str, str]:
+def ask_choice_ab(
+    model: str, item_prompt: str, seed: Optional[int] = None
+) -> Tuple[str, str]:
     """
     Ask the model to choose A or B.
     Returns (normalized_choice, raw_answer_text).
     """
-    prompt = textwrap.dedent(
-        f"""
-        You are taking a two-choice (A/B) personality test.
-
-        For each item you will be given two statements, labeled A and B.
-        Pick whichever statement fits you better OVER MOST OF YOUR LIFE.
-
-        Respond with ONLY a single letter:
-        - 'A' if statement A fits better
-        - 'B' if statement B fits better
-
-        Do NOT include any explanation or extra text.
-
-        {item_prompt}
+    prompt = f"{item_prompt}\n\nYour answer (A or B only):"
 
-        Your answer (A or B only):
-        """
+    raw = ollama_generate(
+        model, prompt, system=STATIC_AB_SYSTEM, seed=seed, options=_ANSWER_OPTIONS
     ).strip()
-
-    raw = ollama_generate(model, prompt).strip()
     upper = raw.upper()
-    match = re.search(r"\b([AB])\b", upper)
+    # Standalone A/B anywhere, else a reply that starts with A or B
+    match = _AB_RE.search(upper) or _AB_FALLBACK_RE.match(upper)
     if match:
-        return match.group(1), raw
+        return match.group(0), raw
 
-    if upper.startswith("A"):
-        return "A", raw
-    if upper.startswith("B"):
-        return "B", raw
     # very defensive fallback
     return "A", raw
 
 
-def ask_likert_1_to_5(model: str, item_prompt: str) -> Tuple[int, str]:
+def ask_likert_1_to_5(
+    model: str, item_prompt: str, seed: Optional[int] = None
+) -> Tuple[int, str]:
     """
     Ask the model to rate from 1 to 5.
     Returns (rating_int, raw_answer_text).
     """
-    prompt = textwrap.dedent(
-        f"""
-        You are taking a personality test that uses a 1–5 Likert scale.
+    prompt = f"Statement:\n{item_prompt}\n\nYour answer (1–5 only):"
 
-        For each statement, answer with a number from 1 to 5:
-        1 = Almost Never
-        2 = Rarely
-        3 = Sometimes
-        4 = Frequently
-        5 = Almost Always
+    raw = ollama_generate(
+        model, prompt, system=STATIC_LIKERT_SYSTEM, seed=seed, options=_ANSWER_OPTIONS
+    ).strip()
+    # Standalone digit 1–5, else the first 1–5 digit anywhere
+    match = _LIKERT_RE.search(raw) or _LIKERT_FALLBACK_RE.search(raw)
+    if match:
+        return int(match.group(0)), raw
 
-        Respond with ONLY the digit 1, 2, 3, 4, or 5.
-        Do NOT include any explanation or extra text.
+    return 3, raw  # fallback
 
-        Statement:
-        {item_prompt}
 
-        Your answer (1–5 only):
-        """
-    ).strip()
+def ask_likert_batch(
+    model: str, item_prompts: List[str], seed: Optional[int] = None
+) -> List[Tuple[int, str]]:
+    """
+    Ask the model to rate several statements from 1 to 5 in one JSON-mode call.
+    Returns one (rating_int, raw_answer_text) per item, where the raw answer
+    is that item's fragment of the JSON reply. Items missing from the reply
+    are asked again one at a time.
+    """
+    prompt = "\n\n".join(
+        f"{n}) {item_prompt}" for n, item_prompt in enumerate(item_prompts, start=1)
+    )
+    raw = ollama_generate(
+        model, prompt, system=STATIC_LIKERT_BATCH_SYSTEM, seed=seed, fmt="json"
+    )
+    found = {
+        int(m.group(1)): (int(m.group(2)), m.group(0))
+        for m in _LIKERT_BATCH_RE.finditer(raw)
+    }
 
-    raw = ollama_generate(model, prompt).strip()
-    match = re.search(r"\b([1-5])\b", raw)
-    if match:
-        return int(match.group(1)), raw
+    results: List[Tuple[int, str]] = []
+    for n, item_prompt in enumerate(item_prompts, start=1):
+        if n in found:
+            results.append(found[n])
+        else:
+            results.append(ask_likert_1_to_5(model, item_prompt, seed))
+    return results
 
-    for ch in raw:
-        if ch in "12345":
-            return int(ch), raw
 
-    return 3, raw  # fallback
+class RunProgress:
+    """
+    Question-level progress and call latencies for one run. Progress lines go
+    to stderr, at most one per `interval` seconds, so concurrent runs don't
+    flood the terminal; summary() gives the latency figures for the run.
+    """
+
+    def __init__(self, label: str, interval: float = 0.5) -> None:
+        self.label = label
+        self.interval = interval
+        self.total = 0
+        self.done = 0
+        self.latencies: List[float] = []
+        self._last_report = 0.0
+
+    def start(self, total: int) -> None:
+        self.total = total
+        self._last_report = time.perf_counter()
+
+    async def call(self, fn: Callable[..., Any], *args: Any, items: int = 1) -> Any:
+        """
+        Run the blocking `fn(*args)` in a worker thread and record its latency
+        (measured in the thread, so time queued for a free worker is excluded).
+        `items` is the number of questions the call answers.
+        """
+        def timed() -> Tuple[Any, float]:
+            t0 = time.perf_counter()
+            return fn(*args), time.perf_counter() - t0
+
+        result, seconds = await asyncio.to_thread(timed)
+        self.latencies.append(seconds)
+        self.done += items
+
+        now = time.perf_counter()
+        if now - self._last_report >= self.interval or self.done == self.total:
+            self._last_report = now
+            sys.stderr.write(f"    {self.label}: {self.done}/{self.total} questions\n")
+            sys.stderr.flush()
+        return result
+
+    def summary(self) -> str:
+        if not self.latencies:
+            return "no calls"
+        lat = np.array(self.latencies)
+        return (
+            f"{len(lat)} calls, mean {lat.mean():.2f}s, "
+            f"p95 {np.percentile(lat, 95):.2f}s"
+        )
+
+
+async def ask_all(
+    ask: Callable[[str, str, Optional[int]], Tuple[Any, str]],
+    model: str,
+    item_prompts: List[str],
+    seed: Optional[int],
+    progress: RunProgress,
+) -> List[Tuple[Any, str]]:
+    """
+    Ask every item prompt concurrently with `ask` and return the answers in
+    prompt order. Identical prompts are only sent once and share the answer.
+    Calls are timed and reported through `progress`.
+    """
+    unique = list(dict.fromkeys(item_prompts))
+    progress.start(len(unique))
+    answers = await asyncio.gather(
+        *(progress.call(ask, model, item_prompt, seed) for item_prompt in unique)
+    )
+    by_prompt = dict(zip(unique, answers))
+    return [by_prompt[item_prompt] for item_prompt in item_prompts]
 
 
 # ---------------------------------------------------------------------------
 # Likert-style test, single run
 # ---------------------------------------------------------------------------
 
-def run_likert_once(
+async def run_likert_once(
     model: str,
     data: Dict[str, Any],
+    seed: Optional[int] = None,
+    batch_size: int = 1,
+    progress: Optional[RunProgress] = None,
 ) -> Dict[str, Any]:
     """
-    Run the Likert-style Enneagram test once and return a dict with:
+    Run the Likert-style Enneagram test once, asking all statements
+    concurrently (up to `batch_size` statements of the same type per call),
+    and return a dict with:
     - 'enneagram_scores': {ennea_type -> score}
     - 'type_scores': {type_key -> score}
     - 'answers': list of question-level dicts including raw answers
-    - 'dominant_types': list of (ennea_type, score) sorted desc
+    - 'dominant_types': list of (ennea_type, score) tied for the top score
     """
+    progress = progress or RunProgress("Likert")
     types = data["types"]
+    type_keys = list(types.keys())
+    key_index = {k: i for i, k in enumerate(type_keys)}
 
-    type_scores: Dict[str, int] = {k: 0 for k in types.keys()}
-    enneagram_scores: Dict[int, int] = {}
     answers: List[Dict[str, Any]] = []
 
-    for type_key in sorted(types.keys()):
-        tinfo = types[type_key]
-        e_type = tinfo.get("maps_to_enneagram_type")
-        stmts = tinfo["statements"]
-
-        for idx, stmt in enumerate(stmts, start=1):
-            item_prompt = f"[Type {type_key}] Item {idx}:\n{stmt}"
-            rating, raw_answer = ask_likert_1_to_5(model, item_prompt)
-
-            type_scores[type_key] += rating
-
-            if e_type is not None:
-                enneagram_scores[e_type] = enneagram_scores.get(e_type, 0) + rating
-
-            answers.append(
-                {
-                    "type_key": type_key,
-                    "item_index": idx,
-                    "statement": stmt,
-                    "rating": rating,
-                    "raw_answer": raw_answer,
-                    "enneagram_type": e_type,
-                }
+    # Flatten all statements first, then ask them concurrently; gather keeps
+    # the results in question order.
+    questions: List[Tuple[str, Any, int, str]] = [
+        (type_key, types[type_key].get("maps_to_enneagram_type"), idx, stmt)
+        for type_key in sorted(type_keys)
+        for idx, stmt in enumerate(types[type_key]["statements"], start=1)
+    ]
+    item_prompts = [
+        f"[Type {type_key}] Item {idx}:\n{stmt}" for type_key, _, idx, stmt in questions
+    ]
+    if batch_size > 1:
+        # Chunk each type's statements; question order is preserved
+        chunks: List[List[str]] = []
+        start = 0
+        for _, group in itertools.groupby(questions, key=lambda q: q[0]):
+            end = start + len(list(group))
+            chunks.extend(
+                item_prompts[k:min(k + batch_size, end)]
+                for k in range(start, end, batch_size)
             )
+            start = end
+        progress.start(len(item_prompts))
+        batches = await asyncio.gather(
+            *(
+                progress.call(ask_likert_batch, model, chunk, seed, items=len(chunk))
+                for chunk in chunks
+            )
+        )
+        results = [res for batch in batches for res in batch]
+    else:
+        results = await ask_all(ask_likert_1_to_5, model, item_prompts, seed, progress)
+
+    # Per-type totals in one scatter-add over the ratings
+    totals = np.zeros(len(type_keys), dtype=np.int64)
+    np.add.at(
+        totals,
+        np.array([key_index[q[0]] for q in questions], dtype=np.intp),
+        np.array([rating for rating, _ in results], dtype=np.int64),
+    )
+    type_scores: Dict[str, int] = {k: int(totals[i]) for k, i in key_index.items()}
 
-    dominant_types = sorted(
-        enneagram_scores.items(), key=lambda x: x[1], reverse=True
+    # Every statement of a type maps to the same Enneagram type, so the
+    # Enneagram totals are sums of type totals (keys in first-asked order)
+    enneagram_scores: Dict[int, int] = dict.fromkeys(
+        (q[1] for q in questions if q[1] is not None), 0
     )
+    for type_key in sorted(type_keys):
+        e_type = types[type_key].get("maps_to_enneagram_type")
+        if e_type in enneagram_scores:
+            enneagram_scores[e_type] += type_scores[type_key]
+
+    for (type_key, e_type, idx, stmt), (rating, raw_answer) in zip(questions, results):
+        answers.append(
+            {
+                "type_key": type_key,
+                "item_index": idx,
+                "statement": stmt,
+                "rating": rating,
+                "raw_answer": raw_answer,
+                "enneagram_type": e_type,
+            }
+        )
+
+    # Only the top-ranked (possibly tied) types are reported
+    top = max(enneagram_scores.values(), default=None)
+    dominant_types = [(t, v) for t, v in enneagram_scores.items() if v == top]
 
     return {
         "enneagram_scores": enneagram_scores,
@@ -194,17 +464,21 @@ def run_likert_once(
 # Paired test, single run
 # ---------------------------------------------------------------------------
 
-def run_paired_once(
+async def run_paired_once(
     model: str,
     data: Dict[str, Any],
+    seed: Optional[int] = None,
+    progress: Optional[RunProgress] = None,
 ) -> Dict[str, Any]:
     """
-    Run the paired-question Enneagram test once and return a dict with:
+    Run the paired-question Enneagram test once, asking all questions
+    concurrently, and return a dict with:
     - 'enneagram_counts': {ennea_type -> count}
     - 'column_counts': {column -> count}
     - 'answers': list of question-level dicts including raw answers
-    - 'dominant_types': list of (ennea_type, count) sorted desc
+    - 'dominant_types': list of (ennea_type, count) tied for the top count
     """
+    progress = progress or RunProgress("Paired")
     columns = data["columns"]
     items = data["items"]
 
@@ -212,23 +486,24 @@ def run_paired_once(
     enneagram_counts: Dict[int, int] = {}
     answers: List[Dict[str, Any]] = []
 
+    questions = []
     for item in items:
         qid = item["id"]
         pair = item["pair"]
 
-        a = next(p for p in pair if p["side"].upper() == "A")
-        b = next(p for p in pair if p["side"].upper() == "B")
+        sides = {p["side"].upper(): p for p in pair}
+        a, b = sides["A"], sides["B"]
 
-        item_prompt = textwrap.dedent(
-            f"""
-            Question {qid}:
+        item_prompt = _PAIRED_ITEM_TMPL.format(
+            qid=qid, a_text=a["text"], b_text=b["text"]
+        )
+        questions.append((qid, a, b, item_prompt))
 
-            A) {a['text']}
-            B) {b['text']}
-            """
-        ).strip()
+    results = await ask_all(
+        ask_choice_ab, model, [q[3] for q in questions], seed, progress
+    )
 
-        choice, raw_answer = ask_choice_ab(model, item_prompt)
+    for (qid, a, b, _), (choice, raw_answer) in zip(questions, results):
         chosen = a if choice == "A" else b
         col = chosen["column"]
         column_counts[col] += 1
@@ -252,9 +527,9 @@ def run_paired_once(
             }
         )
 
-    dominant_types = sorted(
-        enneagram_counts.items(), key=lambda x: x[1], reverse=True
-    )
+    # Only the top-ranked (possibly tied) types are reported
+    top = max(enneagram_counts.values(), default=None)
+    dominant_types = [(t, v) for t, v in enneagram_counts.items() if v == top]
 
     return {
         "enneagram_counts": enneagram_counts,
@@ -268,30 +543,47 @@ def run_paired_once(
 # Aggregation helpers
 # ---------------------------------------------------------------------------
 
+def score_matrix(runs: List[Dict[int, int]]) -> Tuple[List[int], np.ndarray]:
+    """
+    Given a list of dicts like [{1: 10, 2: 3, ...}, {1: 11, ...}, ...],
+    return (all_types, arr) where arr is the (n_runs, n_types) int matrix of
+    scores, with 0 for a type missing from a run.
+    """
+    all_types = sorted({t for r in runs for t in r})
+    arr = np.array(
+        [[r.get(t, 0) for t in all_types] for r in runs], dtype=np.int64
+    ).reshape(len(runs), len(all_types))
+    return all_types, arr
+
+
 def aggregate_numeric_runs(
-    runs: List[Dict[int, int]]
+    all_types: List[int], arr: np.ndarray
 ) -> Dict[int, Dict[str, Any]]:
     """
-    Given a list of dicts like [{1: 10, 2: 3, ...}, {1: 11, ...}, ...],
-    return {type: {"scores": [...], "mean": float, "stdev": float}}
+    Given a score matrix from score_matrix(), return
+    {type: {"scores": [...], "mean": float, "stdev": float, "min": int, "max": int}}
     """
-    all_types = set()
-    for r in runs:
-        all_types.update(r.keys())
+    if not all_types:
+        return {}
+
+    # Each statistic is one vectorized reduction over the runs axis
+    runs = arr.shape[0]
+    means = arr.mean(axis=0)
+    if runs > 1:
+        stdevs = arr.std(axis=0, ddof=1)
+    else:
+        stdevs = np.zeros(len(all_types))
+    mins = arr.min(axis=0)
+    maxs = arr.max(axis=0)
 
     agg: Dict[int, Dict[str, Any]] = {}
-    for t in sorted(all_types):
-        scores = [r.get(t, 0) for r in runs]
-        if len(scores) > 1:
-            stdev = statistics.stdev(scores)
-        else:
-            stdev = 0.0
+    for col, t in enumerate(all_types):
         agg[t] = {
-            "scores": scores,
-            "mean": statistics.mean(scores),
-            "stdev": stdev,
-            "min": min(scores),
-            "max": max(scores),
+            "scores": arr[:, col].tolist(),
+            "mean": float(means[col]),
+            "stdev": float(stdevs[col]),
+            "min": int(mins[col]),
+            "max": int(maxs[col]),
         }
     return agg
 
@@ -300,226 +592,346 @@ def aggregate_numeric_runs(
 # Markdown building
 # ---------------------------------------------------------------------------
 
-def build_markdown(
+def iter_markdown(
     model: str,
     likert_json: Dict[str, Any],
     paired_json: Dict[str, Any],
     likert_runs: List[Dict[str, Any]],
     paired_runs: List[Dict[str, Any]],
-) -> str:
+) -> Iterator[str]:
+    """
+    Yield the multi-run report line by line (without trailing newlines), so
+    it can be streamed to disk instead of being joined in memory first.
+    """
     today = dt.date.today().isoformat()
-    lines: List[str] = []
 
-    lines.append(f"# Enneagram Multi-Run Results – Model `{model}`")
-    lines.append("")
-    lines.append(f"_Date: {today}_")
-    lines.append("")
-    lines.append(
+    yield f"# Enneagram Multi-Run Results – Model `{model}`"
+    yield ""
+    yield f"_Date: {today}_"
+    yield ""
+    yield (
         "This document contains results for running **two Enneagram tests** "
         "multiple times with the same LLM:"
     )
-    lines.append("")
-    lines.append("- **Likert-style Enneagram Assessment** (1–5 scale)")
-    lines.append("- **Paired A/B Enneagram Test** (forced choice)")
-    lines.append("")
-    lines.append(
+    yield ""
+    yield "- **Likert-style Enneagram Assessment** (1–5 scale)"
+    yield "- **Paired A/B Enneagram Test** (forced choice)"
+    yield ""
+    yield (
         "Each test was run multiple times (N runs), to evaluate consistency, variability, "
         "and the stability of the model's Enneagram-like 'personality' profile."
     )
-    lines.append("")
+    yield ""
 
     # ------------------------------------------------------------------
     # Likert section
     # ------------------------------------------------------------------
-    lines.append("## 1. Likert-Style Enneagram Assessment")
-    lines.append("")
-    lines.append(f"Test name: **{likert_json.get('test_name', '')}**")
-    lines.append("")
+    yield "## 1. Likert-Style Enneagram Assessment"
+    yield ""
+    yield f"Test name: **{likert_json.get('test_name', '')}**"
+    yield ""
     n_runs = len(likert_runs)
-    lines.append(f"Number of runs: **{n_runs}**")
-    lines.append("")
+    yield f"Number of runs: **{n_runs}**"
+    yield ""
 
     # Scores by Enneagram type, per run
-    lines.append("### 1.1 Per-Run Scores by Enneagram Type")
-    lines.append("")
+    yield "### 1.1 Per-Run Scores by Enneagram Type"
+    yield ""
     # collect run-level enneagram_scores
-    likert_ennea_runs: List[Dict[int, int]] = [
-        r["enneagram_scores"] for r in likert_runs
-    ]
-    all_types = sorted(
-        set().union(*[r.keys() for r in likert_ennea_runs])
-    )
+    # One score matrix feeds both the per-run table and the aggregates
+    all_types, likert_arr = score_matrix([r["enneagram_scores"] for r in likert_runs])
 
     header = "| Run | " + " | ".join(f"Type {t}" for t in all_types) + " |"
     sep = "|" + "---|" * (len(all_types) + 1)
-    lines.append(header)
-    lines.append(sep)
-    for i, run in enumerate(likert_ennea_runs, start=1):
-        row = [str(i)]
-        for t in all_types:
-            row.append(str(run.get(t, 0)))
-        lines.append("| " + " | ".join(row) + " |")
-    lines.append("")
+    yield header
+    yield sep
+    for i, row in enumerate(likert_arr.tolist(), start=1):
+        yield f"| {i} | " + " | ".join(map(str, row)) + " |"
+    yield ""
 
     # Aggregated stats
-    lines.append("### 1.2 Averages and Standard Deviations (σ) by Enneagram Type")
-    lines.append("")
-    likert_agg = aggregate_numeric_runs(likert_ennea_runs)
-    lines.append("| Enneagram type | Scores (per run) | Mean | σ (stdev) | Min | Max |")
-    lines.append("|----------------|------------------|------|----------|-----|-----|")
+    yield "### 1.2 Averages and Standard Deviations (σ) by Enneagram Type"
+    yield ""
+    likert_agg = aggregate_numeric_runs(all_types, likert_arr)
+    yield "| Enneagram type | Scores (per run) | Mean | σ (stdev) | Min | Max |"
+    yield "|----------------|------------------|------|----------|-----|-----|"
     for t in sorted(likert_agg.keys()):
         info = likert_agg[t]
         scores_str = ", ".join(str(s) for s in info["scores"])
-        lines.append(
+        yield (
             f"| {t} | {scores_str} | "
             f"{info['mean']:.2f} | {info['stdev']:.2f} | "
             f"{info['min']} | {info['max']} |"
         )
-    lines.append("")
+    yield ""
 
     # Dominant type per run
-    lines.append("### 1.3 Dominant Type per Run (Likert)")
-    lines.append("")
-    lines.append("| Run | Top type(s) |")
-    lines.append("|-----|-------------|")
+    yield "### 1.3 Dominant Type per Run (Likert)"
+    yield ""
+    yield "| Run | Top type(s) |"
+    yield "|-----|-------------|"
     for i, run in enumerate(likert_runs, start=1):
-        tops = run["dominant_types"]
         # top types (maybe multiple if tied at same score)
-        if not tops:
-            txt = "n/a"
-        else:
-            max_score = tops[0][1]
-            top_list = [f"Type {t} ({score})" for t, score in tops if score == max_score]
-            txt = ", ".join(top_list)
-        lines.append(f"| {i} | {txt} |")
-    lines.append("")
+        tops = run["dominant_types"]
+        txt = ", ".join(f"Type {t} ({score})" for t, score in tops) or "n/a"
+        yield f"| {i} | {txt} |"
+    yield ""
 
     # Full transcript
-    lines.append("### 1.4 Full Question & Answer Transcript (Likert)")
-    lines.append("")
-    lines.append(
+    yield "### 1.4 Full Question & Answer Transcript (Likert)"
+    yield ""
+    yield (
         "_For each run, every statement, the LLM's raw answer, and the normalized "
         "rating (1–5) are listed below._"
     )
-    lines.append("")
+    yield ""
 
     for i, run in enumerate(likert_runs, start=1):
-        lines.append(f"#### Likert Run {i}")
-        lines.append("")
+        yield f"#### Likert Run {i}"
+        yield ""
         answers = run["answers"]
-        lines.append("| # | Type | Enneagram | Statement | Raw answer | Rating (1–5) |")
-        lines.append("|---|------|-----------|-----------|------------|--------------|")
+        yield "| # | Type | Enneagram | Statement | Raw answer | Rating (1–5) |"
+        yield "|---|------|-----------|-----------|------------|--------------|"
         for q_idx, ans in enumerate(answers, start=1):
-            stmt = ans["statement"].replace("|", "\\|")
-            raw = ans["raw_answer"].replace("|", "\\|").replace("\n", "\\n")
+            stmt = ans["statement"].translate(_PIPE_ESCAPE)
+            raw = ans["raw_answer"].translate(_MD_ESCAPE)
             e_type = ans["enneagram_type"]
-            lines.append(
+            yield (
                 f"| {q_idx} | {ans['type_key']} | {e_type} | {stmt} | {raw} | {ans['rating']} |"
             )
-        lines.append("")
+        yield ""
 
     # ------------------------------------------------------------------
     # Paired section
     # ------------------------------------------------------------------
-    lines.append("## 2. Paired A/B Enneagram Test")
-    lines.append("")
-    lines.append(f"Test name: **{paired_json.get('test_name', '')}**")
-    lines.append("")
+    yield "## 2. Paired A/B Enneagram Test"
+    yield ""
+    yield f"Test name: **{paired_json.get('test_name', '')}**"
+    yield ""
     n_runs_paired = len(paired_runs)
-    lines.append(f"Number of runs: **{n_runs_paired}**")
-    lines.append("")
+    yield f"Number of runs: **{n_runs_paired}**"
+    yield ""
 
     # Scores by Enneagram type, per run
-    lines.append("### 2.1 Per-Run Selections by Enneagram Type")
-    lines.append("")
-    paired_ennea_runs: List[Dict[int, int]] = [
-        r["enneagram_counts"] for r in paired_runs
-    ]
-    all_p_types = sorted(
-        set().union(*[r.keys() for r in paired_ennea_runs])
-    )
+    yield "### 2.1 Per-Run Selections by Enneagram Type"
+    yield ""
+    all_p_types, paired_arr = score_matrix([r["enneagram_counts"] for r in paired_runs])
 
     header = "| Run | " + " | ".join(f"Type {t}" for t in all_p_types) + " |"
     sep = "|" + "---|" * (len(all_p_types) + 1)
-    lines.append(header)
-    lines.append(sep)
-    for i, run in enumerate(paired_ennea_runs, start=1):
-        row = [str(i)]
-        for t in all_p_types:
-            row.append(str(run.get(t, 0)))
-        lines.append("| " + " | ".join(row) + " |")
-    lines.append("")
+    yield header
+    yield sep
+    for i, row in enumerate(paired_arr.tolist(), start=1):
+        yield f"| {i} | " + " | ".join(map(str, row)) + " |"
+    yield ""
 
     # Aggregated stats
-    lines.append("### 2.2 Averages and Standard Deviations (σ) by Enneagram Type")
-    lines.append("")
-    paired_agg = aggregate_numeric_runs(paired_ennea_runs)
-    lines.append("| Enneagram type | Selections (per run) | Mean | σ (stdev) | Min | Max |")
-    lines.append("|----------------|----------------------|------|----------|-----|-----|")
+    yield "### 2.2 Averages and Standard Deviations (σ) by Enneagram Type"
+    yield ""
+    paired_agg = aggregate_numeric_runs(all_p_types, paired_arr)
+    yield "| Enneagram type | Selections (per run) | Mean | σ (stdev) | Min | Max |"
+    yield "|----------------|----------------------|------|----------|-----|-----|"
     for t in sorted(paired_agg.keys()):
         info = paired_agg[t]
         scores_str = ", ".join(str(s) for s in info["scores"])
-        lines.append(
+        yield (
             f"| {t} | {scores_str} | "
             f"{info['mean']:.2f} | {info['stdev']:.2f} | "
             f"{info['min']} | {info['max']} |"
         )
-    lines.append("")
+    yield ""
 
     # Dominant type per run
-    lines.append("### 2.3 Dominant Type per Run (Paired A/B)")
-    lines.append("")
-    lines.append("| Run | Top type(s) |")
-    lines.append("|-----|-------------|")
+    yield "### 2.3 Dominant Type per Run (Paired A/B)"
+    yield ""
+    yield "| Run | Top type(s) |"
+    yield "|-----|-------------|"
     for i, run in enumerate(paired_runs, start=1):
         tops = run["dominant_types"]
-        if not tops:
-            txt = "n/a"
-        else:
-            max_score = tops[0][1]
-            top_list = [f"Type {t} ({count})" for t, count in tops if count == max_score]
-            txt = ", ".join(top_list)
-        lines.append(f"| {i} | {txt} |")
-    lines.append("")
+        txt = ", ".join(f"Type {t} ({count})" for t, count in tops) or "n/a"
+        yield f"| {i} | {txt} |"
+    yield ""
 
     # Full transcript
-    lines.append("### 2.4 Full Question & Answer Transcript (Paired A/B)")
-    lines.append("")
-    lines.append(
+    yield "### 2.4 Full Question & Answer Transcript (Paired A/B)"
+    yield ""
+    yield (
         "_For each run, every A/B question, the LLM's raw answer text, normalized "
         "choice, and the statement selected are listed below._"
     )
-    lines.append("")
+    yield ""
 
     for i, run in enumerate(paired_runs, start=1):
-        lines.append(f"#### Paired Run {i}")
-        lines.append("")
+        yield f"#### Paired Run {i}"
+        yield ""
         answers = run["answers"]
-        lines.append(
+        yield (
             "| # | Choice | Column | Enneagram | Raw answer | "
             "A text (col) | B text (col) | Chosen text |"
         )
-        lines.append(
+        yield (
             "|---|--------|--------|-----------|-----------|----------------|----------------|-------------|"
         )
         for ans in sorted(answers, key=lambda x: x["id"]):
-            raw = ans["raw_answer"].replace("|", "\\|").replace("\n", "\\n")
-            a_text = ans["a_text"].replace("|", "\\|")
-            b_text = ans["b_text"].replace("|", "\\|")
-            chosen = ans["chosen_text"].replace("|", "\\|")
-            lines.append(
+            raw = ans["raw_answer"].translate(_MD_ESCAPE)
+            a_text = ans["a_text"].translate(_PIPE_ESCAPE)
+            b_text = ans["b_text"].translate(_PIPE_ESCAPE)
+            chosen = ans["chosen_text"].translate(_PIPE_ESCAPE)
+            yield (
                 f"| {ans['id']} | {ans['choice']} | {ans['column']} | {ans['enneagram_type']} "
                 f"| {raw} | {a_text} ({ans['a_column']}) | {b_text} ({ans['b_column']}) | {chosen} |"
             )
-        lines.append("")
-
-    return "\n".join(lines)
+        yield ""
 
 
 # ---------------------------------------------------------------------------
 # Main
 # ---------------------------------------------------------------------------
 
+def _open_cache(path: pathlib.Path) -> None:
+    global _CACHE
+    _CACHE = shelve.open(str(path))
+
+
+def _close_cache() -> None:
+    global _CACHE
+    if _CACHE is not None:
+        _CACHE.close()
+        _CACHE = None
+
+
+def _save_checkpoint(
+    path: pathlib.Path, settings: Dict[str, Any], result: Dict[str, Any]
+) -> None:
+    """
+    Write one completed run to `path`, together with the `settings` it was
+    asked with (via a temp file, so a crash mid-write never leaves a
+    truncated checkpoint behind).
+    """
+    path.parent.mkdir(parents=True, exist_ok=True)
+    tmp = path.with_suffix(".tmp")
+    tmp.write_text(
+        json.dumps({"settings": settings, "result": result}), encoding="utf-8"
+    )
+    tmp.replace(path)
+
+
+def _load_checkpoint(
+    path: pathlib.Path, settings: Dict[str, Any]
+) -> Optional[Dict[str, Any]]:
+    """
+    Read a run written by _save_checkpoint, restoring the int Enneagram-type
+    keys and (type, score) tuples that JSON turns into strings and lists.
+    Returns None if the run was asked with other `settings`.
+    """
+    saved = json_loads(path.read_bytes())
+    if saved.get("settings") != settings:
+        return None
+    result = saved["result"]
+    for key in ("enneagram_scores", "enneagram_counts"):
+        if key in result:
+            result[key] = {int(t): v for t, v in result[key].items()}
+    result["dominant_types"] = [tuple(d) for d in result["dominant_types"]]
+    return result
+
+
+async def run_suite(
+    name: str,
+    run_once: Callable[..., Awaitable[Dict[str, Any]]],
+    model: str,
+    data: Dict[str, Any],
+    runs: int,
+    seed_runs: bool,
+    checkpoint_dir: Optional[pathlib.Path] = None,
+    resume: bool = True,
+    settings: Optional[Dict[str, Any]] = None,
+) -> List[Dict[str, Any]]:
+    """
+    Run one test `runs` times with `run_once` and return the per-run results
+    in run order. The runs are independent, so they are started together and
+    share the worker pool. Each finished run is saved under `checkpoint_dir`
+    along with its seed and `settings` (the other options that change how it
+    is asked); with `resume`, runs already saved there with the same ones are
+    loaded instead of being asked again.
+    """
+
+    async def one_run(i: int) -> Dict[str, Any]:
+        seed = i if seed_runs else None
+        run_settings = {**(settings or {}), "seed": seed}
+        ckpt = checkpoint_dir / f"{name.lower()}_{i}.json" if checkpoint_dir else None
+        if ckpt is not None and resume and ckpt.exists():
+            result = _load_checkpoint(ckpt, run_settings)
+            if result is not None:
+                print(f"  {name} run {i+1} / {runs} (from checkpoint)")
+                return result
+            print(f"  {name} run {i+1} / {runs}: checkpoint has other settings, ignoring it")
+
+        progress = RunProgress(f"{name} run {i+1}")
+        result = await run_once(model, data, seed, progress=progress)
+        if ckpt is not None:
+            _save_checkpoint(ckpt, run_settings, result)
+        print(f"  {name} run {i+1} / {runs} done ({progress.summary()})")
+        return result
+
+    print(f"Running {name} test {runs} times...")
+    return list(await asyncio.gather(*(one_run(i) for i in range(runs))))
+
+
+async def run_all(
+    model: str,
+    likert_data: Dict[str, Any],
+    paired_data: Dict[str, Any],
+    runs: int,
+    concurrency: int,
+    seed_runs: bool = False,
+    batch_size: int = 1,
+    checkpoint_dir: Optional[pathlib.Path] = None,
+    resume: bool = True,
+) -> Tuple[List[Dict[str, Any]], List[Dict[str, Any]]]:
+    """
+    Run both tests `runs` times, all runs side by side, and return
+    (likert_runs, paired_runs). Questions are sent through a worker pool of
+    `concurrency` threads, which caps the number of requests in flight.
+    With seed_runs, run i samples with seed i, so every run is reproducible
+    yet still distinct from the others. batch_size > 1 rates that many Likert
+    statements per call. Completed runs are checkpointed to `checkpoint_dir`
+    (see run_suite).
+    """
+    asyncio.get_running_loop().set_default_executor(
+        ThreadPoolExecutor(max_workers=concurrency)
+    )
+    # One pooled keep-alive connection per worker thread
+    _SESSION.mount(
+        "http://", HTTPAdapter(pool_connections=16, pool_maxsize=concurrency)
+    )
+
+    # Both suites share the worker pool and connection pool
+    likert_runs, paired_runs = await asyncio.gather(
+        run_suite(
+            "Likert",
+            functools.partial(run_likert_once, batch_size=batch_size),
+            model,
+            likert_data,
+            runs,
+            seed_runs,
+            checkpoint_dir,
+            resume,
+            {"batch_size": batch_size},
+        ),
+        run_suite(
+            "Paired",
+            run_paired_once,
+            model,
+            paired_data,
+            runs,
+            seed_runs,
+            checkpoint_dir,
+            resume,
+        ),
+    )
+    return likert_runs, paired_runs
+
+
 def main():
     parser = argparse.ArgumentParser(
         description="Run Likert + Paired Enneagram tests multiple times with an Ollama LLM, "
@@ -546,6 +958,35 @@ def main():
         default=3,
         help="Number of times to run each test (default: 3).",
     )
+    parser.add_argument(
+        "--concurrency",
+        type=int,
+        default=DEFAULT_CONCURRENCY,
+        help="Maximum number of Ollama requests in flight at once (default: "
+             f"$OLLAMA_NUM_PARALLEL or 4, currently {DEFAULT_CONCURRENCY}).",
+    )
+    parser.add_argument(
+        "--cache",
+        action="store_true",
+        help="Reuse answers stored in <outdir>/.prompt_cache. Each run is then "
+             "sampled with a fixed seed (its run number), so re-running the "
+             "script reproduces earlier runs without querying the model.",
+    )
+    parser.add_argument(
+        "--batch-size",
+        type=int,
+        default=1,
+        help="Rate up to this many Likert statements of the same type in one "
+             "JSON-mode call (default: 1, i.e. one statement per call).",
+    )
+    parser.add_argument(
+        "--resume",
+        action=argparse.BooleanOptionalAction,
+        default=True,
+        help="Reuse runs checkpointed by an earlier, interrupted invocation "
+             "(<outdir>/.checkpoints/<model>/) with the same --batch-size and "
+             "--cache settings. Default: --resume.",
+    )
     args = parser.parse_args()
 
     tests_dir = pathlib.Path(args.tests_dir)
@@ -560,36 +1001,47 @@ def main():
     if not paired_path.exists():
         raise FileNotFoundError(f"Paired test file not found: {paired_path}")
 
-    likert_data = json.loads(likert_path.read_text(encoding="utf-8"))
-    paired_data = json.loads(paired_path.read_text(encoding="utf-8"))
-
-    # Run tests multiple times
-    likert_runs: List[Dict[str, Any]] = []
-    paired_runs: List[Dict[str, Any]] = []
+    likert_data = json_loads(likert_path.read_bytes())
+    paired_data = json_loads(paired_path.read_bytes())
 
-    print(f"Running Likert test {args.runs} times...")
-    for i in range(args.runs):
-        print(f"  Likert run {i+1} / {args.runs}")
-        likert_runs.append(run_likert_once(args.model, likert_data))
+    today = dt.date.today().isoformat()
+    slug_model = slugify(args.model)
+    out_path = outdir / f"enneagram-multi_{slug_model}_{today}.md"
+    checkpoint_dir = outdir / ".checkpoints" / slug_model
 
-    print(f"Running Paired test {args.runs} times...")
-    for i in range(args.runs):
-        print(f"  Paired run {i+1} / {args.runs}")
-        paired_runs.append(run_paired_once(args.model, paired_data))
+    # Run tests multiple times
+    if args.cache:
+        _open_cache(outdir / ".prompt_cache")
+    try:
+        likert_runs, paired_runs = asyncio.run(
+            run_all(
+                args.model,
+                likert_data,
+                paired_data,
+                args.runs,
+                args.concurrency,
+                seed_runs=args.cache,
+                batch_size=args.batch_size,
+                checkpoint_dir=checkpoint_dir,
+                resume=args.resume,
+            )
+        )
+    finally:
+        _close_cache()
 
-    # Build markdown
-    multi_md = build_markdown(
+    # Stream markdown straight to the file
+    report = iter_markdown(
         model=args.model,
         likert_json=likert_data,
         paired_json=paired_data,
         likert_runs=likert_runs,
         paired_runs=paired_runs,
     )
+    with out_path.open("w", encoding="utf-8") as f:
+        f.writelines(f"{line}\n" for line in report)
 
-    today = dt.date.today().isoformat()
-    slug_model = slugify(args.model)
-    out_path = outdir / f"enneagram-multi_{slug_model}_{today}.md"
-    out_path.write_text(multi_md, encoding="utf-8")
+    # The report is complete, so the per-run checkpoints are no longer needed
+    shutil.rmtree(checkpoint_dir, ignore_errors=True)
 
     print(f"\nAll results written to: {out_path}")
 
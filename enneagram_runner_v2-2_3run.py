@@ -26,15 +26,29 @@ Enneagram LLM Multi-Run Runner
 """
 
 import argparse
+import asyncio
 import datetime as dt
+import hashlib
+import heapq
 import json
-import math
+import operator
+import os
 import pathlib
 import re
 import textwrap
-from typing import Dict, List, Tuple, Any
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from typing import Dict, List, Optional, Tuple, Any, TextIO
 
+import numpy as np
 import requests
+from requests.adapters import HTTPAdapter
+
+try:
+    # Optional: orjson parses the test files noticeably faster
+    from orjson import loads as json_loads
+except ImportError:
+    from json import loads as json_loads
 
 
 # -----------------------------------------------------------------------------
@@ -43,10 +57,96 @@ import requests
 
 OLLAMA_URL = "http://localhost:11434/api/generate"
 
+
+def _concurrency_from_env(default: int = 4) -> int:
+    """
+    OLLAMA_NUM_PARALLEL as a question count, or `default` when it is unset,
+    empty, not a number or below 1 (Ollama reads 0 as "auto").
+    """
+    try:
+        value = int(os.environ.get("OLLAMA_NUM_PARALLEL", ""))
+    except ValueError:
+        return default
+    return value if value >= 1 else default
+
+
+# Default for --concurrency, sized to the server's parallel request slots
+DEFAULT_CONCURRENCY = _concurrency_from_env()
+
 HEAD_TYPES = [5, 6, 7]
 HEART_TYPES = [2, 3, 4]
 GUT_TYPES = [8, 9, 1]
 
+# Enneagram type → center of intelligence
+_TYPE_TO_CENTER: Dict[int, str] = {
+    **{t: "Head" for t in HEAD_TYPES},
+    **{t: "Heart" for t in HEART_TYPES},
+    **{t: "Gut" for t in GUT_TYPES},
+}
+
+
+# Answer parsing and slug patterns, compiled once
+_AB_RE = re.compile(r"\b([AB])\b")
+_LIKERT_RE = re.compile(r"\b([1-5])\b")
+_SLUG_NONALNUM = re.compile(r"[^a-z0-9]+")
+_SLUG_DASHES = re.compile(r"-{2,}")
+
+# Escapes a string for a markdown table cell: pipes would end the cell and
+# newlines the row
+_MD_CELL = str.maketrans({"|": "\\|", "\n": " "})
+
+# Prompt templates, dedented once at import. (Dedenting the f-string per call
+# was a no-op whenever the question text spanned several lines, which left
+# the instructions indented in the prompt.)
+_AB_PROMPT = textwrap.dedent(
+    """
+    You are taking a two-choice (A/B) personality test.
+
+    For each item you will be given two statements, labeled A and B.
+    Pick whichever statement fits you better OVER MOST OF YOUR LIFE.
+
+    Respond with ONLY a single letter:
+    - 'A' if statement A fits better
+    - 'B' if statement B fits better
+
+    Do NOT include any explanation or extra text.
+
+    {question_text}
+
+    Your answer (A or B only):
+    """
+).strip()
+
+_LIKERT_PROMPT = textwrap.dedent(
+    """
+    You are taking a personality test that uses a 1–5 Likert scale.
+
+    For each statement, answer with a number from 1 to 5:
+    1 = Almost Never
+    2 = Rarely
+    3 = Sometimes
+    4 = Frequently
+    5 = Almost Always
+
+    Respond with ONLY the digit 1, 2, 3, 4, or 5.
+    Do NOT include any explanation or extra text.
+
+    Statement:
+    {question_text}
+
+    Your answer (1–5 only):
+    """
+).strip()
+
+# Opt-in response cache (see --cache): one JSON file per (model, prompt),
+# named by its hash. main() sets _CACHE_DIR when the cache is enabled.
+DEFAULT_CACHE_DIR = pathlib.Path.home() / ".cache" / "enneagram"
+_CACHE_DIR: Optional[pathlib.Path] = None
+
+# Shared keep-alive session, so every question reuses a pooled connection
+# instead of opening a new one. run_all() sizes the pool to the worker count.
+_SESSION = requests.Session()
+
 
 # -----------------------------------------------------------------------------
 # Utility helpers
@@ -54,18 +154,20 @@ GUT_TYPES = [8, 9, 1]
 
 def slugify(value: str) -> str:
     value = value.strip().lower()
-    value = re.sub(r"[^a-z0-9]+", "-", value)
-    value = re.sub(r"-{2,}", "-", value)
+    value = _SLUG_NONALNUM.sub("-", value)
+    value = _SLUG_DASHES.sub("-", value)
     return value.strip("-")
 
 
-def mean_std(values: List[float]) -> Tuple[float, float]:
-    if not values:
-        return 0.0, 0.0
-    n = len(values)
-    m = sum(values) / n
-    var = sum((v - m) ** 2 for v in values) / n
-    return m, math.sqrt(var)
+def column_mean_std(mat: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Population mean and σ of each column of a (runs, k) matrix, as two
+    length-k arrays (zeros when there are no runs).
+    """
+    if mat.shape[0] == 0:
+        zeros = np.zeros(mat.shape[1])
+        return zeros, zeros
+    return mat.mean(axis=0), mat.std(axis=0)
 
 
 # -----------------------------------------------------------------------------
@@ -75,16 +177,35 @@ def mean_std(values: List[float]) -> Tuple[float, float]:
 def ollama_generate(model: str, prompt: str) -> str:
     """
     Call Ollama's /api/generate endpoint (non-streaming) and return the response text.
+    With the response cache enabled, a prompt already answered by this model
+    is served from disk instead.
     """
+    cache_path = None
+    if _CACHE_DIR is not None:
+        key = hashlib.sha1(f"{model}\x00{prompt}".encode("utf-8")).hexdigest()
+        cache_path = _CACHE_DIR / f"{key}.json"
+        if cache_path.exists():
+            return json_loads(cache_path.read_bytes())["response"]
+
     payload = {
         "model": model,
         "prompt": prompt,
         "stream": False,
     }
-    resp = requests.post(OLLAMA_URL, json=payload, timeout=600)
+    resp = _SESSION.post(OLLAMA_URL, json=payload, timeout=600)
     resp.raise_for_status()
     data = resp.json()
-    return data.get("response", "").strip()
+    text = data.get("response", "").strip()
+
+    if cache_path is not None:
+        # Write under a unique temp name, then rename, so concurrent workers
+        # (or invocations) never see a half-written entry
+        tmp = cache_path.with_name(
+            f"{cache_path.name}.{os.getpid()}.{threading.get_ident()}.tmp"
+        )
+        tmp.write_text(json.dumps({"response": text}), encoding="utf-8")
+        os.replace(tmp, cache_path)
+    return text
 
 
 def ask_choice_ab(model: str, question_text: str) -> Tuple[str, str]:
@@ -92,28 +213,15 @@ def ask_choice_ab(model: str, question_text: str) -> Tuple[str, str]:
     Ask the model to choose A or B.
     Returns (normalized_choice, raw_response).
     """
-    prompt = textwrap.dedent(
-        f"""
-        You are taking a two-choice (A/B) personality test.
-
-        For each item you will be given two statements, labeled A and B.
-        Pick whichever statement fits you better OVER MOST OF YOUR LIFE.
-
-        Respond with ONLY a single letter:
-        - 'A' if statement A fits better
-        - 'B' if statement B fits better
-
-        Do NOT include any explanation or extra text.
-
-        {question_text}
-
-        Your answer (A or B only):
-        """
-    ).strip()
+    prompt = _AB_PROMPT.format(question_text=question_text)
 
     raw = ollama_generate(model, prompt).strip()
+    # Fast path: the bare letter the prompt asks for
+    if len(raw) == 1 and raw in "AB":
+        return raw, raw
+
     upper = raw.upper()
-    match = re.search(r"\b([AB])\b", upper)
+    match = _AB_RE.search(upper)
     if match:
         return match.group(1), raw
 
@@ -130,29 +238,14 @@ def ask_likert_1_to_5(model: str, question_text: str) -> Tuple[int, str]:
     Ask the model to rate from 1 to 5.
     Returns (rating, raw_response).
     """
-    prompt = textwrap.dedent(
-        f"""
-        You are taking a personality test that uses a 1–5 Likert scale.
-
-        For each statement, answer with a number from 1 to 5:
-        1 = Almost Never
-        2 = Rarely
-        3 = Sometimes
-        4 = Frequently
-        5 = Almost Always
-
-        Respond with ONLY the digit 1, 2, 3, 4, or 5.
-        Do NOT include any explanation or extra text.
-
-        Statement:
-        {question_text}
-
-        Your answer (1–5 only):
-        """
-    ).strip()
+    prompt = _LIKERT_PROMPT.format(question_text=question_text)
 
     raw = ollama_generate(model, prompt).strip()
-    match = re.search(r"\b([1-5])\b", raw)
+    # Fast path: the bare digit the prompt asks for
+    if len(raw) == 1 and raw in "12345":
+        return int(raw), raw
+
+    match = _LIKERT_RE.search(raw)
     if match:
         return int(match.group(1)), raw
 
@@ -169,10 +262,12 @@ def ask_likert_1_to_5(model: str, question_text: str) -> Tuple[int, str]:
 # -----------------------------------------------------------------------------
 
 def compute_center_scores(type_scores: Dict[int, int]) -> Dict[str, int]:
-    head = sum(type_scores.get(t, 0) for t in HEAD_TYPES)
-    heart = sum(type_scores.get(t, 0) for t in HEART_TYPES)
-    gut = sum(type_scores.get(t, 0) for t in GUT_TYPES)
-    return {"Head": head, "Heart": heart, "Gut": gut}
+    centers = {"Head": 0, "Heart": 0, "Gut": 0}
+    for t, score in type_scores.items():
+        center = _TYPE_TO_CENTER.get(t)
+        if center is not None:
+            centers[center] += score
+    return centers
 
 
 def derive_profile_from_scores(type_scores: Dict[int, int]) -> Dict[str, Any]:
@@ -187,11 +282,9 @@ def derive_profile_from_scores(type_scores: Dict[int, int]) -> Dict[str, Any]:
     if not type_scores:
         return {}
 
-    # Core type and top3
-    sorted_types = sorted(type_scores.items(), key=lambda x: x[1], reverse=True)
-    core_type, core_score = sorted_types[0]
-
-    top3 = sorted_types[:3]
+    # Core type and top3 (ties keep type-score order, as a stable sort would)
+    top3 = heapq.nlargest(3, type_scores.items(), key=operator.itemgetter(1))
+    core_type, core_score = top3[0]
 
     # Wings
     if core_type == 1:
@@ -214,10 +307,16 @@ def derive_profile_from_scores(type_scores: Dict[int, int]) -> Dict[str, Any]:
     else:
         primary_wing = None  # tie
 
-    # Tritype
-    gut_type = max(GUT_TYPES, key=lambda t: type_scores.get(t, 0))
-    heart_type = max(HEART_TYPES, key=lambda t: type_scores.get(t, 0))
-    head_type = max(HEAD_TYPES, key=lambda t: type_scores.get(t, 0))
+    # Tritype: highest-scoring type per center, in one pass. _TYPE_TO_CENTER
+    # lists each center's types in order, so ties go to the first listed.
+    best: Dict[str, Tuple[int, float]] = {}
+    for t, center in _TYPE_TO_CENTER.items():
+        score = type_scores.get(t, 0)
+        if center not in best or score > best[center][1]:
+            best[center] = (t, score)
+    gut_type = best["Gut"][0]
+    heart_type = best["Heart"][0]
+    head_type = best["Head"][0]
 
     center_scores = compute_center_scores(type_scores)
     dominant_center = max(center_scores.items(), key=lambda x: x[1])[0]
@@ -243,61 +342,98 @@ def derive_profile_from_scores(type_scores: Dict[int, int]) -> Dict[str, Any]:
 # Likert test execution (single run)
 # -----------------------------------------------------------------------------
 
-def run_likert_once(
+def prepare_likert_items(data: Dict[str, Any]) -> List[Dict[str, Any]]:
+    """
+    Flatten the Likert statements (types in key order) and render each
+    question text once, so every run can reuse them. Returns a list of
+    {"type_key", "enneagram_type", "index", "statement", "question_text"}
+    dicts in question order.
+    """
+    types = data["types"]
+    prepared: List[Dict[str, Any]] = []
+    for type_key in sorted(types.keys()):
+        tinfo = types[type_key]
+        e_type = tinfo.get("maps_to_enneagram_type")
+        for idx, stmt in enumerate(tinfo["statements"], start=1):
+            prepared.append(
+                {
+                    "type_key": type_key,
+                    "enneagram_type": e_type,
+                    "index": idx,
+                    "statement": stmt,
+                    "question_text": (
+                        f"[Type {type_key} → Enneagram {e_type}] Item {idx}:\n{stmt}"
+                    ),
+                }
+            )
+    return prepared
+
+
+async def run_likert_once(
     model: str,
-    json_path: pathlib.Path,
+    data: Dict[str, Any],
+    items: List[Dict[str, Any]],
     run_index: int,
 ) -> Dict[str, Any]:
     """
-    Run the Likert-style Enneagram test ONCE.
+    Run the Likert-style Enneagram test ONCE, given the parsed test file
+    and its items from prepare_likert_items().
+    All statements are asked concurrently; scoring and the transcript are
+    then built in question order.
     Returns a dict with scores and a full transcript.
     """
-    data = json.loads(json_path.read_text(encoding="utf-8"))
     test_name: str = data["test_name"]
     instructions: str = data.get("instructions", "")
     types = data["types"]  # keys A–I
 
     # Scores
     type_key_scores: Dict[str, int] = {k: 0 for k in types.keys()}
-    enneagram_scores: Dict[int, int] = {}
+    # One slot per Enneagram type the statements map to, in question order
+    enneagram_scores: Dict[int, int] = dict.fromkeys(
+        (q["enneagram_type"] for q in items if q["enneagram_type"] is not None), 0
+    )
 
     transcript: List[Dict[str, Any]] = []
     global_index = 1
 
     print(f"\n[Likert] Run {run_index}: {test_name}")
 
-    for type_key in sorted(types.keys()):
-        tinfo = types[type_key]
-        e_type = tinfo.get("maps_to_enneagram_type")
-        stmts = tinfo["statements"]
-
-        for idx, stmt in enumerate(stmts, start=1):
-            q_text = f"[Type {type_key} → Enneagram {e_type}] Item {idx}:\n{stmt}"
-            rating, raw = ask_likert_1_to_5(model, q_text)
+    answers = await asyncio.gather(
+        *(
+            asyncio.to_thread(ask_likert_1_to_5, model, q["question_text"])
+            for q in items
+        )
+    )
 
-            type_key_scores[type_key] += rating
-            if e_type is not None:
-                enneagram_scores[e_type] = enneagram_scores.get(e_type, 0) + rating
+    for q, (rating, raw) in zip(items, answers):
+        type_key, e_type = q["type_key"], q["enneagram_type"]
+        idx, stmt = q["index"], q["statement"]
+        type_key_scores[type_key] += rating
+        if e_type is not None:
+            enneagram_scores[e_type] += rating
 
-            transcript.append(
-                {
-                    "global_index": global_index,
-                    "type_key": type_key,
-                    "enneagram_type": e_type,
-                    "statement_index_within_type": idx,
-                    "statement": stmt,
-                    "parsed_rating": rating,
-                    "raw_response": raw,
-                }
-            )
-            print(
-                f"[Likert run {run_index}] Q{global_index:03d} "
-                f"(Type {type_key} / {e_type}) → rating={rating}"
-            )
-            global_index += 1
+        transcript.append(
+            {
+                "global_index": global_index,
+                "type_key": type_key,
+                "enneagram_type": e_type,
+                "statement_index_within_type": idx,
+                "statement": stmt,
+                "parsed_rating": rating,
+                "raw_response": raw,
+            }
+        )
+        print(
+            f"[Likert run {run_index}] Q{global_index:03d} "
+            f"(Type {type_key} / {e_type}) → rating={rating}"
+        )
+        global_index += 1
 
     profile = derive_profile_from_scores(enneagram_scores)
-    center_scores = profile.get("center_scores", compute_center_scores(enneagram_scores))
+    # derive_profile_from_scores() already summed the centers (unless empty)
+    center_scores = (
+        profile["center_scores"] if profile else {"Head": 0, "Heart": 0, "Gut": 0}
+    )
 
     return {
         "run_index": run_index,
@@ -315,50 +451,69 @@ def run_likert_once(
 # Paired test execution (single run)
 # -----------------------------------------------------------------------------
 
-def run_paired_once(
+def prepare_paired_items(data: Dict[str, Any]) -> List[Dict[str, Any]]:
+    """
+    Resolve each paired item's A/B sides and render its question text once,
+    so every run can reuse them. Returns a list of
+    {"id", "a", "b", "question_text"} dicts in file order.
+    """
+    prepared: List[Dict[str, Any]] = []
+    for item in data["items"]:
+        qid = item["id"]
+        sides = {p["side"].upper(): p for p in item["pair"]}
+        a, b = sides["A"], sides["B"]
+
+        question_text = textwrap.dedent(
+            f"""
+            Question {qid}:
+
+            A) {a['text']}
+            B) {b['text']}
+            """
+        ).strip()
+        prepared.append({"id": qid, "a": a, "b": b, "question_text": question_text})
+    return prepared
+
+
+async def run_paired_once(
     model: str,
-    json_path: pathlib.Path,
+    data: Dict[str, Any],
+    items: List[Dict[str, Any]],
     run_index: int,
 ) -> Dict[str, Any]:
     """
-    Run the paired-question Enneagram test ONCE.
+    Run the paired-question Enneagram test ONCE, given the parsed test file
+    and its items from prepare_paired_items().
+    All questions are asked concurrently; counts and the transcript are
+    then built in question order.
     Returns a dict with counts and a full transcript.
     """
-    data = json.loads(json_path.read_text(encoding="utf-8"))
     test_name: str = data["test_name"]
     columns = data["columns"]  # mapping column → { type, label }
-    items = data["items"]      # list of question pairs
 
     counts_by_column: Dict[str, int] = {c: 0 for c in columns.keys()}
-    counts_by_type: Dict[int, int] = {}
+    # One slot per Enneagram type the columns map to, so a type that is never
+    # picked still counts as 0
+    counts_by_type: Dict[int, int] = dict.fromkeys(
+        (c["type"] for c in columns.values()), 0
+    )
 
     transcript: List[Dict[str, Any]] = []
 
     print(f"\n[Paired] Run {run_index}: {test_name}")
 
-    for item in items:
-        qid = item["id"]
-        pair = item["pair"]
-
-        a = next(p for p in pair if p["side"].upper() == "A")
-        b = next(p for p in pair if p["side"].upper() == "B")
-
-        question_text = textwrap.dedent(
-            f"""
-            Question {qid}:
-
-            A) {a['text']}
-            B) {b['text']}
-            """
-        ).strip()
+    answers = await asyncio.gather(
+        *(asyncio.to_thread(ask_choice_ab, model, q["question_text"]) for q in items)
+    )
 
-        choice, raw = ask_choice_ab(model, question_text)
+    for q, (choice, raw) in zip(items, answers):
+        qid, a, b = q["id"], q["a"], q["b"]
         chosen = a if choice == "A" else b
         col = chosen["column"]
         counts_by_column[col] += 1
 
         e_type = columns[col]["type"]
-        counts_by_type[e_type] = counts_by_type.get(e_type, 0) + 1
+        counts_by_type[e_type] += 1
 
         transcript.append(
             {
@@ -382,7 +537,10 @@ def run_paired_once(
         )
 
     profile = derive_profile_from_scores(counts_by_type)
-    center_scores = profile.get("center_scores", compute_center_scores(counts_by_type))
+    # derive_profile_from_scores() already summed the centers (unless empty)
+    center_scores = (
+        profile["center_scores"] if profile else {"Head": 0, "Heart": 0, "Gut": 0}
+    )
 
     return {
         "run_index": run_index,
@@ -407,34 +565,43 @@ def aggregate_type_scores_across_runs(
     """
     Given a list of run dicts and the name of the dict key that holds scores
     (e.g. 'enneagram_scores' or 'counts_by_type'), return per-type mean & σ.
+    A type missing from a run counts as 0 for that run.
     """
-    per_type_values: Dict[int, List[int]] = {}
-    for r in runs:
-        scores: Dict[int, int] = r[key]
-        for t, val in scores.items():
-            per_type_values.setdefault(t, []).append(val)
+    types = sorted({t for r in runs for t in r[key]})
+    if not types:
+        return {}
+
+    # (runs, types) matrix; the statistics are column reductions
+    mat = np.array([[r[key].get(t, 0) for t in types] for r in runs])
+    means, stds = column_mean_std(mat)
 
     result: Dict[int, Dict[str, float]] = {}
-    for t in sorted(per_type_values.keys()):
-        vals = per_type_values[t]
-        m, s = mean_std(vals)
-        result[t] = {"mean": m, "std": s, "values": vals}
+    for col, t in enumerate(types):
+        result[t] = {
+            "mean": float(means[col]),
+            "std": float(stds[col]),
+            "values": mat[:, col].tolist(),
+        }
     return result
 
 
 def aggregate_center_scores_across_runs(
     runs: List[Dict[str, Any]],
 ) -> Dict[str, Dict[str, float]]:
-    per_center_values: Dict[str, List[int]] = {"Head": [], "Heart": [], "Gut": []}
-    for r in runs:
-        centers = r["center_scores"]
-        for c in per_center_values.keys():
-            per_center_values[c].append(centers.get(c, 0))
+    centers = ["Head", "Heart", "Gut"]
+    # (runs, 3) matrix; the statistics are column reductions
+    mat = np.array(
+        [[r["center_scores"].get(c, 0) for c in centers] for r in runs]
+    ).reshape(len(runs), len(centers))
+    means, stds = column_mean_std(mat)
 
     result: Dict[str, Dict[str, float]] = {}
-    for center, vals in per_center_values.items():
-        m, s = mean_std(vals)
-        result[center] = {"mean": m, "std": s, "values": vals}
+    for col, center in enumerate(centers):
+        result[center] = {
+            "mean": float(means[col]),
+            "std": float(stds[col]),
+            "values": mat[:, col].tolist(),
+        }
     return result
 
 
@@ -442,44 +609,95 @@ def aggregate_center_scores_across_runs(
 # Markdown report builder
 # -----------------------------------------------------------------------------
 
-def build_markdown_report(
+def render_likert_transcript(r: Dict[str, Any]) -> str:
+    """Render one Likert run's transcript section (heading + table)."""
+    rows = (
+        f"| {q['global_index']} | {q['type_key']} | {q['enneagram_type']} "
+        f"| {q['statement'].translate(_MD_CELL)} "
+        f"| {q['raw_response'].translate(_MD_CELL)} | {q['parsed_rating']} |\n"
+        for q in r["transcript"]
+    )
+    return (
+        f"#### Likert – Run {r['run_index']} Transcript\n"
+        "\n"
+        "| # | Type Key | Enneagram | Statement | Raw Answer | Parsed Rating |\n"
+        "|---|----------|-----------|-----------|-----------|---------------|\n"
+        + "".join(rows)
+        + "\n"
+    )
+
+
+def render_paired_transcript(r: Dict[str, Any]) -> str:
+    """Render one paired run's transcript section (heading + table)."""
+    rows = (
+        f"| {q['id']} | {q['choice']} | {q['column']} | {q['enneagram_type']} "
+        f"| {q['raw_response'].translate(_MD_CELL)} "
+        f"| {q['chosen_text'].translate(_MD_CELL)} "
+        f"| {q['a_text'].translate(_MD_CELL)} ({q['a_column']}) | "
+        f"{q['b_text'].translate(_MD_CELL)} ({q['b_column']}) |\n"
+        for q in r["transcript"]
+    )
+    return (
+        f"#### Paired – Run {r['run_index']} Transcript\n"
+        "\n"
+        "| # | Choice | Column | Enneagram | Raw Answer | Statement chosen | "
+        "A text (column) | B text (column) |\n"
+        "|---|--------|--------|-----------|-----------|------------------|"
+        "-----------------|-----------------|\n"
+        + "".join(rows)
+        + "\n"
+    )
+
+
+def write_markdown_report(
+    fh: TextIO,
     model: str,
     timestamp: dt.datetime,
     runs_per_test: int,
     likert_runs: List[Dict[str, Any]],
     paired_runs: List[Dict[str, Any]],
-) -> str:
-    lines: List[str] = []
+) -> None:
+    """
+    Write the multi-run report to `fh` line by line, so the (transcript-heavy)
+    document is never held in memory as a whole.
+    """
+
+    def emit(line: str) -> None:
+        fh.write(f"{line}\n")
+
+    # Per-run columns shared by the type and center tables of both tests
+    run_cols = " | ".join(f"Run {i}" for i in range(1, runs_per_test + 1))
+    sep_cols = "------|" * runs_per_test
 
     date_str = timestamp.date().isoformat()
     time_str = timestamp.time().replace(microsecond=0).isoformat()
 
-    lines.append("# Enneagram LLM Multi-Run Report")
-    lines.append("")
-    lines.append(f"- **Model:** `{model}`")
-    lines.append(f"- **Date:** {date_str}")
-    lines.append(f"- **Time:** {time_str}")
-    lines.append(f"- **Runs per test:** {runs_per_test}")
-    lines.append("")
-    lines.append(
+    emit("# Enneagram LLM Multi-Run Report")
+    emit("")
+    emit(f"- **Model:** `{model}`")
+    emit(f"- **Date:** {date_str}")
+    emit(f"- **Time:** {time_str}")
+    emit(f"- **Runs per test:** {runs_per_test}")
+    emit("")
+    emit(
         "This file aggregates multiple runs of two Enneagram tests for the same "
         "LLM model to analyze consistency, variability, centers, and full transcripts."
     )
-    lines.append("")
+    emit("")
 
     # ------------------------------------------------------------------
     # 1. Likert multi-run summary
     # ------------------------------------------------------------------
     if likert_runs:
         test_name = likert_runs[0]["test_name"]
-        lines.append("## 1. Likert Test – Multi-Run Summary")
-        lines.append("")
-        lines.append(f"**Test name:** {test_name}")
-        lines.append("")
+        emit("## 1. Likert Test – Multi-Run Summary")
+        emit("")
+        emit(f"**Test name:** {test_name}")
+        emit("")
 
         # 1.1 primary type per run
-        lines.append("### 1.1 Primary Type (and Wings) per Run (Likert)")
-        lines.append("")
+        emit("### 1.1 Primary Type (and Wings) per Run (Likert)")
+        emit("")
         for r in likert_runs:
             p = r["profile"]
             core = p["core_type"]
@@ -489,20 +707,20 @@ def build_markdown_report(
             lw = p["left_wing_score"]
             rw = p["right_wing_score"]
             primary_wing = p["primary_wing"]
-            lines.append(
+            emit(
                 f"- **Run {r['run_index']}** → Core: Type {core} "
                 f"(score {core_score}); "
                 f"Wings: {left} ({lw}), {right} ({rw}); "
                 f"Primary wing: {primary_wing if primary_wing else 'tie'}"
             )
-        lines.append("")
+        emit("")
 
         # 1.2 scores by type across runs
         agg_types = aggregate_type_scores_across_runs(likert_runs, "enneagram_scores")
-        lines.append("### 1.2 Scores by Enneagram Type Across Runs (Likert)")
-        lines.append("")
-        lines.append("| Type | " + " | ".join(f"Run {i}" for i in range(1, runs_per_test + 1)) + " | Mean | σ |")
-        lines.append("|------|" + "------|" * runs_per_test + "------|------|")
+        emit("### 1.2 Scores by Enneagram Type Across Runs (Likert)")
+        emit("")
+        emit(f"| Type | {run_cols} | Mean | σ |")
+        emit(f"|------|{sep_cols}------|------|")
         for t in sorted(agg_types.keys()):
             vals = agg_types[t]["values"]
             # pad if fewer runs for some reason
@@ -510,89 +728,78 @@ def build_markdown_report(
             m = agg_types[t]["mean"]
             s = agg_types[t]["std"]
             vals_str = " | ".join(str(v) for v in vals)
-            lines.append(f"| {t} | {vals_str} | {m:.2f} | {s:.2f} |")
-        lines.append("")
+            emit(f"| {t} | {vals_str} | {m:.2f} | {s:.2f} |")
+        emit("")
 
         # 1.3 centers across runs
         centers_agg = aggregate_center_scores_across_runs(likert_runs)
-        lines.append("### 1.3 Centers of Intelligence per Run (Likert)")
-        lines.append("")
-        lines.append(
+        emit("### 1.3 Centers of Intelligence per Run (Likert)")
+        emit("")
+        emit(
             "Head = Types 5, 6, 7 &nbsp;&nbsp; "
             "Heart = Types 2, 3, 4 &nbsp;&nbsp; "
             "Gut = Types 8, 9, 1"
         )
-        lines.append("")
-        lines.append("| Center | " + " | ".join(f"Run {i}" for i in range(1, runs_per_test + 1)) + " | Mean | σ |")
-        lines.append("|--------|" + "------|" * runs_per_test + "------|------|")
+        emit("")
+        emit(f"| Center | {run_cols} | Mean | σ |")
+        emit(f"|--------|{sep_cols}------|------|")
         for center in ["Head", "Heart", "Gut"]:
             vals = centers_agg[center]["values"]
             vals = vals + [""] * (runs_per_test - len(vals))
             m = centers_agg[center]["mean"]
             s = centers_agg[center]["std"]
             vals_str = " | ".join(str(v) for v in vals)
-            lines.append(f"| {center} | {vals_str} | {m:.2f} | {s:.2f} |")
-        lines.append("")
+            emit(f"| {center} | {vals_str} | {m:.2f} | {s:.2f} |")
+        emit("")
 
         # 1.4 derived profile per run (including tritype / dominant center)
-        lines.append("### 1.4 Derived Enneagram Profile per Run (Likert)")
-        lines.append("")
+        emit("### 1.4 Derived Enneagram Profile per Run (Likert)")
+        emit("")
         for r in likert_runs:
             p = r["profile"]
-            lines.append(f"#### Likert – Run {r['run_index']} Profile")
-            lines.append("")
-            lines.append(f"- **Core type:** {p['core_type']} (score {p['core_score']})")
+            emit(f"#### Likert – Run {r['run_index']} Profile")
+            emit("")
+            emit(f"- **Core type:** {p['core_type']} (score {p['core_score']})")
             t1, t2, t3 = p["top3"]
-            lines.append(
+            emit(
                 f"- **Top 3 types:** "
                 f"{t1[0]} ({t1[1]}), {t2[0]} ({t2[1]}), {t3[0]} ({t3[1]})"
             )
-            lines.append(
+            emit(
                 f"- **Wings:** {p['left_wing']} ({p['left_wing_score']}), "
                 f"{p['right_wing']} ({p['right_wing_score']}); "
                 f"primary wing: {p['primary_wing'] if p['primary_wing'] else 'tie'}"
             )
-            lines.append(
+            emit(
                 f"- **Tritype (Gut / Heart / Head):** "
                 f"{p['gut_type']} / {p['heart_type']} / {p['head_type']}"
             )
             cs = p["center_scores"]
-            lines.append(
+            emit(
                 f"- **Center scores:** Head={cs['Head']}, Heart={cs['Heart']}, Gut={cs['Gut']} "
                 f"(dominant center: {p['dominant_center']})"
             )
-            lines.append("")
+            emit("")
 
         # 1.5 full transcripts
-        lines.append("### 1.5 Full Question Transcripts (Likert)")
-        lines.append("")
+        emit("### 1.5 Full Question Transcripts (Likert)")
+        emit("")
         for r in likert_runs:
-            lines.append(f"#### Likert – Run {r['run_index']} Transcript")
-            lines.append("")
-            lines.append("| # | Type Key | Enneagram | Statement | Raw Answer | Parsed Rating |")
-            lines.append("|---|----------|-----------|-----------|-----------|---------------|")
-            for q in r["transcript"]:
-                stmt = q["statement"].replace("|", "\\|")
-                raw = q["raw_response"].replace("|", "\\|")
-                lines.append(
-                    f"| {q['global_index']} | {q['type_key']} | {q['enneagram_type']} "
-                    f"| {stmt} | {raw} | {q['parsed_rating']} |"
-                )
-            lines.append("")
+            fh.write(render_likert_transcript(r))
 
     # ------------------------------------------------------------------
     # 2. Paired test multi-run summary
     # ------------------------------------------------------------------
     if paired_runs:
         test_name = paired_runs[0]["test_name"]
-        lines.append("## 2. Paired A/B Test – Multi-Run Summary")
-        lines.append("")
-        lines.append(f"**Test name:** {test_name}")
-        lines.append("")
+        emit("## 2. Paired A/B Test – Multi-Run Summary")
+        emit("")
+        emit(f"**Test name:** {test_name}")
+        emit("")
 
         # 2.1 primary type per run
-        lines.append("### 2.1 Primary Type (and Wings) per Run (Paired)")
-        lines.append("")
+        emit("### 2.1 Primary Type (and Wings) per Run (Paired)")
+        emit("")
         for r in paired_runs:
             p = r["profile"]
             core = p["core_type"]
@@ -602,129 +809,137 @@ def build_markdown_report(
             lw = p["left_wing_score"]
             rw = p["right_wing_score"]
             primary_wing = p["primary_wing"]
-            lines.append(
+            emit(
                 f"- **Run {r['run_index']}** → Core: Type {core} "
                 f"(selections {core_score}); "
                 f"Wings: {left} ({lw}), {right} ({rw}); "
                 f"Primary wing: {primary_wing if primary_wing else 'tie'}"
             )
-        lines.append("")
+        emit("")
 
         # 2.2 selections by type across runs
         agg_types = aggregate_type_scores_across_runs(paired_runs, "counts_by_type")
-        lines.append("### 2.2 Selections by Enneagram Type Across Runs (Paired)")
-        lines.append("")
-        lines.append("| Type | " + " | ".join(f"Run {i}" for i in range(1, runs_per_test + 1)) + " | Mean | σ |")
-        lines.append("|------|" + "------|" * runs_per_test + "------|------|")
+        emit("### 2.2 Selections by Enneagram Type Across Runs (Paired)")
+        emit("")
+        emit(f"| Type | {run_cols} | Mean | σ |")
+        emit(f"|------|{sep_cols}------|------|")
         for t in sorted(agg_types.keys()):
             vals = agg_types[t]["values"]
             vals = vals + [""] * (runs_per_test - len(vals))
             m = agg_types[t]["mean"]
             s = agg_types[t]["std"]
             vals_str = " | ".join(str(v) for v in vals)
-            lines.append(f"| {t} | {vals_str} | {m:.2f} | {s:.2f} |")
-        lines.append("")
+            emit(f"| {t} | {vals_str} | {m:.2f} | {s:.2f} |")
+        emit("")
 
         # 2.3 centers across runs
         centers_agg = aggregate_center_scores_across_runs(paired_runs)
-        lines.append("### 2.3 Centers of Intelligence per Run (Paired)")
-        lines.append("")
-        lines.append(
+        emit("### 2.3 Centers of Intelligence per Run (Paired)")
+        emit("")
+        emit(
             "Head = Types 5, 6, 7 &nbsp;&nbsp; "
             "Heart = Types 2, 3, 4 &nbsp;&nbsp; "
             "Gut = Types 8, 9, 1"
         )
-        lines.append("")
-        lines.append("| Center | " + " | ".join(f"Run {i}" for i in range(1, runs_per_test + 1)) + " | Mean | σ |")
-        lines.append("|--------|" + "------|" * runs_per_test + "------|------|")
+        emit("")
+        emit(f"| Center | {run_cols} | Mean | σ |")
+        emit(f"|--------|{sep_cols}------|------|")
         for center in ["Head", "Heart", "Gut"]:
             vals = centers_agg[center]["values"]
             vals = vals + [""] * (runs_per_test - len(vals))
             m = centers_agg[center]["mean"]
             s = centers_agg[center]["std"]
             vals_str = " | ".join(str(v) for v in vals)
-            lines.append(f"| {center} | {vals_str} | {m:.2f} | {s:.2f} |")
-        lines.append("")
+            emit(f"| {center} | {vals_str} | {m:.2f} | {s:.2f} |")
+        emit("")
 
         # 2.4 derived profile per run
-        lines.append("### 2.4 Derived Enneagram Profile per Run (Paired)")
-        lines.append("")
+        emit("### 2.4 Derived Enneagram Profile per Run (Paired)")
+        emit("")
         for r in paired_runs:
             p = r["profile"]
-            lines.append(f"#### Paired – Run {r['run_index']} Profile")
-            lines.append("")
-            lines.append(f"- **Core type:** {p['core_type']} (selections {p['core_score']})")
+            emit(f"#### Paired – Run {r['run_index']} Profile")
+            emit("")
+            emit(f"- **Core type:** {p['core_type']} (selections {p['core_score']})")
             t1, t2, t3 = p["top3"]
-            lines.append(
+            emit(
                 f"- **Top 3 types:** "
                 f"{t1[0]} ({t1[1]}), {t2[0]} ({t2[1]}), {t3[0]} ({t3[1]})"
             )
-            lines.append(
+            emit(
                 f"- **Wings:** {p['left_wing']} ({p['left_wing_score']}), "
                 f"{p['right_wing']} ({p['right_wing_score']}); "
                 f"primary wing: {p['primary_wing'] if p['primary_wing'] else 'tie'}"
             )
-            lines.append(
+            emit(
                 f"- **Tritype (Gut / Heart / Head):** "
                 f"{p['gut_type']} / {p['heart_type']} / {p['head_type']}"
             )
             cs = p["center_scores"]
-            lines.append(
+            emit(
                 f"- **Center scores:** Head={cs['Head']}, Heart={cs['Heart']}, Gut={cs['Gut']} "
                 f"(dominant center: {p['dominant_center']})"
             )
-            lines.append("")
+            emit("")
 
         # 2.5 transcripts
-        lines.append("### 2.5 Full Question Transcripts (Paired)")
-        lines.append("")
+        emit("### 2.5 Full Question Transcripts (Paired)")
+        emit("")
         for r in paired_runs:
-            lines.append(f"#### Paired – Run {r['run_index']} Transcript")
-            lines.append("")
-            lines.append(
-                "| # | Choice | Column | Enneagram | Raw Answer | Statement chosen | "
-                "A text (column) | B text (column) |"
-            )
-            lines.append(
-                "|---|--------|--------|-----------|-----------|------------------|"
-                "-----------------|-----------------|"
-            )
-            for q in r["transcript"]:
-                chosen = q["chosen_text"].replace("|", "\\|")
-                a_text = q["a_text"].replace("|", "\\|")
-                b_text = q["b_text"].replace("|", "\\|")
-                raw = q["raw_response"].replace("|", "\\|")
-                lines.append(
-                    f"| {q['id']} | {q['choice']} | {q['column']} | {q['enneagram_type']} "
-                    f"| {raw} | {chosen} | {a_text} ({q['a_column']}) | "
-                    f"{b_text} ({q['b_column']}) |"
-                )
-            lines.append("")
+            fh.write(render_paired_transcript(r))
 
     # 3. Cheat sheet / interpretation reminder
-    lines.append("## 3. How to Use These Stats (Cheat Sheet)")
-    lines.append("")
-    lines.append("- **High consistency (low σ) for a type** → stable trait in the model.")
-    lines.append("- **High variability (high σ) for a type** → volatile or prompt-sensitive trait.")
-    lines.append("- **Dominant center across runs** → primary processing mode:")
-    lines.append("  - Head (5/6/7) → thinking, anticipating, planning")
-    lines.append("  - Heart (2/3/4) → relating, identity, image")
-    lines.append("  - Gut (8/9/1) → instinct, control, anger")
-    lines.append("")
-    lines.append(
+    emit("## 3. How to Use These Stats (Cheat Sheet)")
+    emit("")
+    emit("- **High consistency (low σ) for a type** → stable trait in the model.")
+    emit("- **High variability (high σ) for a type** → volatile or prompt-sensitive trait.")
+    emit("- **Dominant center across runs** → primary processing mode:")
+    emit("  - Head (5/6/7) → thinking, anticipating, planning")
+    emit("  - Heart (2/3/4) → relating, identity, image")
+    emit("  - Gut (8/9/1) → instinct, control, anger")
+    emit("")
+    emit(
         "You can now compare this file across models, or rerun the same model "
         "with different prompts or temperatures and see how the Enneagram "
         "profile shifts."
     )
-    lines.append("")
 
-    return "\n".join(lines)
 
 
 # -----------------------------------------------------------------------------
 # Main
 # -----------------------------------------------------------------------------
 
+async def run_all(
+    model: str,
+    likert_data: Dict[str, Any],
+    paired_data: Dict[str, Any],
+    runs_per_test: int,
+    concurrency: int,
+) -> Tuple[List[Dict[str, Any]], List[Dict[str, Any]]]:
+    """
+    Run each test `runs_per_test` times and return (likert_runs, paired_runs).
+    The runs are independent, so all of them are started together; their
+    questions share one pool of `concurrency` worker threads, which caps the
+    number of requests in flight.
+    """
+    asyncio.get_running_loop().set_default_executor(
+        ThreadPoolExecutor(max_workers=concurrency)
+    )
+    # One pooled connection per worker thread
+    _SESSION.mount("http://", HTTPAdapter(pool_connections=1, pool_maxsize=concurrency))
+
+    likert_items = prepare_likert_items(likert_data)
+    paired_items = prepare_paired_items(paired_data)
+
+    run_numbers = range(1, runs_per_test + 1)
+    results = await asyncio.gather(
+        *(run_likert_once(model, likert_data, likert_items, i) for i in run_numbers),
+        *(run_paired_once(model, paired_data, paired_items, i) for i in run_numbers),
+    )
+    return list(results[:runs_per_test]), list(results[runs_per_test:])
+
+
 def main():
     parser = argparse.ArgumentParser(
         description="Have an Ollama LLM take Enneagram tests (Likert + paired) "
@@ -751,6 +966,27 @@ def main():
         default=3,
         help="Number of times to run each test (default: 3).",
     )
+    parser.add_argument(
+        "--concurrency",
+        type=int,
+        default=DEFAULT_CONCURRENCY,
+        help="Maximum questions sent to Ollama at once (default: "
+             "$OLLAMA_NUM_PARALLEL, or 4). Set OLLAMA_NUM_PARALLEL on the "
+             "Ollama server to at least this value.",
+    )
+    parser.add_argument(
+        "--cache",
+        action=argparse.BooleanOptionalAction,
+        default=False,
+        help="Reuse earlier answers to identical prompts from an on-disk cache "
+             "(default: --no-cache). Repeated runs then replay the same answers, "
+             "so σ no longer measures the model's variability.",
+    )
+    parser.add_argument(
+        "--cache-dir",
+        default=str(DEFAULT_CACHE_DIR),
+        help=f"Directory for the response cache (default: {DEFAULT_CACHE_DIR}).",
+    )
     args = parser.parse_args()
 
     tests_dir = pathlib.Path(args.tests_dir)
@@ -765,14 +1001,33 @@ def main():
     if not paired_path.exists():
         raise FileNotFoundError(f"Paired test file not found: {paired_path}")
 
-    # Run tests N times
-    likert_runs: List[Dict[str, Any]] = []
-    paired_runs: List[Dict[str, Any]] = []
+    if args.cache:
+        global _CACHE_DIR
+        _CACHE_DIR = pathlib.Path(args.cache_dir)
+        _CACHE_DIR.mkdir(parents=True, exist_ok=True)
+        print(
+            "Warning: response cache enabled; cached answers are replayed for "
+            "repeated prompts, which removes the run-to-run variance this "
+            "report measures."
+        )
 
-    for i in range(1, args.runs_per_test + 1):
-        likert_runs.append(run_likert_once(args.model, likert_path, i))
-    for i in range(1, args.runs_per_test + 1):
-        paired_runs.append(run_paired_once(args.model, paired_path, i))
+    # Parse each test file once; the runs only read from it
+    likert_data = json_loads(likert_path.read_bytes())
+    paired_data = json_loads(paired_path.read_bytes())
+
+    # Run tests N times
+    try:
+        likert_runs, paired_runs = asyncio.run(
+            run_all(
+                args.model,
+                likert_data,
+                paired_data,
+                args.runs_per_test,
+                args.concurrency,
+            )
+        )
+    finally:
+        _SESSION.close()
 
     # Build markdown report
     now = dt.datetime.now()
@@ -780,14 +1035,19 @@ def main():
     timestamp_str = now.strftime("%Y-%m-%d_%H-%M-%S")
     out_path = outdir / f"enneagram-multi_{slug_model}_{timestamp_str}.md"
 
-    md = build_markdown_report(
-        model=args.model,
-        timestamp=now,
-        runs_per_test=args.runs_per_test,
-        likert_runs=likert_runs,
-        paired_runs=paired_runs,
-    )
-    out_path.write_text(md, encoding="utf-8")
+    # Write to a temp file and rename it into place, so an interrupted write
+    # never leaves a truncated report behind
+    tmp_path = out_path.with_suffix(out_path.suffix + ".tmp")
+    with tmp_path.open("w", encoding="utf-8", buffering=1 << 20) as fh:
+        write_markdown_report(
+            fh,
+            model=args.model,
+            timestamp=now,
+            runs_per_test=args.runs_per_test,
+            likert_runs=likert_runs,
+            paired_runs=paired_runs,
+        )
+    os.replace(tmp_path, out_path)
 
     print(f"\nMulti-run report written to: {out_path}")
 
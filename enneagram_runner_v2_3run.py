@@ -18,25 +18,83 @@ and aggregate all results into ONE markdown file.
 """
 
 import argparse
+import atexit
 import datetime as dt
-import json
-import math
+import hashlib
+import heapq
+import io
 import pathlib
 import re
+import shelve
 import textwrap
-from typing import Dict, List, Tuple
+import threading
+from concurrent.futures import Executor, ThreadPoolExecutor
+from typing import Any, Callable, Dict, Iterable, List, Optional, Pattern, Tuple
 
+import numpy as np
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+
+try:
+    # Optional: orjson decodes responses and test files noticeably faster
+    from orjson import loads as json_loads
+except ImportError:
+    from json import loads as json_loads
 
 # Ollama HTTP endpoint
 OLLAMA_URL = "http://localhost:11434/api/generate"
 
+# (connect, read) timeouts: fail fast when Ollama is not reachable, but let
+# a slow generation take as long as it needs
+OLLAMA_TIMEOUT = (10, 600)
+
+# Shared keep-alive session: every question reuses a pooled connection to
+# Ollama instead of opening a new one. Only failed connection attempts are
+# retried; a request that reached the server is never sent twice.
+SESSION = requests.Session()
+SESSION.mount(
+    "http://",
+    HTTPAdapter(
+        pool_connections=16,
+        pool_maxsize=16,
+        max_retries=Retry(total=3, connect=3, read=0, status=0, backoff_factor=0.5),
+    ),
+)
+SESSION.headers.update({"Connection": "keep-alive", "Accept-Encoding": "gzip"})
+atexit.register(SESSION.close)
+
+# How long Ollama keeps the model loaded after each request (see --keep-alive),
+# so it is not unloaded between questions or between runs
+OLLAMA_KEEP_ALIVE = "30m"
+
+# Model options sent with every request (e.g. temperature); set by main()
+OLLAMA_OPTIONS: Dict[str, Any] = {}
+
+# Optional on-disk response cache (see --cache), keyed by model, system
+# prompt, prompt and the model options sent. Opened by main(); worker
+# threads share it behind a lock.
+_CACHE: Optional[shelve.Shelf] = None
+_CACHE_LOCK = threading.Lock()
+
+# Generation cap for the one-item questions, which only need a letter or
+# digit; a model that explains itself is cut off instead of running on
+_ANSWER_OPTIONS = {"num_predict": 8}
+
+# Answer-extraction and slug patterns, compiled once
+_AB_RE = re.compile(r"\b([AB])\b")
+_LIKERT_RE = re.compile(r"\b([1-5])\b")
+# An echoed item number ("1)", "2.", "3:") at the start of a batch reply line
+_ITEM_NUMBER_RE = re.compile(r"^\s*\d+\s*[).:]\s*(?=\S)")
+_SLUG_NONALNUM = re.compile(r"[^a-z0-9]+")
+_SLUG_DASHES = re.compile(r"-{2,}")
+
 # Enneagram centers
-CENTER_MAP = {
-    "head": [5, 6, 7],
-    "heart": [2, 3, 4],
-    "gut": [8, 9, 1],
-}
+CENTER_INDEX: Tuple[Tuple[str, Tuple[int, ...]], ...] = (
+    ("head", (5, 6, 7)),
+    ("heart", (2, 3, 4)),
+    ("gut", (8, 9, 1)),
+)
 
 
 # ---------------------------------------------------------------------------
@@ -45,64 +103,159 @@ CENTER_MAP = {
 
 def slugify(value: str) -> str:
     value = value.strip().lower()
-    value = re.sub(r"[^a-z0-9]+", "-", value)
-    value = re.sub(r"-{2,}", "-", value)
+    value = _SLUG_NONALNUM.sub("-", value)
+    value = _SLUG_DASHES.sub("-", value)
     return value.strip("-")
 
 
-def stddev(values: List[float]) -> float:
-    if not values:
-        return 0.0
-    mean = sum(values) / len(values)
-    var = sum((v - mean) ** 2 for v in values) / len(values)
-    return math.sqrt(var)
+def has_final_match(pattern: Pattern[str], text: str) -> bool:
+    """
+    True once `pattern`'s first match in `text` can no longer change as more
+    text is appended, i.e. it is followed by at least one more character.
+    """
+    match = pattern.search(text)
+    return match is not None and match.end() < len(text)
 
 
 # ---------------------------------------------------------------------------
 # Ollama helpers
 # ---------------------------------------------------------------------------
 
-def ollama_generate(model: str, prompt: str) -> str:
+def ollama_generate(
+    model: str,
+    prompt: str,
+    system: Optional[str] = None,
+    options: Optional[Dict[str, Any]] = None,
+    early_stop: Optional[Callable[[str], bool]] = None,
+) -> str:
     """
-    Call Ollama's /api/generate endpoint (non-streaming) and return the response text.
+    Call Ollama's /api/generate endpoint and return the response text.
+    `system`, if given, is sent as the system prompt; keeping it identical across
+    calls lets Ollama reuse the already-evaluated prefix. `options` are merged
+    over OLLAMA_OPTIONS.
+
+    With `early_stop`, the response is streamed and the request is dropped as
+    soon as early_stop(text so far) is true, so the model stops generating;
+    the text returned is then only what had arrived by that point.
+    Responses are served from / stored in the response cache when it is open.
     """
+    merged_options = {**(options or {}), **OLLAMA_OPTIONS}
+    key = None
+    if _CACHE is not None:
+        sent_options = sorted(merged_options.items())
+        key = hashlib.sha256(
+            f"{model}\0{system or ''}\0{prompt}\0{sent_options}".encode("utf-8")
+        ).hexdigest()
+        with _CACHE_LOCK:
+            cached = _CACHE.get(key)
+        if cached is not None:
+            return cached
+
     payload = {
         "model": model,
         "prompt": prompt,
-        "stream": False,
+        "stream": early_stop is not None,
+        "keep_alive": OLLAMA_KEEP_ALIVE,
     }
-    resp = requests.post(OLLAMA_URL, json=payload, timeout=600)
+    if system is not None:
+        payload["system"] = system
+    if merged_options:
+        payload["options"] = merged_options
+
+    if early_stop is None:
+        resp = SESSION.post(OLLAMA_URL, json=payload, timeout=OLLAMA_TIMEOUT)
+        resp.raise_for_status()
+        data = json_loads(resp.content)
+        text = data.get("response", "").strip()
+    else:
+        parts: List[str] = []
+        with SESSION.post(
+            OLLAMA_URL, json=payload, timeout=OLLAMA_TIMEOUT, stream=True
+        ) as resp:
+            resp.raise_for_status()
+            for line in resp.iter_lines():
+                if not line:
+                    continue
+                chunk = json_loads(line)
+                parts.append(chunk.get("response", ""))
+                if chunk.get("done") or early_stop("".join(parts)):
+                    break
+        text = "".join(parts).strip()
+
+    if key is not None:
+        with _CACHE_LOCK:
+            _CACHE[key] = text
+    return text
+
+
+def load_model(model: str) -> None:
+    """
+    Ask Ollama to load `model` without generating anything, so the first
+    question does not also pay for loading the weights.
+    """
+    resp = SESSION.post(
+        OLLAMA_URL,
+        json={"model": model, "keep_alive": OLLAMA_KEEP_ALIVE},
+        timeout=OLLAMA_TIMEOUT,
+    )
     resp.raise_for_status()
-    data = resp.json()
-    return data.get("response", "").strip()
 
 
-def ask_choice_ab(model: str, question_text: str) -> str:
+# Fixed instructions for the one-item-per-call questions, sent as the system
+# prompt so only the item itself changes from call to call
+SYSTEM_PROMPT_AB = textwrap.dedent(
     """
-    Ask the model to choose A or B.
-    Returns normalized "A" or "B".
+    You are taking a two-choice (A/B) personality test.
+
+    For each item you will be given two statements, labeled A and B.
+    Pick whichever statement fits you better OVER MOST OF YOUR LIFE.
+
+    Respond with ONLY a single letter:
+    - 'A' if statement A fits better
+    - 'B' if statement B fits better
+
+    Do NOT include any explanation or extra text.
+    """
+).strip()
+
+SYSTEM_PROMPT_LIKERT = textwrap.dedent(
     """
-    prompt = textwrap.dedent(
-        f"""
-        You are taking a two-choice (A/B) personality test.
+    You are taking a personality test that uses a 1–5 Likert scale.
 
-        For each item you will be given two statements, labeled A and B.
-        Pick whichever statement fits you better OVER MOST OF YOUR LIFE.
+    For each statement, answer with a number from 1 to 5:
+    1 = Almost Never
+    2 = Rarely
+    3 = Sometimes
+    4 = Frequently
+    5 = Almost Always
 
-        Respond with ONLY a single letter:
-        - 'A' if statement A fits better
-        - 'B' if statement B fits better
+    Respond with ONLY the digit 1, 2, 3, 4, or 5.
+    Do NOT include any explanation or extra text.
+    """
+).strip()
 
-        Do NOT include any explanation or extra text.
+# Per-call parts of the one-item prompts; everything else is in the system
+# prompt above
+_AB_PROMPT = "{q}\n\nYour answer (A or B only):"
+_LIKERT_PROMPT = "Statement:\n{q}\n\nYour answer (1–5 only):"
 
-        {question_text}
+# One paired item as shown to the model (alone or in a batch)
+_PAIRED_QUESTION = "Question {qid}:\n\nA) {a}\nB) {b}"
 
-        Your answer (A or B only):
-        """
-    ).strip()
 
-    raw = ollama_generate(model, prompt).upper()
-    match = re.search(r"\b([AB])\b", raw)
+def ask_choice_ab(model: str, question_text: str) -> str:
+    """
+    Ask the model to choose A or B.
+    Returns normalized "A" or "B".
+    """
+    raw = ollama_generate(
+        model,
+        _AB_PROMPT.format(q=question_text),
+        system=SYSTEM_PROMPT_AB,
+        options=_ANSWER_OPTIONS,
+        early_stop=lambda text: has_final_match(_AB_RE, text.upper()),
+    ).upper()
+    match = _AB_RE.search(raw)
     if match:
         return match.group(1)
 
@@ -118,29 +271,14 @@ def ask_likert_1_to_5(model: str, question_text: str) -> int:
     Ask the model to rate from 1 to 5.
     Returns an integer 1..5.
     """
-    prompt = textwrap.dedent(
-        f"""
-        You are taking a personality test that uses a 1–5 Likert scale.
-
-        For each statement, answer with a number from 1 to 5:
-        1 = Almost Never
-        2 = Rarely
-        3 = Sometimes
-        4 = Frequently
-        5 = Almost Always
-
-        Respond with ONLY the digit 1, 2, 3, 4, or 5.
-        Do NOT include any explanation or extra text.
-
-        Statement:
-        {question_text}
-
-        Your answer (1–5 only):
-        """
-    ).strip()
-
-    raw = ollama_generate(model, prompt)
-    match = re.search(r"\b([1-5])\b", raw)
+    raw = ollama_generate(
+        model,
+        _LIKERT_PROMPT.format(q=question_text),
+        system=SYSTEM_PROMPT_LIKERT,
+        options=_ANSWER_OPTIONS,
+        early_stop=lambda text: has_final_match(_LIKERT_RE, text),
+    )
+    match = _LIKERT_RE.search(raw)
     if match:
         return int(match.group(1))
 
@@ -151,43 +289,158 @@ def ask_likert_1_to_5(model: str, question_text: str) -> int:
     return 3
 
 
+# Batched prompts (see --batch-size): several items per call, answered as a
+# space-separated list in item order
+_LIKERT_BATCH_PROMPT = textwrap.dedent(
+    """
+    You are taking a personality test that uses a 1–5 Likert scale.
+
+    Rate EACH of the numbered statements below with a number from 1 to 5:
+    1 = Almost Never
+    2 = Rarely
+    3 = Sometimes
+    4 = Frequently
+    5 = Almost Always
+
+    Respond with ONLY {n} digits (1, 2, 3, 4 or 5) separated by spaces,
+    one per statement, in the order given.
+    Do NOT include any explanation or extra text.
+
+    Statements:
+    {items}
+
+    Your answer ({n} digits only):
+    """
+).strip()
+
+_AB_BATCH_PROMPT = textwrap.dedent(
+    """
+    You are taking a two-choice (A/B) personality test.
+
+    For each numbered question below you are given two statements, labeled
+    A and B. Pick whichever statement fits you better OVER MOST OF YOUR LIFE.
+
+    Respond with ONLY {n} letters (A or B) separated by spaces, one per
+    question, in the order given.
+    Do NOT include any explanation or extra text.
+
+    {items}
+
+    Your answer ({n} letters only):
+    """
+).strip()
+
+
+def _batch_ratings(raw: str) -> List[int]:
+    """
+    All 1..5 ratings in a batched Likert reply, in order. A line that starts
+    with an echoed item number followed by its one rating ("3) 4") loses the
+    number; bare digits ("4. 3. 5.", "3)") are all kept as ratings.
+    """
+    ratings: List[int] = []
+    for line in raw.splitlines():
+        rest = _ITEM_NUMBER_RE.sub("", line, count=1)
+        found = _LIKERT_RE.findall(rest)
+        if len(found) != 1:
+            found = _LIKERT_RE.findall(line)
+        ratings.extend(int(d) for d in found)
+    return ratings
+
+
+def ask_likert_batch(model: str, statements: List[str]) -> List[int]:
+    """
+    Ask the model to rate several statements from 1 to 5 in ONE call.
+    Returns one integer 1..5 per statement. If the reply doesn't hold exactly
+    one rating per statement, each statement is asked again on its own.
+    """
+    items = "\n".join(f"{n}) {stmt}" for n, stmt in enumerate(statements, start=1))
+    prompt = _LIKERT_BATCH_PROMPT.format(n=len(statements), items=items)
+
+    ratings = _batch_ratings(ollama_generate(model, prompt))
+    if len(ratings) == len(statements):
+        return ratings
+    return [ask_likert_1_to_5(model, stmt) for stmt in statements]
+
+
+def ask_choice_batch(model: str, question_texts: List[str]) -> List[str]:
+    """
+    Ask the model to choose A or B for several questions in ONE call.
+    Returns one "A" or "B" per question. If the reply doesn't hold exactly
+    one choice per question, each question is asked again on its own.
+    """
+    prompt = _AB_BATCH_PROMPT.format(
+        n=len(question_texts), items="\n\n".join(question_texts)
+    )
+
+    choices = _AB_RE.findall(ollama_generate(model, prompt).upper())
+    if len(choices) == len(question_texts):
+        return choices
+    return [ask_choice_ab(model, q) for q in question_texts]
+
+
 # ---------------------------------------------------------------------------
 # Single-run implementations (Likert + Paired)
 # ---------------------------------------------------------------------------
 
-def run_likert_once(model: str, json_path: pathlib.Path) -> Dict:
+def run_likert_once(
+    model: str,
+    data: Dict,
+    executor: Executor,
+    batch_size: int = 1,
+) -> Dict:
     """
-    Run the Likert-style Enneagram test ONCE and return a dict:
+    Run the Likert-style Enneagram test ONCE, asking the statements in
+    parallel on `executor` (up to `batch_size` statements of one type per
+    call), and return a dict:
 
     {
         "test_name": str,
         "scores_by_enneagram_type": {1: score, ..., 9: score},
-        "top_types": [(etype, score), ...],  # sorted desc
+        "top_types": [(etype, score), ...],  # top 3, sorted desc
     }
     """
-    data = json.loads(json_path.read_text(encoding="utf-8"))
     test_name: str = data["test_name"]
     types = data["types"]
 
-    # score per A–I and then aggregate into Enneagram 1–9
-    type_scores_A_I: Dict[str, int] = {k: 0 for k in types.keys()}
-    scores_by_enneagram: Dict[int, int] = {}
-
-    for type_key, tinfo in types.items():
-        stmts = tinfo["statements"]
-        for idx, stmt in enumerate(stmts, start=1):
-            question_text = f"[Type {type_key}] Item {idx}:\n{stmt}"
-            rating = ask_likert_1_to_5(model, question_text)
-            type_scores_A_I[type_key] += rating
-
-    # aggregate into Enneagram types
-    for type_key, score in type_scores_A_I.items():
-        e_type = types[type_key]["maps_to_enneagram_type"]
-        scores_by_enneagram[e_type] = scores_by_enneagram.get(e_type, 0) + score
-
-    top_types = sorted(
-        scores_by_enneagram.items(), key=lambda x: x[1], reverse=True
+    # Enneagram type (1–9) of every answer, alongside the rating it got
+    type_idx: List[int] = []
+    ratings: List[int] = []
+
+    if batch_size > 1:
+        # Only per-type totals are kept, so each batch stays within one type
+        chunks = [
+            (tinfo["maps_to_enneagram_type"], tinfo["statements"][k:k + batch_size])
+            for tinfo in types.values()
+            for k in range(0, len(tinfo["statements"]), batch_size)
+        ]
+        results = executor.map(lambda c: ask_likert_batch(model, c[1]), chunks)
+        for (e_type, _), batch in zip(chunks, results):
+            type_idx.extend([e_type] * len(batch))
+            ratings.extend(batch)
+    else:
+        tasks = [
+            (
+                tinfo["maps_to_enneagram_type"],
+                f"[Type {type_key}] Item {idx}:\n{stmt}",
+            )
+            for type_key, tinfo in types.items()
+            for idx, stmt in enumerate(tinfo["statements"], start=1)
+        ]
+        type_idx = [e_type for e_type, _ in tasks]
+        ratings = list(executor.map(lambda t: ask_likert_1_to_5(model, t[1]), tasks))
+
+    # Sum the ratings per Enneagram type in one pass, keeping the types in
+    # test-file order
+    sums = np.bincount(
+        np.asarray(type_idx, dtype=np.intp),
+        weights=np.asarray(ratings, dtype=np.float64),
+        minlength=10,
     )
+    e_types = dict.fromkeys(t["maps_to_enneagram_type"] for t in types.values())
+    scores_by_enneagram: Dict[int, int] = {t: int(sums[t]) for t in e_types}
+
+    # Only the three highest are reported
+    top_types = heapq.nlargest(3, scores_by_enneagram.items(), key=lambda x: x[1])
 
     return {
         "test_name": test_name,
@@ -196,49 +449,66 @@ def run_likert_once(model: str, json_path: pathlib.Path) -> Dict:
     }
 
 
-def run_paired_once(model: str, json_path: pathlib.Path) -> Dict:
+def prepare_paired_items(data: Dict) -> List[Tuple[str, int, int]]:
     """
-    Run the paired-question Enneagram test ONCE and return a dict:
+    Resolve every paired item once, returning (question_text, a_type, b_type)
+    tuples in item order, where a_type / b_type are the Enneagram types a
+    choice of A / B counts towards.
+    """
+    columns = data["columns"]
+    items = []
+    for item in data["items"]:
+        sides = {p["side"].upper(): p for p in item["pair"]}
+        a, b = sides["A"], sides["B"]
+        items.append((
+            _PAIRED_QUESTION.format(qid=item["id"], a=a["text"], b=b["text"]),
+            columns[a["column"]]["type"],
+            columns[b["column"]]["type"],
+        ))
+    return items
+
+
+def run_paired_once(
+    model: str,
+    data: Dict,
+    items: List[Tuple[str, int, int]],
+    executor: Executor,
+    batch_size: int = 1,
+) -> Dict:
+    """
+    Run the paired-question Enneagram test ONCE on the parsed test `data`
+    and its prepared `items` (see prepare_paired_items), asking the
+    questions in parallel on `executor` (up to `batch_size` questions per
+    call), and return a dict:
 
     {
         "test_name": str,
         "counts_by_enneagram_type": {1: count, ..., 9: count},
-        "top_types": [(etype, count), ...],  # sorted desc
+        "top_types": [(etype, count), ...],  # top 3, sorted desc
     }
     """
-    data = json.loads(json_path.read_text(encoding="utf-8"))
     test_name: str = data["test_name"]
-    columns = data["columns"]
-    items = data["items"]
 
     counts_by_ennea: Dict[int, int] = {}
 
-    for item in items:
-        qid = item["id"]
-        pair = item["pair"]
-
-        a = next(p for p in pair if p["side"].upper() == "A")
-        b = next(p for p in pair if p["side"].upper() == "B")
-
-        question_text = textwrap.dedent(
-            f"""
-            Question {qid}:
-
-            A) {a['text']}
-            B) {b['text']}
-            """
-        ).strip()
-
-        choice = ask_choice_ab(model, question_text)
-        chosen = a if choice == "A" else b
-        col = chosen["column"]
-        e_type = columns[col]["type"]
-
+    if batch_size > 1:
+        chunks = [
+            [t[0] for t in items[k:k + batch_size]]
+            for k in range(0, len(items), batch_size)
+        ]
+        choices = [
+            choice
+            for batch in executor.map(lambda c: ask_choice_batch(model, c), chunks)
+            for choice in batch
+        ]
+    else:
+        choices = executor.map(lambda t: ask_choice_ab(model, t[0]), items)
+    for (_, a_type, b_type), choice in zip(items, choices):
+        e_type = a_type if choice == "A" else b_type
         counts_by_ennea[e_type] = counts_by_ennea.get(e_type, 0) + 1
 
-    top_types = sorted(
-        counts_by_ennea.items(), key=lambda x: x[1], reverse=True
-    )
+    # Only the three highest are reported
+    top_types = heapq.nlargest(3, counts_by_ennea.items(), key=lambda x: x[1])
 
     return {
         "test_name": test_name,
@@ -267,15 +537,17 @@ def aggregate_enneagram_stats(runs: List[Dict[int, int]]) -> Dict[int, Dict]:
     }
     """
     all_types = sorted({t for r in runs for t in r.keys()})
+    # (runs, types) matrix; mean and population σ per column in one pass
+    arr = np.array([[r.get(t, 0) for t in all_types] for r in runs], dtype=np.float64)
+    means = arr.mean(axis=0)
+    stds = arr.std(axis=0)
+
     result: Dict[int, Dict] = {}
-    for t in all_types:
-        vals = [r.get(t, 0) for r in runs]
-        mean = sum(vals) / len(vals)
-        sd = stddev(vals)
+    for j, t in enumerate(all_types):
         result[t] = {
-            "values": vals,
-            "mean": mean,
-            "std": sd,
+            "values": [r.get(t, 0) for r in runs],
+            "mean": float(means[j]),
+            "std": float(stds[j]),
         }
     return result
 
@@ -284,10 +556,10 @@ def center_scores_for_run(scores: Dict[int, int]) -> Dict[str, int]:
     """
     Compute Head / Heart / Gut totals for a single run, given an {type: score} dict.
     """
-    center_totals = {}
-    for center, types in CENTER_MAP.items():
-        center_totals[center] = sum(scores.get(t, 0) for t in types)
-    return center_totals
+    return {
+        center: sum(scores.get(t, 0) for t in types)
+        for center, types in CENTER_INDEX
+    }
 
 
 def aggregate_centers(runs: List[Dict[int, int]]) -> Dict[str, Dict]:
@@ -299,24 +571,52 @@ def aggregate_centers(runs: List[Dict[int, int]]) -> Dict[str, Dict]:
         "gut": {...}
     }
     """
-    center_vals = {c: [] for c in CENTER_MAP.keys()}
-    for r in runs:
-        cs = center_scores_for_run(r)
-        for c in center_vals.keys():
-            center_vals[c].append(cs[c])
+    # (runs, 10) matrix indexed by type number (column 0 unused), then one
+    # (runs, centers) matrix of per-run center totals
+    arr = np.zeros((len(runs), 10), dtype=np.int64)
+    for i, r in enumerate(runs):
+        for t, v in r.items():
+            arr[i, t] = v
+    totals = np.stack(
+        [arr[:, list(types)].sum(axis=1) for _, types in CENTER_INDEX], axis=1
+    )
+    means = totals.mean(axis=0)
+    stds = totals.std(axis=0)
 
-    out = {}
-    for c, vals in center_vals.items():
-        mean = sum(vals) / len(vals)
-        sd = stddev(vals)
-        out[c] = {"values": vals, "mean": mean, "std": sd}
-    return out
+    return {
+        center: {
+            "values": totals[:, j].tolist(),
+            "mean": float(means[j]),
+            "std": float(stds[j]),
+        }
+        for j, (center, _) in enumerate(CENTER_INDEX)
+    }
 
 
 # ---------------------------------------------------------------------------
 # Markdown writer
 # ---------------------------------------------------------------------------
 
+def _render_table(
+    emit: Callable[[str], None],
+    label: str,
+    rows: Iterable[Tuple[str, Dict]],
+    n_runs: int,
+) -> None:
+    """
+    Emit one "label | Run 1..N | Mean | σ" table, one row per
+    (row_label, {"values": [...], "mean": float, "std": float}) in `rows`.
+    """
+    runs = " | ".join(f"Run {i}" for i in range(1, n_runs + 1))
+    emit(f"| {label} | {runs} | Mean | σ |")
+    emit("|------|" + "|".join(["------"] * (n_runs + 2)) + "|")
+    emit("\n".join(
+        f"| {row_label} | {' | '.join(f'{v:.0f}' for v in st['values'])} "
+        f"| {st['mean']:.2f} | {st['std']:.2f} |"
+        for row_label, st in rows
+    ))
+
+
 def write_multi_markdown(
     model: str,
     n_runs: int,
@@ -348,146 +648,120 @@ def write_multi_markdown(
             [f"Type {t} ({v})" for t, v in top_list[:3]]
         )
 
-    lines: List[str] = []
-    lines.append(f"# Enneagram LLM Multi-Run Report")
-    lines.append("")
-    lines.append(f"- **Model:** `{model}`")
-    lines.append(f"- **Date:** {today}")
-    lines.append(f"- **Runs per test:** {n_runs}")
-    lines.append("")
-    lines.append(
+    buf = io.StringIO()
+
+    def emit(line: str = "") -> None:
+        buf.write(line)
+        buf.write("\n")
+
+    emit(f"# Enneagram LLM Multi-Run Report")
+    emit()
+    emit(f"- **Model:** `{model}`")
+    emit(f"- **Date:** {today}")
+    emit(f"- **Runs per test:** {n_runs}")
+    emit()
+    emit(
         "This file aggregates multiple runs of two Enneagram tests "
         "for the same LLM model to analyze consistency, variability, and centers."
     )
-    lines.append("")
+    emit()
 
     # ------------------------------------------------------------------
     # 1. LIKERT TEST SUMMARY
     # ------------------------------------------------------------------
     likert_name = likert_runs[0]["test_name"] if likert_runs else "Likert Test"
-    lines.append("## 1. Likert Test – Multi-Run Summary")
-    lines.append("")
-    lines.append(f"**Test name:** {likert_name}")
-    lines.append("")
-    lines.append("### 1.1 Primary Type Tally per Run (Likert)")
-    lines.append("")
+    emit("## 1. Likert Test – Multi-Run Summary")
+    emit()
+    emit(f"**Test name:** {likert_name}")
+    emit()
+    emit("### 1.1 Primary Type Tally per Run (Likert)")
+    emit()
     for i, run in enumerate(likert_runs, start=1):
-        lines.append(
+        emit(
             f"- Run {i}: top types → {top3_str(run['top_types'])}"
         )
-    lines.append("")
+    emit()
 
     # Table of scores per type per run
-    lines.append("### 1.2 Scores by Enneagram Type Across Runs (Likert)")
-    lines.append("")
-    header = "| Type | " + " | ".join(
-        [f"Run {i}" for i in range(1, n_runs + 1)]
-    ) + " | Mean | σ |"
-    sep = "|------|" + "|".join(["------" for _ in range(n_runs + 2)]) + "|"
-    lines.append(header)
-    lines.append(sep)
-
-    for t in sorted(likert_stats.keys()):
-        vals = likert_stats[t]["values"]
-        mean = likert_stats[t]["mean"]
-        sd = likert_stats[t]["std"]
-        vals_str = " | ".join(f"{v:.0f}" for v in vals)
-        lines.append(
-            f"| {t} | {vals_str} | {mean:.2f} | {sd:.2f} |"
-        )
-    lines.append("")
+    emit("### 1.2 Scores by Enneagram Type Across Runs (Likert)")
+    emit()
+    _render_table(emit, "Type", sorted(likert_stats.items()), n_runs)
+    emit()
 
     # Centers
-    lines.append("### 1.3 Centers of Intelligence per Run (Likert)")
-    lines.append("")
-    lines.append(
+    emit("### 1.3 Centers of Intelligence per Run (Likert)")
+    emit()
+    emit(
         "Head = Types 5, 6, 7 &nbsp;&nbsp; "
         "Heart = Types 2, 3, 4 &nbsp;&nbsp; "
         "Gut = Types 8, 9, 1"
     )
-    lines.append("")
-    header = "| Center | " + " | ".join(
-        [f"Run {i}" for i in range(1, n_runs + 1)]
-    ) + " | Mean | σ |"
-    lines.append(header)
-    lines.append(sep)
-
-    for center in ["head", "heart", "gut"]:
-        cs = likert_center_stats[center]
-        vals_str = " | ".join(f"{v:.0f}" for v in cs["values"])
-        lines.append(
-            f"| {center.capitalize()} | {vals_str} | {cs['mean']:.2f} | {cs['std']:.2f} |"
-        )
-    lines.append("")
+    emit()
+    _render_table(
+        emit,
+        "Center",
+        ((c.capitalize(), cs) for c, cs in likert_center_stats.items()),
+        n_runs,
+    )
+    emit()
 
     # ------------------------------------------------------------------
     # 2. PAIRED TEST SUMMARY
     # ------------------------------------------------------------------
     paired_name = paired_runs[0]["test_name"] if paired_runs else "Paired Test"
-    lines.append("## 2. Paired A/B Test – Multi-Run Summary")
-    lines.append("")
-    lines.append(f"**Test name:** {paired_name}")
-    lines.append("")
-    lines.append("### 2.1 Primary Type Tally per Run (Paired)")
-    lines.append("")
+    emit("## 2. Paired A/B Test – Multi-Run Summary")
+    emit()
+    emit(f"**Test name:** {paired_name}")
+    emit()
+    emit("### 2.1 Primary Type Tally per Run (Paired)")
+    emit()
     for i, run in enumerate(paired_runs, start=1):
-        lines.append(
+        emit(
             f"- Run {i}: top types → {top3_str(run['top_types'])}"
         )
-    lines.append("")
+    emit()
 
     # Table of counts per type per run
-    lines.append("### 2.2 Selections by Enneagram Type Across Runs (Paired)")
-    lines.append("")
-    lines.append(header)
-    lines.append(sep)
-    for t in sorted(paired_stats.keys()):
-        vals = paired_stats[t]["values"]
-        mean = paired_stats[t]["mean"]
-        sd = paired_stats[t]["std"]
-        vals_str = " | ".join(f"{v:.0f}" for v in vals)
-        lines.append(
-            f"| {t} | {vals_str} | {mean:.2f} | {sd:.2f} |"
-        )
-    lines.append("")
+    emit("### 2.2 Selections by Enneagram Type Across Runs (Paired)")
+    emit()
+    _render_table(emit, "Type", sorted(paired_stats.items()), n_runs)
+    emit()
 
     # Centers
-    lines.append("### 2.3 Centers of Intelligence per Run (Paired)")
-    lines.append("")
-    lines.append(
+    emit("### 2.3 Centers of Intelligence per Run (Paired)")
+    emit()
+    emit(
         "Head = Types 5, 6, 7 &nbsp;&nbsp; "
         "Heart = Types 2, 3, 4 &nbsp;&nbsp; "
         "Gut = Types 8, 9, 1"
     )
-    lines.append("")
-    lines.append(header)
-    lines.append(sep)
-    for center in ["head", "heart", "gut"]:
-        cs = paired_center_stats[center]
-        vals_str = " | ".join(f"{v:.0f}" for v in cs["values"])
-        lines.append(
-            f"| {center.capitalize()} | {vals_str} | {cs['mean']:.2f} | {cs['std']:.2f} |"
-        )
-    lines.append("")
+    emit()
+    _render_table(
+        emit,
+        "Center",
+        ((c.capitalize(), cs) for c, cs in paired_center_stats.items()),
+        n_runs,
+    )
+    emit()
 
     # ------------------------------------------------------------------
     # 3. Quick Interpretation Hooks (for your analysis)
     # ------------------------------------------------------------------
-    lines.append("## 3. How to Use These Stats (Cheat Sheet)")
-    lines.append("")
-    lines.append("- **High consistency (low σ) for a type** → stable trait in the model.")
-    lines.append("- **High variability (high σ) for a type** → volatile or prompt-sensitive trait.")
-    lines.append("- **Dominant center across runs** → primary processing mode:")
-    lines.append("  - Head (5/6/7) → thinking, anticipating, planning")
-    lines.append("  - Heart (2/3/4) → relating, identity, image")
-    lines.append("  - Gut (8/9/1) → instinct, control, anger")
-    lines.append("")
-    lines.append(
+    emit("## 3. How to Use These Stats (Cheat Sheet)")
+    emit()
+    emit("- **High consistency (low σ) for a type** → stable trait in the model.")
+    emit("- **High variability (high σ) for a type** → volatile or prompt-sensitive trait.")
+    emit("- **Dominant center across runs** → primary processing mode:")
+    emit("  - Head (5/6/7) → thinking, anticipating, planning")
+    emit("  - Heart (2/3/4) → relating, identity, image")
+    emit("  - Gut (8/9/1) → instinct, control, anger")
+    emit()
+    emit(
         "You can now compare this file across models, or rerun the same model with "
         "different prompts or temperatures and see how the Enneagram profile shifts."
     )
 
-    out_path.write_text("\n".join(lines), encoding="utf-8")
+    out_path.write_text(buf.getvalue(), encoding="utf-8")
     return out_path
 
 
@@ -520,6 +794,42 @@ def main():
         default=3,
         help="How many times to run each test (default: 3).",
     )
+    parser.add_argument(
+        "--workers",
+        type=int,
+        default=4,
+        help="Questions sent to Ollama in parallel (default: 4). Set "
+             "OLLAMA_NUM_PARALLEL on the server to at least this value.",
+    )
+    parser.add_argument(
+        "--keep-alive",
+        default="30m",
+        help="How long Ollama keeps the model loaded between requests, "
+             "e.g. '10m', '1h' or '-1' for forever (default: 30m).",
+    )
+    parser.add_argument(
+        "--batch-size",
+        type=int,
+        default=1,
+        help="Ask up to this many questions per Ollama call (Likert: per "
+             "type). Default 1 asks one question per call, as the tests are "
+             "designed; larger batches are much faster but let earlier "
+             "answers in a batch influence later ones.",
+    )
+    parser.add_argument(
+        "--temperature",
+        type=float,
+        default=None,
+        help="Sampling temperature to request (default: the model's own).",
+    )
+    parser.add_argument(
+        "--cache",
+        action="store_true",
+        help="Reuse answers to identical prompts from <outdir>/.ollama_cache. "
+             "Repeated runs then replay the same answers, so σ no longer "
+             "measures the model's variability; mostly useful with "
+             "--temperature 0 or when re-rendering a report.",
+    )
     args = parser.parse_args()
 
     tests_dir = pathlib.Path(args.tests_dir)
@@ -534,20 +844,57 @@ def main():
     if not paired_path.exists():
         raise FileNotFoundError(f"Paired test file not found: {paired_path}")
 
+    # Parse both test files once; every run works from the same data
+    likert_data = json_loads(likert_path.read_bytes())
+    paired_data = json_loads(paired_path.read_bytes())
+    paired_items = prepare_paired_items(paired_data)
+
     likert_runs = []
     paired_runs = []
 
     print(f"Model: {args.model}")
     print(f"Runs per test: {args.runs}")
 
-    for i in range(1, args.runs + 1):
-        print(f"\n=== RUN {i} / {args.runs} – Likert test ===")
-        likert_res = run_likert_once(args.model, likert_path)
-        likert_runs.append(likert_res)
-
-        print(f"\n=== RUN {i} / {args.runs} – Paired test ===")
-        paired_res = run_paired_once(args.model, paired_path)
-        paired_runs.append(paired_res)
+    global _CACHE, OLLAMA_KEEP_ALIVE
+    OLLAMA_KEEP_ALIVE = args.keep_alive
+    if args.temperature is not None:
+        OLLAMA_OPTIONS["temperature"] = args.temperature
+    if args.cache:
+        _CACHE = shelve.open(str(outdir / ".ollama_cache"))
+        atexit.register(_CACHE.close)
+
+    print(f"Loading model {args.model} ...")
+    load_model(args.model)
+
+    # The runs are independent, so all of them are started at once. Each run
+    # only waits on its questions; those all go through the one question
+    # pool, which keeps the requests in flight at --workers.
+    with ThreadPoolExecutor(max_workers=args.workers) as executor, \
+            ThreadPoolExecutor(max_workers=2 * args.runs) as run_pool:
+        likert_futs = [
+            run_pool.submit(
+                run_likert_once, args.model, likert_data, executor, args.batch_size
+            )
+            for _ in range(args.runs)
+        ]
+        paired_futs = [
+            run_pool.submit(
+                run_paired_once,
+                args.model,
+                paired_data,
+                paired_items,
+                executor,
+                args.batch_size,
+            )
+            for _ in range(args.runs)
+        ]
+
+        for i, fut in enumerate(likert_futs, start=1):
+            likert_runs.append(fut.result())
+            print(f"=== RUN {i} / {args.runs} – Likert test done ===")
+        for i, fut in enumerate(paired_futs, start=1):
+            paired_runs.append(fut.result())
+            print(f"=== RUN {i} / {args.runs} – Paired test done ===")
 
     out_path = write_multi_markdown(
         args.model,
@@ -16,62 +16,228 @@ Key behavior change from v2-2:
 """
 
 import argparse
+import asyncio
 import datetime
+import hashlib
 import json
-import math
+import os
 import pathlib
+import re
 import textwrap
-from typing import Any, Dict, List, Tuple
+import threading
+import time
+from collections import Counter
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Callable, Dict, List, Optional, Pattern, Sequence, TextIO, Tuple
 
+import numpy as np
 import requests
+from requests.adapters import HTTPAdapter
+
+try:
+    # Optional: orjson decodes responses and test files noticeably faster
+    from orjson import loads as json_loads
+except ImportError:
+    from json import loads as json_loads
+
+
+def _concurrency_from_env(default: int = 4) -> int:
+    """
+    OLLAMA_NUM_PARALLEL as a question count, or `default` when it is unset,
+    empty, not a number or below 1 (Ollama reads 0 as "auto").
+    """
+    try:
+        value = int(os.environ.get("OLLAMA_NUM_PARALLEL", ""))
+    except ValueError:
+        return default
+    return value if value >= 1 else default
+
+
+# Default for --concurrency: one question per parallel slot on the server
+DEFAULT_CONCURRENCY = _concurrency_from_env()
+
+OLLAMA_URL = "http://localhost:11434/api/generate"
+
+# (connect, read) timeouts: fail fast when Ollama is not reachable, but let
+# a slow generation take as long as it needs
+OLLAMA_TIMEOUT = (10, 600)
+
+# Enneagram types of each center of intelligence, in report order
+_CENTER_TYPES: Dict[str, Tuple[int, int, int]] = {
+    "head": (5, 6, 7),
+    "heart": (2, 3, 4),
+    "gut": (8, 9, 1),
+}
+# The same, as index arrays into a score vector indexed by type (see
+# _score_vector)
+_CENTER_INDEX: Dict[str, np.ndarray] = {
+    center: np.array(types, dtype=np.intp) for center, types in _CENTER_TYPES.items()
+}
+
+# Generation cap for the one-question prompts, which only need a single
+# digit or letter (see call_ollama's `until`)
+_SHORT_ANSWER_TOKENS = 8
+
+# Opt-in response cache (see --cache): one JSON file per (model, prompt),
+# named by its hash. main() sets _CACHE_DIR when the cache is enabled.
+DEFAULT_CACHE_DIR = pathlib.Path.home() / ".cache" / "enneagram"
+_CACHE_DIR: Optional[pathlib.Path] = None
+
+# Shared keep-alive session, so every question reuses a pooled connection
+# instead of opening a new one. run_all() sizes the pool to the worker count.
+_SESSION = requests.Session()
+_SESSION.headers.update({"Connection": "keep-alive", "Accept-Encoding": "gzip, deflate"})
+
+# Transient failures (dropped connection, timeout, 5xx) are retried this many
+# times, waiting _RETRY_BACKOFF * 2**attempt seconds before each retry. The
+# request is a pure function of its payload, so reissuing it is safe.
+_RETRIES = 3
+_RETRY_BACKOFF = 1.0
 
 
 # -----------------------------------------------------------------------------
 # Ollama / LLM helpers
 # -----------------------------------------------------------------------------
 
-def call_ollama(model: str, prompt: str) -> str:
+def call_ollama(
+    model: str, prompt: str, until: Optional[Pattern[str]] = None
+) -> str:
     """
     Call the Ollama HTTP API with the given model and prompt.
-    Returns the 'response' string.
+    Returns the 'response' string. With the response cache enabled, a prompt
+    already answered by this model is served from disk instead. Transient
+    HTTP failures are retried with exponential backoff (see _RETRIES).
+
+    With `until`, the reply is streamed, capped at _SHORT_ANSWER_TOKENS, and
+    the request is dropped as soon as the (upper-cased) text so far contains
+    a match, so the model stops generating; only that much text is returned.
+    """
+    cache_path = None
+    if _CACHE_DIR is not None:
+        key = hashlib.sha256(f"{model}\x00{prompt}".encode("utf-8")).hexdigest()
+        cache_path = _CACHE_DIR / f"{key}.json"
+        if cache_path.exists():
+            return json_loads(cache_path.read_bytes())["response"]
+
+    for attempt in range(_RETRIES + 1):
+        try:
+            text = _generate(model, prompt, until)
+            break
+        except (
+            requests.ConnectionError,
+            requests.Timeout,
+            requests.HTTPError,
+            # A connection dropped partway through a streamed reply
+            requests.exceptions.ChunkedEncodingError,
+        ) as e:
+            status = getattr(e.response, "status_code", None)
+            if attempt == _RETRIES or (status is not None and status < 500):
+                raise
+            time.sleep(_RETRY_BACKOFF * 2 ** attempt)
+
+    if cache_path is not None:
+        # Write under a unique temp name, then rename, so concurrent workers
+        # (or invocations) never see a half-written entry
+        tmp = cache_path.with_name(
+            f"{cache_path.name}.{os.getpid()}.{threading.get_ident()}.tmp"
+        )
+        tmp.write_text(json.dumps({"response": text}), encoding="utf-8")
+        os.replace(tmp, cache_path)
+    return text
+
+
+def _generate(model: str, prompt: str, until: Optional[Pattern[str]]) -> str:
+    """One /api/generate request for call_ollama (no caching, no retries)."""
+    if until is None:
+        payload = {"model": model, "prompt": prompt, "stream": False}
+        resp = _SESSION.post(OLLAMA_URL, json=payload, timeout=OLLAMA_TIMEOUT)
+        resp.raise_for_status()
+        data = json_loads(resp.content)
+        return data.get("response", "").strip()
+
+    payload = {
+        "model": model,
+        "prompt": prompt,
+        "stream": True,
+        "options": {"num_predict": _SHORT_ANSWER_TOKENS},
+    }
+    parts: List[str] = []
+    with _SESSION.post(
+        OLLAMA_URL, json=payload, timeout=OLLAMA_TIMEOUT, stream=True
+    ) as resp:
+        resp.raise_for_status()
+        for line in resp.iter_lines():
+            if not line:
+                continue
+            chunk = json_loads(line)
+            parts.append(chunk.get("response", ""))
+            if chunk.get("done") or until.search(parts[-1].upper()):
+                break
+    return "".join(parts).strip()
+
+
+# First valid answer character anywhere in a reply (A/B after upper-casing)
+_FIRST_DIGIT = re.compile(r"[1-5]")
+_FIRST_AB = re.compile(r"[AB]")
+
+# One-question prompts, dedented once at import. (Dedenting the f-string per
+# call was a no-op whenever the question text spanned several lines, as the
+# paired questions do, which left the instructions indented in the prompt.)
+# Everything before {q} is identical across calls, so Ollama reuses the
+# already-evaluated prefix; keep per-question text out of the instructions.
+_LIKERT_PROMPT = textwrap.dedent(
     """
-    url = "http://localhost:11434/api/generate"
-    payload = {"model": model, "prompt": prompt, "stream": False}
-    resp = requests.post(url, json=payload, timeout=600)
-    resp.raise_for_status()
-    data = resp.json()
-    return data.get("response", "").strip()
+    You are taking a personality test that uses a 1–5 Likert scale.
 
+    For each statement, answer with a number from 1 to 5:
+    1 = Almost Never
+    2 = Rarely
+    3 = Sometimes
+    4 = Often
+    5 = Almost Always
 
-def ask_likert_1_to_5(model: str, question_text: str) -> Tuple[int, str]:
+    Respond with ONLY a single digit from 1 to 5.
+    Do not explain your choice. Do not add any other text.
+
+    Statement:
+    {q}
+
+    Your answer (just 1–5):
     """
-    Ask the model to rate from 1 to 5.
-    Returns (rating, raw_response).
+)
+
+_AB_PROMPT = textwrap.dedent(
     """
-    prompt = textwrap.dedent(
-        f"""
-        You are taking a personality test that uses a 1–5 Likert scale.
+    You are taking a personality test.
 
-        For each statement, answer with a number from 1 to 5:
-        1 = Almost Never
-        2 = Rarely
-        3 = Sometimes
-        4 = Often
-        5 = Almost Always
+    For each question, you must choose either option A or option B.
 
-        Respond with ONLY a single digit from 1 to 5.
-        Do not explain your choice. Do not add any other text.
+    Rules:
+    - Respond with ONLY the single letter 'A' or 'B'.
+    - Do not explain your answer.
+    - Do not add punctuation or repeat the text.
 
-        Statement:
-        {question_text}
+    Question:
+    {q}
 
-        Your answer (just 1–5):
-        """
-    )
-    raw = call_ollama(model, prompt)
-    for ch in raw:
-        if ch in "12345":
-            return int(ch), raw
+    Your answer (just A or B):
+    """
+)
+
+# One paired item as shown to the model (alone or in a batch)
+_PAIRED_QUESTION = "\nQuestion {qid}:\n\nA) {a}\nB) {b}\n"
+
+
+def ask_likert_1_to_5(model: str, question_text: str) -> Tuple[int, str]:
+    """
+    Ask the model to rate from 1 to 5.
+    Returns (rating, raw_response).
+    """
+    prompt = _LIKERT_PROMPT.format(q=question_text)
+    raw = call_ollama(model, prompt, until=_FIRST_DIGIT)
+    match = _FIRST_DIGIT.search(raw)
+    if match:
+        return int(match.group()), raw
     # Fallback if the model does something weird
     return 3, raw
 
@@ -81,36 +247,186 @@ def ask_forced_choice_ab(model: str, question_text: str) -> Tuple[str, str]:
     Ask the model to choose A or B.
     Returns (choice, raw_response).
     """
-    prompt = textwrap.dedent(
-        f"""
-        You are taking a personality test.
+    prompt = _AB_PROMPT.format(q=question_text)
+    raw = call_ollama(model, prompt, until=_FIRST_AB)
+    match = _FIRST_AB.search(raw.upper())
+    if match:
+        return match.group(), raw
+    # Fallback
+    return "A", raw
+
+
+# Batched prompts (see --batch-size): several items per call, answered one
+# per line in item order. The item count only appears after the items, so
+# every batch shares the same instruction prefix.
+_LIKERT_BATCH_PROMPT = textwrap.dedent(
+    """
+    You are taking a personality test that uses a 1–5 Likert scale.
+
+    Rate EACH of the statements below with a number from 1 to 5:
+    1 = Almost Never
+    2 = Rarely
+    3 = Sometimes
+    4 = Often
+    5 = Almost Always
+
+    Answer each item with one digit 1–5, one per line, in order.
+    Do not explain your choices. Do not add any other text.
+
+    Statements:
+    {items}
+
+    Your answers ({n} lines, one digit each):
+    """
+).strip()
+
+_AB_BATCH_PROMPT = textwrap.dedent(
+    """
+    You are taking a personality test.
+
+    For EACH of the questions below, you must choose either option A or
+    option B.
+
+    Rules:
+    - Answer each question with the single letter 'A' or 'B', one per line,
+      in order.
+    - Do not explain your answers.
+    - Do not add punctuation or repeat the text.
+
+    {items}
 
-        For each question, you must choose either option A or option B.
+    Your answers ({n} lines, A or B each):
+    """
+).strip()
 
-        Rules:
-        - Respond with ONLY the single letter 'A' or 'B'.
-        - Do not explain your answer.
-        - Do not add punctuation or repeat the text.
+# Item numbering a model may echo in front of a batched answer ("3.", "Q3:",
+# "Question 3)", or the prompt's own "[Item 12]" / "Item 12:" labels)
+_BATCH_LINE_PREFIX = re.compile(
+    r"^\s*(?:\[\s*item\s*\d+\s*\]\s*[).:\-]?"
+    r"|(?:(?:q(?:uestion)?|item)\s*)?\d+\s*[).:\-]"
+    r"|(?:q(?:uestion)?|item)\s*\d+)\s*",
+    re.I,
+)
 
-        Question:
-        {question_text}
 
-        Your answer (just A or B):
-        """
+def _split_batch_answers(
+    raw: str, n: int, answer_re: Pattern[str], unique: bool = False
+) -> Optional[List[str]]:
+    """
+    Split a batched reply into its `n` answer lines and take the first
+    `answer_re` match on each (upper-cased), after stripping any echoed item
+    number. With `unique`, a line must hold exactly one match. Returns None
+    when the reply does not have exactly one usable answer per item.
+    """
+    lines = [ln for ln in raw.splitlines() if ln.strip()]
+    if len(lines) != n:
+        return None
+    answers = []
+    for ln in lines:
+        found = answer_re.findall(_BATCH_LINE_PREFIX.sub("", ln, count=1).upper())
+        if not found or (unique and len(found) != 1):
+            return None
+        answers.append(found[0])
+    return answers
+
+
+def ask_likert_batch(
+    model: str, question_texts: Sequence[str]
+) -> Optional[List[Tuple[int, str]]]:
+    """
+    Ask the model to rate several statements in ONE call.
+    Returns one (rating, raw_response) per statement, where raw_response is
+    the whole batched reply, or None if the reply could not be split.
+    """
+    prompt = _LIKERT_BATCH_PROMPT.format(
+        n=len(question_texts), items="\n".join(question_texts)
     )
     raw = call_ollama(model, prompt)
-    raw_up = raw.strip().upper()
-    for ch in raw_up:
-        if ch in ("A", "B"):
-            return ch, raw
-    # Fallback
-    return "A", raw
+    # A line with a stray extra digit is ambiguous, so it is re-asked instead
+    digits = _split_batch_answers(raw, len(question_texts), _FIRST_DIGIT, unique=True)
+    if digits is None:
+        return None
+    return [(int(d), raw) for d in digits]
+
+
+def ask_forced_choice_batch(
+    model: str, question_texts: Sequence[str]
+) -> Optional[List[Tuple[str, str]]]:
+    """
+    Ask the model to choose A or B for several questions in ONE call.
+    Returns one (choice, raw_response) per question, or None if the reply
+    could not be split.
+    """
+    prompt = _AB_BATCH_PROMPT.format(
+        n=len(question_texts),
+        items="\n\n".join(q.strip() for q in question_texts),
+    )
+    raw = call_ollama(model, prompt)
+    letters = _split_batch_answers(raw, len(question_texts), _FIRST_AB)
+    if letters is None:
+        return None
+    return [(c, raw) for c in letters]
+
+
+async def ask_all(
+    ask_one: Callable[[str, str], Tuple[Any, str]],
+    ask_batch: Callable[[str, Sequence[str]], Optional[List[Tuple[Any, str]]]],
+    model: str,
+    question_texts: Sequence[str],
+    batch_size: int,
+) -> List[Tuple[Any, str]]:
+    """
+    Answer every question, concurrently, either one per call or in batches
+    of `batch_size`. A batch whose reply cannot be split into one answer per
+    question is re-asked one question at a time.
+    """
+    if batch_size <= 1:
+        return list(
+            await asyncio.gather(
+                *(asyncio.to_thread(ask_one, model, q) for q in question_texts)
+            )
+        )
+
+    chunks = [
+        question_texts[k:k + batch_size]
+        for k in range(0, len(question_texts), batch_size)
+    ]
+
+    async def ask_chunk(chunk: Sequence[str]) -> List[Tuple[Any, str]]:
+        if len(chunk) == 1:
+            return [await asyncio.to_thread(ask_one, model, chunk[0])]
+        answers = await asyncio.to_thread(ask_batch, model, chunk)
+        if answers is None:
+            answers = await asyncio.gather(
+                *(asyncio.to_thread(ask_one, model, q) for q in chunk)
+            )
+        return list(answers)
+
+    results = await asyncio.gather(*(ask_chunk(c) for c in chunks))
+    return [answer for chunk_answers in results for answer in chunk_answers]
+
+
+def _quiet(*args, **kwargs) -> None:
+    """
+    Stand-in for print() when per-answer output is turned off.
+    """
 
 
 # -----------------------------------------------------------------------------
 # Scoring helpers (centers, wings, tritype)
 # -----------------------------------------------------------------------------
 
+def _score_vector(enneagram_scores: Dict[int, int]) -> np.ndarray:
+    """
+    Scores as a length-10 int64 array indexed by Enneagram type (index 0
+    unused); types without a score are 0.
+    """
+    vec = np.zeros(10, dtype=np.int64)
+    if enneagram_scores:
+        vec[list(enneagram_scores.keys())] = list(enneagram_scores.values())
+    return vec
+
+
 def compute_center_scores(enneagram_scores: Dict[int, int]) -> Dict[str, int]:
     """
     Compute center scores from a dict {enneagram_type: score}.
@@ -118,10 +434,12 @@ def compute_center_scores(enneagram_scores: Dict[int, int]) -> Dict[str, int]:
     Heart = 2, 3, 4
     Gut = 8, 9, 1
     """
-    head = sum(enneagram_scores.get(t, 0) for t in (5, 6, 7))
-    heart = sum(enneagram_scores.get(t, 0) for t in (2, 3, 4))
-    gut = sum(enneagram_scores.get(t, 0) for t in (8, 9, 1))
-    return {"head": head, "heart": heart, "gut": gut}
+    return _center_scores_from_vector(_score_vector(enneagram_scores))
+
+
+def _center_scores_from_vector(vec: np.ndarray) -> Dict[str, int]:
+    """Center totals from a score vector built by _score_vector."""
+    return {center: int(vec[idx].sum()) for center, idx in _CENTER_INDEX.items()}
 
 
 def derive_profile_from_scores(enneagram_scores: Dict[int, int]) -> Dict[str, Any]:
@@ -140,27 +458,26 @@ def derive_profile_from_scores(enneagram_scores: Dict[int, int]) -> Dict[str, An
             "tritype": (None, None, None),
         }
 
-    # Core type
+    # Core type. Ties go to the type scored first, so this stays a max over
+    # the dict rather than an argmax over the type-ordered vector.
     core_type = max(enneagram_scores.items(), key=lambda kv: kv[1])[0]
 
+    vec = _score_vector(enneagram_scores)
+
     # Wing (adjacent types)
     left = 9 if core_type == 1 else core_type - 1
     right = 1 if core_type == 9 else core_type + 1
-    left_score = enneagram_scores.get(left, 0)
-    right_score = enneagram_scores.get(right, 0)
-    primary_wing = left if left_score >= right_score else right
+    primary_wing = left if vec[left] >= vec[right] else right
 
     # Centers
-    center_scores = compute_center_scores(enneagram_scores)
-
-    # Tritype: best from Gut / Heart / Head
-    gut_candidates = [(t, enneagram_scores.get(t, 0)) for t in (8, 9, 1)]
-    heart_candidates = [(t, enneagram_scores.get(t, 0)) for t in (2, 3, 4)]
-    head_candidates = [(t, enneagram_scores.get(t, 0)) for t in (5, 6, 7)]
+    center_scores = _center_scores_from_vector(vec)
 
-    gut_type = max(gut_candidates, key=lambda kv: kv[1])[0]
-    heart_type = max(heart_candidates, key=lambda kv: kv[1])[0]
-    head_type = max(head_candidates, key=lambda kv: kv[1])[0]
+    # Tritype: best from Gut / Heart / Head (argmax keeps the first of a tie,
+    # in _CENTER_TYPES order)
+    gut_type, heart_type, head_type = (
+        int(_CENTER_INDEX[c][vec[_CENTER_INDEX[c]].argmax()])
+        for c in ("gut", "heart", "head")
+    )
 
     return {
         "core_type": core_type,
@@ -174,13 +491,52 @@ def derive_profile_from_scores(enneagram_scores: Dict[int, int]) -> Dict[str, An
 # Likert test (single run)
 # -----------------------------------------------------------------------------
 
-def run_likert_once(
+def build_likert_prompts(
+    data: Dict[str, Any]
+) -> Tuple[List[str], List[Dict[str, Any]]]:
+    """
+    Render every Likert question of the test up front, in asking order.
+    Returns (question_texts, meta), where meta[i] describes question i:
+    global_index, type_key, enneagram_type, statement_index_within_type and
+    statement.
+    """
+    types = data["types"]
+    question_texts: List[str] = []
+    meta: List[Dict[str, Any]] = []
+    for type_key in sorted(types.keys()):
+        tinfo = types[type_key]
+        e_type = tinfo.get("maps_to_enneagram_type")
+        statements = tinfo.get("statements", [])
+        for idx, stmt in enumerate(statements, start=1):
+            global_index = len(meta) + 1
+            # IMPORTANT: no type or Enneagram labels in the prompt.
+            question_texts.append(f"[Item {global_index}] {stmt}")
+            meta.append(
+                {
+                    "global_index": global_index,
+                    "type_key": type_key,
+                    "enneagram_type": e_type,
+                    "statement_index_within_type": idx,
+                    "statement": stmt,
+                }
+            )
+    return question_texts, meta
+
+
+async def run_likert_once(
     model: str,
-    json_path: pathlib.Path,
+    data: Dict[str, Any],
+    prompts: Tuple[List[str], List[Dict[str, Any]]],
     run_index: int,
+    batch_size: int = 1,
+    verbose: bool = False,
 ) -> Dict[str, Any]:
     """
-    Run the Likert-style Enneagram test ONCE.
+    Run the Likert-style Enneagram test ONCE on the parsed test `data`, asking
+    the (question_texts, meta) `prompts` from build_likert_prompts(data).
+    All statements are asked concurrently on the event loop's default
+    executor, which bounds the number of requests in flight, `batch_size`
+    statements per call; with verbose, every rating is printed as well.
     JSON structure (enneagram_likert.json):
 
     {
@@ -196,51 +552,35 @@ def run_likert_once(
       }
     }
     """
-    data = json.loads(json_path.read_text(encoding="utf-8"))
     test_name: str = data["test_name"]
     instructions: str = data.get("instructions", "")
     types = data["types"]
 
     type_key_scores: Dict[str, int] = {k: 0 for k in types.keys()}
-    enneagram_scores: Dict[int, int] = {}
+    enneagram_scores: Counter[int] = Counter()
     transcript: List[Dict[str, Any]] = []
 
-    global_index = 1
-
     print(f"\n[Likert] Run {run_index}: {test_name}")
 
-    for type_key in sorted(types.keys()):
-        tinfo = types[type_key]
-        e_type = tinfo.get("maps_to_enneagram_type")
-        statements = tinfo.get("statements", [])
-
-        for idx, stmt in enumerate(statements, start=1):
-            # IMPORTANT: no type or Enneagram labels in the prompt.
-            q_text = f"[Item {global_index}] {stmt}"
-
-            rating, raw = ask_likert_1_to_5(model, q_text)
+    log = print if verbose else _quiet
+    question_texts, meta = prompts
+    answers = await ask_all(
+        ask_likert_1_to_5, ask_likert_batch, model, question_texts, batch_size
+    )
 
-            type_key_scores[type_key] += rating
-            if e_type is not None:
-                enneagram_scores[e_type] = enneagram_scores.get(e_type, 0) + rating
+    for m, (rating, raw) in zip(meta, answers):
+        type_key = m["type_key"]
+        e_type = m["enneagram_type"]
+        type_key_scores[type_key] += rating
+        if e_type is not None:
+            enneagram_scores[e_type] += rating
 
-            transcript.append(
-                {
-                    "global_index": global_index,
-                    "type_key": type_key,
-                    "enneagram_type": e_type,
-                    "statement_index_within_type": idx,
-                    "statement": stmt,
-                    "parsed_rating": rating,
-                    "raw_response": raw,
-                }
-            )
+        transcript.append({**m, "parsed_rating": rating, "raw_response": raw})
 
-            print(
-                f"[Likert run {run_index}] Q{global_index:03d} "
-                f"(Type {type_key} / {e_type}) → rating={rating}"
-            )
-            global_index += 1
+        log(
+            f"[Likert run {run_index}] Q{m['global_index']:03d} "
+            f"(Type {type_key} / {e_type}) → rating={rating}"
+        )
 
     profile = derive_profile_from_scores(enneagram_scores)
     center_scores = profile["center_scores"]
@@ -261,13 +601,66 @@ def run_likert_once(
 # Paired test (single run)
 # -----------------------------------------------------------------------------
 
-def run_paired_once(
+def prepare_paired_items(
+    data: Dict[str, Any]
+) -> List[Tuple[Dict[str, Any], Dict[str, Any], Dict[str, Any]]]:
+    """
+    Resolve each paired item's A and B sides once, so the runs don't rebuild
+    the side lookup per question. Returns a list of (item, side_a, side_b)
+    in file order. Items without exactly two entries are skipped; raises
+    ValueError if a two-entry item is not one A side and one B side.
+    """
+    prepared: List[Tuple[Dict[str, Any], Dict[str, Any], Dict[str, Any]]] = []
+    for item in data["items"]:
+        if len(item["pair"]) != 2:
+            # Defensive, but your data always has 2
+            continue
+
+        # Normalize so we know which is A and which is B
+        # (in case order is not guaranteed)
+        sides = {p["side"]: p for p in item["pair"]}
+        if "A" not in sides or "B" not in sides:
+            raise ValueError(
+                f"Paired item {item.get('id')!r} needs both an A and a B side, "
+                f"got {sorted(sides)}"
+            )
+        prepared.append((item, sides["A"], sides["B"]))
+    return prepared
+
+
+def build_paired_prompts(
+    paired_items: List[Tuple[Dict[str, Any], Dict[str, Any], Dict[str, Any]]]
+) -> Tuple[List[str], List[Dict[str, Any]]]:
+    """
+    Render every paired question of the test up front, in asking order, from
+    the output of prepare_paired_items(). Returns (question_texts, meta),
+    where meta[i] holds question i's "id" and its "a" and "b" sides.
+    """
+    question_texts: List[str] = []
+    meta: List[Dict[str, Any]] = []
+    for item, a, b in paired_items:
+        qid = item["id"]
+        question_texts.append(
+            _PAIRED_QUESTION.format(qid=qid, a=a["text"], b=b["text"])
+        )
+        meta.append({"id": qid, "a": a, "b": b})
+    return question_texts, meta
+
+
+async def run_paired_once(
     model: str,
-    json_path: pathlib.Path,
+    data: Dict[str, Any],
+    prompts: Tuple[List[str], List[Dict[str, Any]]],
     run_index: int,
+    batch_size: int = 1,
+    verbose: bool = False,
 ) -> Dict[str, Any]:
     """
-    Run the paired Enneagram test ONCE.
+    Run the paired Enneagram test ONCE on the parsed test `data`, asking
+    the (question_texts, meta) `prompts` from build_paired_prompts(). All
+    questions are asked concurrently on the event loop's default executor,
+    `batch_size` questions per call; with verbose, every choice is printed
+    as well.
 
     JSON structure (enneagram_test.json):
 
@@ -289,41 +682,23 @@ def run_paired_once(
       ]
     }
     """
-    data = json.loads(json_path.read_text(encoding="utf-8"))
     test_name: str = data["test_name"]
     columns = data["columns"]
-    items = data["items"]
 
-    counts_by_type: Dict[int, int] = {}
-    counts_by_column: Dict[str, int] = {c: 0 for c in columns.keys()}
+    counts_by_type: Counter[int] = Counter()
+    counts_by_column: Counter[str] = Counter(dict.fromkeys(columns, 0))
     transcript: List[Dict[str, Any]] = []
 
     print(f"\n[Paired] Run {run_index}: {test_name}")
 
-    for item in items:
-        qid = item["id"]
-        pair_list = item["pair"]
-        if len(pair_list) != 2:
-            # Defensive, but your data always has 2
-            continue
-
-        # Normalize so we know which is A and which is B
-        # (in case order is not guaranteed)
-        sides = {p["side"]: p for p in pair_list}
-        a = sides["A"]
-        b = sides["B"]
-
-        question_text = textwrap.dedent(
-            f"""
-            Question {qid}:
-
-            A) {a['text']}
-            B) {b['text']}
-            """
-        )
-
-        choice, raw = ask_forced_choice_ab(model, question_text)
+    log = print if verbose else _quiet
+    question_texts, meta = prompts
+    answers = await ask_all(
+        ask_forced_choice_ab, ask_forced_choice_batch, model, question_texts, batch_size
+    )
 
+    for m, (choice, raw) in zip(meta, answers):
+        qid, a, b = m["id"], m["a"], m["b"]
         if choice == "A":
             chosen = a
         else:
@@ -333,8 +708,8 @@ def run_paired_once(
         col_info = columns[chosen_column]
         chosen_type = col_info["type"]
 
-        counts_by_column[chosen_column] = counts_by_column.get(chosen_column, 0) + 1
-        counts_by_type[chosen_type] = counts_by_type.get(chosen_type, 0) + 1
+        counts_by_column[chosen_column] += 1
+        counts_by_type[chosen_type] += 1
 
         transcript.append(
             {
@@ -351,7 +726,7 @@ def run_paired_once(
             }
         )
 
-        print(
+        log(
             f"[Paired run {run_index}] Q{qid:02d} → choice={choice}, "
             f"column={chosen_column}, type={chosen_type}"
         )
@@ -371,16 +746,61 @@ def run_paired_once(
     }
 
 
+async def run_all(
+    model: str,
+    likert_data: Dict[str, Any],
+    paired_data: Dict[str, Any],
+    paired_items: List[Tuple[Dict[str, Any], Dict[str, Any], Dict[str, Any]]],
+    runs_per_test: int,
+    concurrency: int,
+    batch_size: int = 1,
+    verbose: bool = False,
+) -> Tuple[List[Dict[str, Any]], List[Dict[str, Any]]]:
+    """
+    Run each test `runs_per_test` times and return (likert_runs, paired_runs).
+    The runs are independent, so all of them are started together; their
+    questions share one pool of `concurrency` worker threads, which caps the
+    number of requests in flight. Each test's prompts are rendered once
+    here and shared by all of its runs.
+    """
+    asyncio.get_running_loop().set_default_executor(
+        ThreadPoolExecutor(max_workers=concurrency)
+    )
+    # One pooled connection per worker thread
+    _SESSION.mount(
+        "http://", HTTPAdapter(pool_connections=1, pool_maxsize=concurrency, max_retries=0)
+    )
+
+    likert_prompts = build_likert_prompts(likert_data)
+    paired_prompts = build_paired_prompts(paired_items)
+
+    run_numbers = range(1, runs_per_test + 1)
+    results = await asyncio.gather(
+        *(
+            run_likert_once(model, likert_data, likert_prompts, i, batch_size, verbose)
+            for i in run_numbers
+        ),
+        *(
+            run_paired_once(model, paired_data, paired_prompts, i, batch_size, verbose)
+            for i in run_numbers
+        ),
+    )
+    return list(results[:runs_per_test]), list(results[runs_per_test:])
+
+
 # -----------------------------------------------------------------------------
 # Aggregation helpers
 # -----------------------------------------------------------------------------
 
-def mean_std(values: List[float]) -> Tuple[float, float]:
-    if not values:
-        return 0.0, 0.0
-    mean = sum(values) / len(values)
-    var = sum((v - mean) ** 2 for v in values) / len(values)
-    return mean, math.sqrt(var)
+def column_mean_std(mat: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Population mean and σ of each column of a (runs, k) matrix, as two
+    length-k arrays (zeros when there are no runs).
+    """
+    if mat.shape[0] == 0:
+        zeros = np.zeros(mat.shape[1])
+        return zeros, zeros
+    return mat.mean(axis=0), mat.std(axis=0)
 
 
 def aggregate_likert_runs(likert_runs: List[Dict[str, Any]]) -> Dict[str, Any]:
@@ -394,27 +814,23 @@ def aggregate_likert_runs(likert_runs: List[Dict[str, Any]]) -> Dict[str, Any]:
     per_run_scores: List[Dict[int, int]] = [r["enneagram_scores"] for r in likert_runs]
     all_types = sorted({t for scores in per_run_scores for t in scores.keys()})
 
-    per_type_values: Dict[int, List[int]] = {t: [] for t in all_types}
-    for scores in per_run_scores:
-        for t in all_types:
-            per_type_values[t].append(scores.get(t, 0))
-
-    mean_scores: Dict[int, float] = {}
-    sigma_scores: Dict[int, float] = {}
-    for t, vals in per_type_values.items():
-        m, s = mean_std(vals)
-        mean_scores[t] = m
-        sigma_scores[t] = s
-
-    per_center_vals: Dict[str, List[int]] = {"head": [], "heart": [], "gut": []}
-    for r in likert_runs:
-        centers = r["center_scores"]
-        for c in per_center_vals.keys():
-            per_center_vals[c].append(centers.get(c, 0))
-
-    avg_center_scores: Dict[str, float] = {}
-    for c, vals in per_center_vals.items():
-        avg_center_scores[c] = sum(vals) / len(vals)
+    # (runs, types) and (runs, centers) matrices; one reduction per axis
+    arr = np.array(
+        [[scores.get(t, 0) for t in all_types] for scores in per_run_scores],
+        dtype=np.int64,
+    ).reshape(len(per_run_scores), len(all_types))
+    means, sigmas = column_mean_std(arr)
+    mean_scores: Dict[int, float] = dict(zip(all_types, means.tolist()))
+    sigma_scores: Dict[int, float] = dict(zip(all_types, sigmas.tolist()))
+
+    centers = tuple(_CENTER_TYPES)
+    center_arr = np.array(
+        [[r["center_scores"].get(c, 0) for c in centers] for r in likert_runs],
+        dtype=np.int64,
+    )
+    avg_center_scores: Dict[str, float] = dict(
+        zip(centers, center_arr.mean(axis=0).tolist())
+    )
 
     return {
         "mean_scores": mean_scores,
@@ -427,10 +843,8 @@ def aggregate_paired_runs(paired_runs: List[Dict[str, Any]]) -> Dict[str, Any]:
     """
     Aggregate type and column counts, and center stats, across paired runs.
     """
-    from collections import Counter
-
-    combined_type_counts = Counter()
-    combined_column_counts = Counter()
+    combined_type_counts: Counter[int] = Counter()
+    combined_column_counts: Counter[str] = Counter()
     per_run_type_counts: List[Dict[int, int]] = []
     per_run_center_scores: List[Dict[str, int]] = []
 
@@ -442,27 +856,31 @@ def aggregate_paired_runs(paired_runs: List[Dict[str, Any]]) -> Dict[str, Any]:
         per_run_center_scores.append(r["center_scores"])
 
     all_types = sorted(combined_type_counts.keys())
-    per_type_values: Dict[int, List[int]] = {t: [] for t in all_types}
-    for tc in per_run_type_counts:
-        for t in all_types:
-            per_type_values[t].append(tc.get(t, 0))
-
-    mean_type_counts: Dict[int, float] = {}
-    sigma_type_counts: Dict[int, float] = {}
-    for t, vals in per_type_values.items():
-        m, s = mean_std(vals)
-        mean_type_counts[t] = m
-        sigma_type_counts[t] = s
-
-    per_center_vals: Dict[str, List[int]] = {"head": [], "heart": [], "gut": []}
-    for cs in per_run_center_scores:
-        for c in per_center_vals.keys():
-            per_center_vals[c].append(cs.get(c, 0))
-
-    center_agg: Dict[str, Dict[str, Any]] = {}
-    for center, vals in per_center_vals.items():
-        m, s = mean_std(vals)
-        center_agg[center] = {"mean": m, "std": s, "values": vals}
+    n_runs = len(per_run_type_counts)
+
+    # (runs, types) and (runs, centers) matrices; one reduction per axis
+    type_arr = np.array(
+        [[tc.get(t, 0) for t in all_types] for tc in per_run_type_counts],
+        dtype=np.int64,
+    ).reshape(n_runs, len(all_types))
+    type_means, type_sigmas = column_mean_std(type_arr)
+    mean_type_counts: Dict[int, float] = dict(zip(all_types, type_means.tolist()))
+    sigma_type_counts: Dict[int, float] = dict(zip(all_types, type_sigmas.tolist()))
+
+    centers = tuple(_CENTER_TYPES)
+    center_arr = np.array(
+        [[cs.get(c, 0) for c in centers] for cs in per_run_center_scores],
+        dtype=np.int64,
+    ).reshape(n_runs, len(centers))
+    center_means, center_sigmas = column_mean_std(center_arr)
+    center_agg: Dict[str, Dict[str, Any]] = {
+        center: {
+            "mean": float(center_means[j]),
+            "std": float(center_sigmas[j]),
+            "values": center_arr[:, j].tolist(),
+        }
+        for j, center in enumerate(centers)
+    }
 
     return {
         "combined_type_counts": dict(combined_type_counts),
@@ -478,12 +896,15 @@ def aggregate_paired_runs(paired_runs: List[Dict[str, Any]]) -> Dict[str, Any]:
 # -----------------------------------------------------------------------------
 
 def format_likert_section_md(
-    likert_runs: List[Dict[str, Any]], agg: Dict[str, Any]
-) -> str:
-    lines: List[str] = []
-    lines.append("## 1. Likert Test – Multi-Run Summary\n")
+    fh: TextIO, likert_runs: List[Dict[str, Any]], agg: Dict[str, Any]
+) -> None:
+    """Write the Likert section of the report to `fh`."""
+    def emit(line: str) -> None:
+        fh.write(f"{line}\n")
+
+    emit("## 1. Likert Test – Multi-Run Summary\n")
 
-    lines.append("### 1.1 Primary Type / Wing / Tritype per Run\n")
+    emit("### 1.1 Primary Type / Wing / Tritype per Run\n")
     for r in likert_runs:
         run_idx = r["run_index"]
         profile = r["profile"]
@@ -491,84 +912,81 @@ def format_likert_section_md(
         wing = profile["primary_wing"]
         gut, heart, head = profile["tritype"]
         centers = r["center_scores"]
-        lines.append(
+        emit(
             f"- **Run {run_idx}** → Core: Type {core}, Wing: {wing}, "
             f"Tritype (Gut/Heart/Head): ({gut}, {heart}, {head}); "
             f"Centers: Head={centers['head']}, Heart={centers['heart']}, Gut={centers['gut']}"
         )
 
-    lines.append("\n### 1.2 Scores by Enneagram Type Across Runs (Means & σ)\n")
-    lines.append("| Type | Mean Score | σ |")
-    lines.append("|------|------------|---|")
+    emit("\n### 1.2 Scores by Enneagram Type Across Runs (Means & σ)\n")
+    emit("| Type | Mean Score | σ |")
+    emit("|------|------------|---|")
 
     mean_scores = agg["mean_scores"]
     sigma_scores = agg["sigma_scores"]
-    for t in sorted(mean_scores.keys()):
-        m = mean_scores[t]
+    # Both dicts are keyed in ascending type order by aggregate_likert_runs
+    for t, m in mean_scores.items():
         s = sigma_scores[t]
-        lines.append(f"| {t} | {m:.2f} | {s:.2f} |")
+        emit(f"| {t} | {m:.2f} | {s:.2f} |")
 
-    lines.append("\n### 1.3 Average Centers of Intelligence Across Runs\n")
-    lines.append("| Center | Average Score |")
-    lines.append("|--------|---------------|")
+    emit("\n### 1.3 Average Centers of Intelligence Across Runs\n")
+    emit("| Center | Average Score |")
+    emit("|--------|---------------|")
 
     avg_centers = agg["avg_center_scores"]
-    for c in ("head", "heart", "gut"):
+    for c in _CENTER_TYPES:
         val = avg_centers.get(c, 0.0)
-        lines.append(f"| {c.capitalize()} | {val:.2f} |")
-
-    lines.append("")
-    return "\n".join(lines)
+        emit(f"| {c.capitalize()} | {val:.2f} |")
 
 
 def format_paired_section_md(
-    paired_runs: List[Dict[str, Any]], agg: Dict[str, Any]
-) -> str:
-    lines: List[str] = []
-    lines.append("## 2. Paired A/B Test – Multi-Run Summary\n")
+    fh: TextIO, paired_runs: List[Dict[str, Any]], agg: Dict[str, Any]
+) -> None:
+    """Write the paired section of the report to `fh`."""
+    def emit(line: str) -> None:
+        fh.write(f"{line}\n")
+
+    emit("## 2. Paired A/B Test – Multi-Run Summary\n")
 
-    lines.append("### 2.1 Type Selection Counts per Run\n")
+    emit("### 2.1 Type Selection Counts per Run\n")
     for r in paired_runs:
         run_idx = r["run_index"]
         tcounts = r["counts_by_type"]
         if not tcounts:
-            lines.append(f"- **Run {run_idx}:** no selections")
+            emit(f"- **Run {run_idx}:** no selections")
         else:
-            sorted_counts = sorted(tcounts.items(), key=lambda kv: kv[0])
-            row = ", ".join(f"Type {t}: {c}" for t, c in sorted_counts)
-            lines.append(f"- **Run {run_idx}:** {row}")
-    lines.append("")
+            row = ", ".join(f"Type {t}: {c}" for t, c in sorted(tcounts.items()))
+            emit(f"- **Run {run_idx}:** {row}")
+    emit("")
 
-    lines.append("### 2.2 Combined Type Selection Counts (All Runs)\n")
+    emit("### 2.2 Combined Type Selection Counts (All Runs)\n")
     combined = agg["combined_type_counts"]
     if not combined:
-        lines.append("- No selections at all.")
+        emit("- No selections at all.")
     else:
-        for t, c in sorted(combined.items(), key=lambda kv: kv[0]):
-            lines.append(f"- Type {t}: {c}")
-    lines.append("")
+        for t, c in sorted(combined.items()):
+            emit(f"- Type {t}: {c}")
+    emit("")
 
-    lines.append("### 2.3 Combined Column Selection Counts (All Runs)\n")
+    emit("### 2.3 Combined Column Selection Counts (All Runs)\n")
     combined_cols = agg["combined_column_counts"]
     if not combined_cols:
-        lines.append("- No column selections at all.")
+        emit("- No column selections at all.")
     else:
-        for col, c in sorted(combined_cols.items(), key=lambda kv: kv[0]):
-            lines.append(f"- Column {col}: {c}")
-    lines.append("")
+        for col, c in sorted(combined_cols.items()):
+            emit(f"- Column {col}: {c}")
+    emit("")
 
-    lines.append("### 2.4 Centers of Intelligence (Paired) – Means & σ\n")
-    lines.append("| Center | Mean | σ | Values |")
-    lines.append("|--------|------|---|--------|")
+    emit("### 2.4 Centers of Intelligence (Paired) – Means & σ\n")
+    emit("| Center | Mean | σ | Values |")
+    emit("|--------|------|---|--------|")
     center_agg = agg["center_agg"]
     for center_name, stats in center_agg.items():
         mean = stats["mean"]
         std = stats["std"]
         vals = ", ".join(str(v) for v in stats["values"])
-        lines.append(f"| {center_name.capitalize()} | {mean:.2f} | {std:.2f} | {vals} |")
+        emit(f"| {center_name.capitalize()} | {mean:.2f} | {std:.2f} | {vals} |")
 
-    lines.append("")
-    return "\n".join(lines)
 
 
 # -----------------------------------------------------------------------------
@@ -604,6 +1022,40 @@ def main():
         help="How many times to run each test (Likert and paired).",
     )
 
+    parser.add_argument(
+        "--concurrency",
+        type=int,
+        default=DEFAULT_CONCURRENCY,
+        help="Questions sent to Ollama at once (default: $OLLAMA_NUM_PARALLEL "
+             f"or 4, currently {DEFAULT_CONCURRENCY}).",
+    )
+    parser.add_argument(
+        "--batch-size",
+        type=int,
+        default=1,
+        help="Questions packed into one Ollama call (default: 1, one call per "
+             "question). A batched reply that does not give one answer per "
+             "question is re-asked one question at a time.",
+    )
+    parser.add_argument(
+        "--verbose",
+        action="store_true",
+        help="Print every individual answer while the tests run.",
+    )
+    parser.add_argument(
+        "--cache",
+        action=argparse.BooleanOptionalAction,
+        default=False,
+        help="Reuse earlier answers to identical prompts from an on-disk cache "
+             "(default: --no-cache). Repeated runs then replay the same answers, "
+             "so σ no longer measures the model's variability.",
+    )
+    parser.add_argument(
+        "--cache-dir",
+        default=str(DEFAULT_CACHE_DIR),
+        help=f"Directory for the response cache (default: {DEFAULT_CACHE_DIR}).",
+    )
+
     args = parser.parse_args()
 
     tests_dir = pathlib.Path(args.tests_dir)
@@ -618,12 +1070,33 @@ def main():
     if not paired_path.exists():
         raise FileNotFoundError(f"Paired test file not found: {paired_path}")
 
-    likert_runs: List[Dict[str, Any]] = []
-    paired_runs: List[Dict[str, Any]] = []
+    if args.cache:
+        global _CACHE_DIR
+        _CACHE_DIR = pathlib.Path(args.cache_dir)
+        _CACHE_DIR.mkdir(parents=True, exist_ok=True)
+        print(
+            "Warning: response cache enabled; cached answers are replayed for "
+            "repeated prompts, which removes the run-to-run variance this "
+            "report measures."
+        )
 
-    for i in range(1, args.runs_per_test + 1):
-        likert_runs.append(run_likert_once(args.model, likert_path, i))
-        paired_runs.append(run_paired_once(args.model, paired_path, i))
+    # Parse each test file once; every run reads the same data
+    likert_data = json_loads(likert_path.read_bytes())
+    paired_data = json_loads(paired_path.read_bytes())
+    paired_items = prepare_paired_items(paired_data)
+
+    likert_runs, paired_runs = asyncio.run(
+        run_all(
+            args.model,
+            likert_data,
+            paired_data,
+            paired_items,
+            args.runs_per_test,
+            args.concurrency,
+            args.batch_size,
+            args.verbose,
+        )
+    )
 
     likert_agg = aggregate_likert_runs(likert_runs)
     paired_agg = aggregate_paired_runs(paired_runs)
@@ -632,17 +1105,22 @@ def main():
     timestamp = now.strftime("%Y-%m-%d_%H-%M-%S")
     out_path = outdir / f"{args.model}_enneagram-multi_{timestamp}_v3_unlabeled.md"
 
-    lines: List[str] = []
-    lines.append(f"# Enneagram LLM Multi-Run Report (Model: {args.model}, v3 Unlabeled)")
-    lines.append("")
-    lines.append(f"- **Date:** {now.date().isoformat()}")
-    lines.append(f"- **Time:** {now.strftime('%H:%M:%S')}")
-    lines.append(f"- **Runs per test:** {args.runs_per_test}")
-    lines.append("")
-    lines.append(format_likert_section_md(likert_runs, likert_agg))
-    lines.append(format_paired_section_md(paired_runs, paired_agg))
-
-    out_path.write_text("\n".join(lines), encoding="utf-8")
+    # Write to a temp file and rename it into place, so an interrupted write
+    # never leaves a truncated report behind
+    tmp_path = out_path.with_suffix(out_path.suffix + ".tmp")
+    with tmp_path.open("w", encoding="utf-8", buffering=1 << 20) as fh:
+        fh.write(
+            f"# Enneagram LLM Multi-Run Report (Model: {args.model}, v3 Unlabeled)\n"
+            "\n"
+            f"- **Date:** {now.date().isoformat()}\n"
+            f"- **Time:** {now.strftime('%H:%M:%S')}\n"
+            f"- **Runs per test:** {args.runs_per_test}\n"
+            "\n"
+        )
+        format_likert_section_md(fh, likert_runs, likert_agg)
+        fh.write("\n")
+        format_paired_section_md(fh, paired_runs, paired_agg)
+    os.replace(tmp_path, out_path)
     print(f"\nDone. Wrote markdown report to: {out_path}")
 
 
@@ -2,7 +2,8 @@
 """
 Wrapper script to run all available Ollama models through both Enneagram test versions.
 
-Automatically discovers models via `ollama list` and runs:
+Automatically discovers models via the Ollama server's /api/tags endpoint
+(falling back to `ollama list` if the server can't be reached) and runs:
 1. enneagram_runner_v3-2_3run.py (standard version)
 2. enneagram_runner_v3-2_3run_NoContext.py (context-clearing version)
 
@@ -11,33 +12,110 @@ For each model with --runs-per-test 3.
 
 import subprocess
 import sys
-import re
 import argparse
+import contextlib
+import csv
+import io
 import json
+import multiprocessing
 import os
+import runpy
+import shlex
+import shutil
+import threading
 import time
+import traceback
+import urllib.request
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
-from pathlib import Path
+
+try:
+    # Optional: orjson serializes the JSON logs noticeably faster
+    from orjson import OPT_INDENT_2, dumps as _orjson_dumps
+
+    def _json_line(record):
+        return _orjson_dumps(record).decode("utf-8") + "\n"
+
+    def _json_document(data):
+        return _orjson_dumps(data, option=OPT_INDENT_2)
+except ImportError:
+    def _json_line(record):
+        return json.dumps(record, separators=(",", ":")) + "\n"
+
+    def _json_document(data):
+        return json.dumps(data, indent=2).encode("utf-8")
+
+# Default for --max-parallel (models tested at once). Different models only
+# run side by side when Ollama may keep them loaded together, so follow its
+# setting.
+DEFAULT_MAX_PARALLEL = int(os.environ.get("OLLAMA_MAX_LOADED_MODELS") or 1)
+
+# The server's model list, as JSON (the test scripts use the same host)
+OLLAMA_TAGS_URL = "http://localhost:11434/api/tags"
+
+# Log separators
+_SEP_EQ = "=" * 80
+_SEP_HASH = "#" * 80
+_SECTION_SEP_EQ = f"\n{_SEP_EQ}"
+_SECTION_SEP_HASH = f"\n{_SEP_HASH}"
+
+# Used by the --preflight check. The first request may have to load the
+# model, so allow for that rather than a few seconds.
+OLLAMA_GENERATE_URL = "http://localhost:11434/api/generate"
+PREFLIGHT_TIMEOUT = 300
+
+# Lines of a test's stderr kept for the error report of a failed test
+OUTPUT_TAIL_LINES = 1024
 
 
 class BatchLogger:
-    """Handles both text and JSON logging for batch test runs."""
+    """Handles both text and JSON logging for batch test runs.
+
+    The JSON log is JSON Lines, written as the batch goes: a
+    "session_start" record, a "models" record, one "test" record per
+    finished test and a closing "summary" record. With emit_aggregate_json,
+    the whole log is also written as one indented JSON document at the end.
 
-    def __init__(self, log_dir="logs"):
-        self.log_dir = Path(log_dir)
-        self.log_dir.mkdir(exist_ok=True)
+    Safe to share between the worker threads of a parallel batch; each
+    multi-line entry is written as one uninterrupted block.
+    """
+
+    def __init__(self, log_dir="logs", emit_aggregate_json=False):
+        self._lock = threading.RLock()
+        # log() timestamps have one-second resolution; reuse the last one.
+        # The clock functions are bound once for the per-line path.
+        self._last_ts_sec = 0
+        self._last_ts_str = ""
+        self._now = time.time
+        self._strftime = time.strftime
+        self._localtime = time.localtime
+        self.log_dir = log_dir
+        os.makedirs(log_dir, exist_ok=True)
 
         # Generate timestamp for this run
-        self.timestamp = datetime.now().strftime("%Y-%m-%d_%H-%M-%S")
+        self.start_time = time.time()
+        start_dt = datetime.fromtimestamp(self.start_time)
+        self.timestamp = start_dt.strftime("%Y-%m-%d_%H-%M-%S")
 
         # Create log file paths
-        self.text_log_path = self.log_dir / f"batch_run_{self.timestamp}.log"
-        self.json_log_path = self.log_dir / f"batch_run_{self.timestamp}.json"
+        # (plain strings, built once)
+        base = os.path.join(log_dir, f"batch_run_{self.timestamp}")
+        self.text_log_path = f"{base}.log"
+        self.jsonl_log_path = f"{base}.jsonl"
+        self.json_log_path = f"{base}.json" if emit_aggregate_json else None
+        # Per-test stdout files; created with the first one
+        self.output_dir = base
+
+        # Kept open for the whole batch; flushed after each test (see
+        # log_test_end) so an interrupted batch still logs finished tests
+        self._text_fh = open(self.text_log_path, 'a', buffering=1 << 16, encoding='utf-8')
+        self._jsonl_fh = open(self.jsonl_log_path, 'w', buffering=1 << 16, encoding='utf-8')
 
         # Initialize JSON log structure
         self.json_data = {
             "session": {
-                "start_time": datetime.now().isoformat(),
+                "start_time": start_dt.isoformat(),
                 "end_time": None,
                 "duration_seconds": None,
                 "command_line_args": sys.argv[1:]
@@ -55,29 +133,47 @@ class BatchLogger:
             }
         }
 
-        # Initialize text log
-        self._write_text(f"{'='*80}\n")
-        self._write_text(f"Enneagram LLM Test Suite - Batch Run Log\n")
-        self._write_text(f"{'='*80}\n")
-        self._write_text(f"Started at: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}\n")
-        self._write_text(f"Text log: {self.text_log_path}\n")
-        self._write_text(f"JSON log: {self.json_log_path}\n")
-        self._write_text(f"{'='*80}\n\n")
+        self._write_record({"type": "session_start", **self.json_data["session"]})
 
-        self.start_time = time.time()
+        # Initialize text log
+        header = [
+            _SEP_EQ,
+            f"Enneagram LLM Test Suite - Batch Run Log",
+            _SEP_EQ,
+            f"Started at: {start_dt.strftime('%Y-%m-%d %H:%M:%S')}",
+            f"Text log: {self.text_log_path}",
+            f"JSONL log: {self.jsonl_log_path}",
+        ]
+        if self.json_log_path:
+            header.append(f"JSON log: {self.json_log_path}")
+        header.append(f"{_SEP_EQ}\n\n")
+        self._write_text("\n".join(header))
 
     def _write_text(self, message):
         """Append message to text log file."""
-        with open(self.text_log_path, 'a', encoding='utf-8') as f:
-            f.write(message)
+        with self._lock:
+            self._text_fh.write(message)
+
+    def _write_record(self, record):
+        """Append one record to the JSONL log."""
+        with self._lock:
+            self._jsonl_fh.write(_json_line(record))
 
     def log(self, message, to_console=True):
         """Log message to both text file and optionally console."""
-        timestamp = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
-        log_line = f"[{timestamp}] {message}\n"
-        self._write_text(log_line)
-        if to_console:
-            print(message)
+        self.log_batch([message], to_console)
+
+    def log_batch(self, messages, to_console=True):
+        """Log several messages as one block, with a single write and print."""
+        now = int(self._now())
+        with self._lock:
+            if now != self._last_ts_sec:
+                self._last_ts_str = self._strftime("%Y-%m-%d %H:%M:%S", self._localtime(now))
+                self._last_ts_sec = now
+            prefix = f"[{self._last_ts_str}] "
+            self._write_text("".join(f"{prefix}{m}\n" for m in messages))
+            if to_console:
+                print("\n".join(messages))
 
     def log_models_discovered(self, models):
         """Log discovered models."""
@@ -93,114 +189,207 @@ class BatchLogger:
     def log_models_to_test(self, models):
         """Log models that will be tested."""
         self.json_data["models"]["tested"] = models
+        self._write_record({"type": "models", **self.json_data["models"]})
         self.log(f"Testing {len(models)} model(s): {', '.join(models)}")
 
+    def log_model_start(self, model, model_num, total_models):
+        """Log the start of a model's tests."""
+        self.log_batch([
+            _SECTION_SEP_HASH,
+            f"# MODEL {model_num}/{total_models}: {model}",
+            _SEP_HASH,
+        ])
+
     def log_test_start(self, model, script, test_num, total_tests):
         """Log the start of a test."""
-        self.log(f"\n{'='*80}")
-        self.log(f"Test {test_num}/{total_tests}: {script} with {model}")
-        self.log(f"{'='*80}")
+        self.log_batch([
+            _SECTION_SEP_EQ,
+            f"Test {test_num}/{total_tests}: {script} with {model}",
+            _SEP_EQ,
+        ])
         return time.time()  # Return start time for duration calculation
 
-    def log_test_end(self, model, script, success, start_time, error_msg=None, stdout=None, stderr=None):
-        """Log the end of a test."""
-        duration = time.time() - start_time
+    def test_output_path(self, model, script):
+        """Path of the file that keeps the stdout of one (model, script) test."""
+        os.makedirs(self.output_dir, exist_ok=True)
+        safe_model = model.replace("/", "_").replace(":", "_")
+        script_name = os.path.splitext(os.path.basename(script))[0]
+        return os.path.join(self.output_dir, f"{safe_model}_{script_name}.stdout")
 
+    def log_test_skipped(self, model, script, reason):
+        """Log a test that was not run, as a failed entry with `reason`."""
+        test_entry = {
+            "model": model,
+            "script": script,
+            "success": False,
+            "skipped": True,
+            "duration_seconds": 0,
+            "timestamp": datetime.now().isoformat(),
+            "error": reason
+        }
+        with self._lock:
+            self.json_data["tests"].append(test_entry)
+            self._write_record({"type": "test", **test_entry})
+            self.log(f"{model} / {script}: ⏭️ SKIPPED - {reason}")
+
+    def log_test_end(self, model, script, success, start_time, error_msg=None, stdout_log=None, stderr=None):
+        """Log the end of a test. stdout_log is the file holding its stdout."""
+        now = time.time()
+        self.log_test_result(model, script, success, now - start_time, now, error_msg, stdout_log, stderr)
+
+    def log_test_result(self, model, script, success, duration, end_time, error_msg=None,
+                        stdout_log=None, stderr=None):
+        """Log a finished test, given its duration and end time (epoch seconds)."""
         test_entry = {
             "model": model,
             "script": script,
             "success": success,
             "duration_seconds": round(duration, 2),
-            "timestamp": datetime.now().isoformat()
+            "timestamp": datetime.fromtimestamp(end_time).isoformat()
         }
+        if stdout_log:
+            test_entry["stdout_log"] = stdout_log
 
         if not success:
             test_entry["error"] = error_msg or "Unknown error"
-            if stdout:
-                test_entry["stdout"] = stdout
             if stderr:
                 test_entry["stderr"] = stderr
 
-        self.json_data["tests"].append(test_entry)
-
         status = "✅ SUCCESS" if success else "❌ FAILED"
-        self.log(f"{status} - Duration: {duration:.2f}s")
-
-        if not success and error_msg:
-            self._write_text(f"    Error: {error_msg}\n")
-            if stderr:
-                self._write_text(f"    stderr: {stderr}\n")
+        with self._lock:
+            self.json_data["tests"].append(test_entry)
+            self._write_record({"type": "test", **test_entry})
+            self.log(f"{model} / {script}: {status} - Duration: {duration:.2f}s")
+
+            if not success and error_msg:
+                self._write_text(f"    Error: {error_msg}\n")
+                if stdout_log:
+                    self._write_text(f"    stdout: {stdout_log}\n")
+                if stderr:
+                    self._write_text(f"    stderr: {stderr}\n")
+            self._text_fh.flush()
+            self._jsonl_fh.flush()
 
     def finalize(self, total_tests, completed, failed):
         """Write final summary and close logs."""
         end_time = time.time()
+        end_dt = datetime.fromtimestamp(end_time)
         duration = end_time - self.start_time
 
         # Update JSON summary
-        self.json_data["session"]["end_time"] = datetime.now().isoformat()
+        self.json_data["session"]["end_time"] = end_dt.isoformat()
         self.json_data["session"]["duration_seconds"] = round(duration, 2)
         self.json_data["summary"]["total_tests"] = total_tests
         self.json_data["summary"]["completed"] = completed
         self.json_data["summary"]["failed"] = failed
 
         # Write final text summary
-        self.log(f"\n{'='*80}")
-        self.log(f"FINAL SUMMARY")
-        self.log(f"{'='*80}")
-        self.log(f"Total tests: {total_tests}")
-        self.log(f"Completed: {completed}")
-        self.log(f"Failed: {failed}")
-        self.log(f"Duration: {duration/60:.2f} minutes ({duration:.0f} seconds)")
-        self.log(f"Finished at: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}")
-        self.log(f"{'='*80}")
+        self.log_batch([
+            _SECTION_SEP_EQ,
+            f"FINAL SUMMARY",
+            _SEP_EQ,
+            f"Total tests: {total_tests}",
+            f"Completed: {completed}",
+            f"Failed: {failed}",
+            f"Duration: {duration/60:.2f} minutes ({duration:.0f} seconds)",
+            f"Finished at: {end_dt.strftime('%Y-%m-%d %H:%M:%S')}",
+            _SEP_EQ,
+        ])
+
+        self._write_record({
+            "type": "summary",
+            "session": self.json_data["session"],
+            "summary": self.json_data["summary"]
+        })
+
+        # Write the aggregate JSON log, if requested
+        if self.json_log_path:
+            with open(self.json_log_path, 'wb') as f:
+                f.write(_json_document(self.json_data))
+
+        saved = [
+            f"\nLogs saved:",
+            f"  Text: {self.text_log_path}",
+            f"  JSONL: {self.jsonl_log_path}",
+        ]
+        if self.json_log_path:
+            saved.append(f"  JSON: {self.json_log_path}")
+        self.log_batch(saved)
+        self.close()
+
+    def close(self):
+        """Flush and close the log files. Safe to call more than once."""
+        with self._lock:
+            self._text_fh.close()
+            self._jsonl_fh.close()
 
-        # Write JSON log
-        with open(self.json_log_path, 'w', encoding='utf-8') as f:
-            json.dump(self.json_data, f, indent=2)
 
-        self.log(f"\nLogs saved:")
-        self.log(f"  Text: {self.text_log_path}")
-        self.log(f"  JSON: {self.json_log_path}")
+def get_available_models():
+    """Get list of available Ollama models.
 
+    Asks the Ollama server for its model list as JSON; if the server can't be
+    reached, falls back to parsing the text output of `ollama list`.
+    """
+    try:
+        with urllib.request.urlopen(OLLAMA_TAGS_URL, timeout=10) as resp:
+            data = json.load(resp)
+        return [m["name"] for m in data["models"]]
+    except (OSError, ValueError, KeyError) as e:
+        print(f"Could not query {OLLAMA_TAGS_URL} ({e}); trying 'ollama list'.", file=sys.stderr)
+
+    exe = shutil.which("ollama")
+    if exe is None:
+        print("Error: 'ollama' command not found.", file=sys.stderr)
+        print("Make sure Ollama is installed and in your PATH.", file=sys.stderr)
+        return []
 
-def get_available_models():
-    """Get list of available Ollama models."""
     try:
         result = subprocess.run(
-            ["ollama", "list"],
+            [exe, "list"],
             capture_output=True,
             text=True,
             check=True,
             timeout=30
         )
+    except (subprocess.CalledProcessError, subprocess.TimeoutExpired) as e:
+        print(f"Error running 'ollama list': {e}", file=sys.stderr)
+        print(f"Make sure Ollama is installed and running.", file=sys.stderr)
+        return []
 
-        # Parse the output - skip header line, extract model names
-        lines = result.stdout.strip().split('\n')
-        models = []
+    # Parse the output - skip header line, extract model names (first column)
+    return [line.split()[0] for line in result.stdout.splitlines()[1:] if line.strip()]
 
-        for line in lines[1:]:  # Skip header
-            # Extract model name (first column)
-            parts = line.split()
-            if parts:
-                model_name = parts[0]
-                models.append(model_name)
 
-        return models
+def _drain_stderr(pipe, tail):
+    """Read a child's stderr line by line, keeping the last lines in `tail`."""
+    with pipe:
+        for line in pipe:
+            tail.append(line)
 
-    except subprocess.CalledProcessError as e:
-        print(f"Error running 'ollama list': {e}", file=sys.stderr)
-        print(f"Make sure Ollama is installed and running.", file=sys.stderr)
-        return []
-    except FileNotFoundError:
-        print("Error: 'ollama' command not found.", file=sys.stderr)
-        print("Make sure Ollama is installed and in your PATH.", file=sys.stderr)
-        return []
 
+def _drain_stdout(pipe, echo_prefix, out_path=None):
+    """Echo a child's stdout to the console line by line as it arrives and,
+    with out_path, save it to that file. Nothing is kept in memory."""
+    with pipe:
+        if out_path is None:
+            for line in pipe:
+                print(f"{echo_prefix}{line}", end="", flush=True)
+            return
+        with open(out_path, 'w', buffering=1 << 16, encoding='utf-8') as out:
+            for line in pipe:
+                out.write(line)
+                print(f"{echo_prefix}{line}", end="", flush=True)
 
-def run_test_script(script_name, model_name, runs_per_test=3):
+
+def run_test_script(script_name, model_name, runs_per_test=3, stdout_path=None):
     """Run a single test script for a given model.
 
-    Returns tuple: (success: bool, error_msg: str, stdout: str, stderr: str)
+    The child's output is streamed rather than collected: stdout is echoed
+    live (and saved to stdout_path, if given) without being held in memory,
+    and only the last OUTPUT_TAIL_LINES lines of stderr are kept, for the
+    error report, however long the run takes.
+
+    Returns tuple: (success: bool, error_msg: str, stderr: str)
     """
     cmd = [
         "python3",
@@ -211,23 +400,293 @@ def run_test_script(script_name, model_name, runs_per_test=3):
 
     print(f"Running: {' '.join(cmd)}")
 
+    proc = subprocess.Popen(
+        cmd,
+        stdout=subprocess.PIPE,
+        stderr=subprocess.PIPE,
+        text=True,
+        bufsize=1,
+        # Otherwise the child block-buffers its output to the pipe
+        env={**os.environ, "PYTHONUNBUFFERED": "1"}
+    )
+    stderr_tail = deque(maxlen=OUTPUT_TAIL_LINES)
+    readers = [
+        threading.Thread(target=_drain_stdout, args=(proc.stdout, f"  [{model_name}] ", stdout_path)),
+        threading.Thread(target=_drain_stderr, args=(proc.stderr, stderr_tail)),
+    ]
+    for reader in readers:
+        reader.start()
+
+    error_msg = None
     try:
-        result = subprocess.run(
-            cmd,
-            capture_output=True,
-            text=True,
-            check=True,
-            timeout=7200  # 2 hour timeout per test
-        )
-        return True, None, result.stdout, result.stderr
-    except subprocess.CalledProcessError as e:
-        error_msg = f"Exit code: {e.returncode}"
-        print(f"❌ Error: {error_msg}", file=sys.stderr)
-        return False, error_msg, e.stdout, e.stderr
-    except subprocess.TimeoutExpired as e:
+        returncode = proc.wait(timeout=7200)  # 2 hour timeout per test
+        if returncode != 0:
+            error_msg = f"Exit code: {returncode}"
+            print(f"❌ Error: {error_msg}", file=sys.stderr)
+    except subprocess.TimeoutExpired:
+        proc.kill()
+        proc.wait()
         error_msg = "Timeout after 2 hours"
         print(f"❌ {error_msg}", file=sys.stderr)
-        return False, error_msg, e.stdout if e.stdout else "", e.stderr if e.stderr else ""
+    finally:
+        for reader in readers:
+            reader.join()
+
+    return error_msg is None, error_msg, "".join(stderr_tail)
+
+
+# Modules a forkserver imports once, so every worker forked from it starts warm
+_WARM_PRELOAD = ["requests"]
+
+
+def worker_context():
+    """Multiprocessing context for --in-process workers. A forkserver that
+    has preloaded _WARM_PRELOAD where available (it is safe to start from a
+    threaded process); otherwise "spawn", which is slower but also safe."""
+    if "forkserver" in multiprocessing.get_all_start_methods():
+        ctx = multiprocessing.get_context("forkserver")
+        ctx.set_forkserver_preload(_WARM_PRELOAD)
+        return ctx
+    return multiprocessing.get_context("spawn")
+
+
+def _run_script_in_worker(script_name, model_name, runs_per_test, stdout_path):
+    """Run a test script inside a warm worker process, as if from the command
+    line. stdout goes to stdout_path. Returns (exit_code, stderr_tail)."""
+    argv = [script_name, "--model", model_name, "--runs-per-test", str(runs_per_test)]
+    saved_argv = sys.argv
+    sys.argv = argv
+    stderr_buf = io.StringIO()
+    exit_code = 0
+    try:
+        with open(stdout_path, 'w', buffering=1 << 16, encoding='utf-8') as out, \
+                contextlib.redirect_stdout(out), contextlib.redirect_stderr(stderr_buf):
+            try:
+                runpy.run_path(script_name, run_name="__main__")
+            except SystemExit as e:
+                if isinstance(e.code, int):
+                    exit_code = e.code
+                elif e.code is not None:
+                    print(e.code, file=sys.stderr)
+                    exit_code = 1
+            except Exception:
+                traceback.print_exc()
+                exit_code = 1
+    finally:
+        sys.argv = saved_argv
+    return exit_code, "".join(deque(stderr_buf.getvalue().splitlines(True), maxlen=OUTPUT_TAIL_LINES))
+
+
+def _worker_main(conn, script_name, model_name, runs_per_test, stdout_path):
+    """Worker process entry point: run the script and send back its result."""
+    conn.send(_run_script_in_worker(script_name, model_name, runs_per_test, stdout_path))
+    conn.close()
+
+
+def run_test_in_worker(mp_context, script_name, model_name, runs_per_test=3, stdout_path=None):
+    """Like run_test_script, but runs the script in its own worker process
+    from mp_context (see --in-process), which is killed if the test times
+    out. Its stdout is saved to stdout_path, not echoed.
+
+    Returns tuple: (success: bool, error_msg: str, stderr: str)
+    """
+    print(f"Running in worker: {script_name} --model {model_name} --runs-per-test {runs_per_test}")
+    recv_end, send_end = mp_context.Pipe(duplex=False)
+    proc = mp_context.Process(
+        target=_worker_main,
+        args=(send_end, script_name, model_name, runs_per_test, stdout_path),
+        daemon=True,
+    )
+    proc.start()
+    send_end.close()
+    try:
+        if not recv_end.poll(7200):  # 2 hour timeout per test
+            proc.kill()
+            proc.join()
+            error_msg = "Timeout after 2 hours"
+            print(f"❌ {error_msg}", file=sys.stderr)
+            return False, error_msg, ""
+        try:
+            exit_code, stderr = recv_end.recv()
+        except EOFError:
+            # The worker died without reporting back
+            proc.join()
+            error_msg = f"Worker exited with code {proc.exitcode}"
+            print(f"❌ Error: {error_msg}", file=sys.stderr)
+            return False, error_msg, ""
+    finally:
+        recv_end.close()
+    proc.join()
+    if exit_code != 0:
+        error_msg = f"Exit code: {exit_code}"
+        print(f"❌ Error: {error_msg}", file=sys.stderr)
+        return False, error_msg, stderr
+    return True, None, stderr
+
+
+def run_test(logger, model, script, test_num, total_tests, mp_context=None):
+    """Run one (model, script) test and log it. Returns True on success.
+    With an mp_context, the test runs in a warm worker process."""
+    start_time = logger.log_test_start(model, script, test_num, total_tests)
+    stdout_path = logger.test_output_path(model, script)
+    if mp_context is not None:
+        success, error_msg, stderr = run_test_in_worker(mp_context, script, model, runs_per_test=3, stdout_path=stdout_path)
+    else:
+        success, error_msg, stderr = run_test_script(script, model, runs_per_test=3, stdout_path=stdout_path)
+    logger.log_test_end(model, script, success, start_time, error_msg, stdout_path, stderr)
+    return success
+
+
+def check_model(model):
+    """Pre-flight check: ask the model for a single token. Returns None if it
+    answers, else a short error description."""
+    payload = json.dumps({
+        "model": model,
+        "prompt": "hi",
+        "stream": False,
+        "options": {"num_predict": 1}
+    }).encode("utf-8")
+    request = urllib.request.Request(
+        OLLAMA_GENERATE_URL, data=payload, headers={"Content-Type": "application/json"}
+    )
+    try:
+        with urllib.request.urlopen(request, timeout=PREFLIGHT_TIMEOUT) as resp:
+            resp.read()
+    except OSError as e:
+        return str(e)
+    return None
+
+
+def run_model(logger, model, model_num, total_models, scripts, first_test_num,
+              total_tests, parallel_scripts=False, stop_event=None,
+              stop_on_first_failure=False, max_failures=None, preflight=False, mp_context=None):
+    """Run every test script for one model, numbering the tests from
+    first_test_num. With parallel_scripts, the scripts run concurrently
+    against the model instead of one after another.
+
+    Tests that are not run are logged as skipped: all of them if the
+    pre-flight check fails or stop_event is already set, and, when running
+    the scripts in turn, the remaining ones once stop_event is set or the
+    model has failed max_failures tests. With stop_on_first_failure, a
+    failure sets stop_event. With an mp_context, the tests run in warm worker processes.
+    """
+    def skip(remaining, reason):
+        for test_num, script in remaining:
+            logger.log_test_skipped(model, script, reason)
+
+    tests = list(enumerate(scripts, first_test_num))
+    if stop_event is not None and stop_event.is_set():
+        skip(tests, "skipped_due_to_earlier_failure")
+        return
+
+    logger.log_model_start(model, model_num, total_models)
+    if preflight:
+        error = check_model(model)
+        if error:
+            logger.log(f"Pre-flight check failed for {model}: {error}")
+            skip(tests, f"preflight_failed: {error}")
+            if stop_on_first_failure:
+                stop_event.set()
+            return
+
+    if parallel_scripts:
+        with ThreadPoolExecutor(max_workers=len(tests)) as executor:
+            futures = [
+                executor.submit(run_test, logger, model, script, test_num, total_tests, mp_context)
+                for test_num, script in tests
+            ]
+            all_ok = all([future.result() for future in futures])
+        if not all_ok and stop_on_first_failure:
+            stop_event.set()
+        return
+
+    failures = 0
+    for i, (test_num, script) in enumerate(tests):
+        if stop_event is not None and stop_event.is_set():
+            skip(tests[i:], "skipped_due_to_earlier_failure")
+            return
+        if run_test(logger, model, script, test_num, total_tests, mp_context):
+            continue
+        failures += 1
+        if stop_on_first_failure:
+            stop_event.set()
+        elif max_failures and failures >= max_failures and i + 1 < len(tests):
+            logger.log(f"Skipping remaining scripts for {model}")
+            skip(tests[i + 1:], "skipped_due_to_model_failure")
+            return
+
+
+def run_with_gnu_parallel(logger, models, scripts, jobs_at_once, stop_on_first_failure=False):
+    """Run every (model, script) test through GNU parallel, then log the
+    results from its joblog.
+
+    The tests are written to a joblist (one shell command per line, with
+    stdout and stderr redirected to per-test files), parallel schedules them
+    -j jobs_at_once, and the joblog it keeps (exit status and runtime per
+    job) is turned into the usual test entries. Tests parallel never started
+    (after --halt) are logged as skipped.
+
+    Returns False, having logged nothing for the tests, if parallel failed
+    without writing a joblog; the caller then runs them some other way.
+    """
+    tests = [(model, script) for model in models for script in scripts]
+    os.makedirs(logger.output_dir, exist_ok=True)
+    joblist_path = os.path.join(logger.output_dir, "joblist.txt")
+    joblog_path = os.path.join(logger.output_dir, "joblog.tsv")
+
+    output_paths = []
+    with open(joblist_path, 'w', encoding='utf-8') as f:
+        for model, script in tests:
+            stdout_path = logger.test_output_path(model, script)
+            stderr_path = f"{os.path.splitext(stdout_path)[0]}.stderr"
+            output_paths.append((stdout_path, stderr_path))
+            cmd = shlex.join(["python3", script, "--model", model, "--runs-per-test", "3"])
+            f.write(f"{cmd} > {shlex.quote(stdout_path)} 2> {shlex.quote(stderr_path)}\n")
+
+    parallel_cmd = [
+        "parallel", "-j", str(jobs_at_once),
+        "--timeout", "7200",  # 2 hour timeout per test
+        "--joblog", joblog_path
+    ]
+    if stop_on_first_failure:
+        parallel_cmd += ["--halt", "soon,fail=1"]
+    parallel_cmd += ["::::", joblist_path]
+    logger.log(f"Running {len(tests)} test(s) with: {' '.join(parallel_cmd)}")
+    returncode = subprocess.run(parallel_cmd).returncode
+
+    if not os.path.exists(joblog_path):
+        logger.log(f"GNU parallel failed (exit code {returncode}) without writing a joblog.")
+        return False
+    if returncode != 0:
+        # 1-101 counts failed jobs, which the joblog records; more is an error
+        logger.log(f"GNU parallel exited with code {returncode}.")
+
+    jobs = {}
+    with open(joblog_path, newline='', encoding='utf-8') as f:
+        for row in csv.DictReader(f, delimiter='\t', quoting=csv.QUOTE_NONE):
+            jobs[int(row["Seq"])] = row
+
+    for seq, ((model, script), (stdout_path, stderr_path)) in enumerate(zip(tests, output_paths), 1):
+        row = jobs.get(seq)
+        if row is None:
+            logger.log_test_skipped(model, script, "not_run_by_gnu_parallel")
+            continue
+        exit_code, signal = int(row["Exitval"]), int(row["Signal"])
+        success = exit_code == 0 and signal == 0
+        error_msg = stderr = None
+        if not success:
+            error_msg = f"Killed by signal {signal}" if signal else f"Exit code: {exit_code}"
+            try:
+                with open(stderr_path, encoding='utf-8', errors='replace') as f:
+                    stderr = "".join(deque(f, maxlen=OUTPUT_TAIL_LINES))
+            except OSError:
+                pass
+        runtime = float(row["JobRuntime"])
+        logger.log_test_result(
+            model, script, success, runtime, float(row["Starttime"]) + runtime,
+            error_msg, stdout_path, stderr
+        )
+    return True
 
 
 def main():
@@ -243,99 +702,187 @@ def main():
         metavar="MODEL",
         help="Exclude specific model(s) from testing (can be specified multiple times)"
     )
+    parser.add_argument(
+        "--max-parallel",
+        type=int,
+        default=DEFAULT_MAX_PARALLEL,
+        metavar="N",
+        help=(
+            "Test up to N models at once (default: $OLLAMA_MAX_LOADED_MODELS, "
+            f"else 1; currently {DEFAULT_MAX_PARALLEL}). This only helps if "
+            "Ollama can keep those models loaded together."
+        ),
+    )
+    parser.add_argument(
+        "--parallel-scripts",
+        action="store_true",
+        help=(
+            "Run a model's test scripts concurrently instead of one after "
+            "another. This only helps if Ollama serves parallel requests "
+            "(OLLAMA_NUM_PARALLEL > 1)."
+        ),
+    )
+    parser.add_argument(
+        "--stop-on-first-failure",
+        action="store_true",
+        help="Stop starting new tests once any test has failed; the rest are logged as skipped."
+    )
+    parser.add_argument(
+        "--skip-model-after-n-failures",
+        type=int,
+        default=None,
+        metavar="N",
+        help=(
+            "Skip a model's remaining scripts once N of its tests have failed "
+            "(not with --parallel-scripts, where they all start together)."
+        ),
+    )
+    parser.add_argument(
+        "--preflight",
+        action="store_true",
+        help=(
+            "Before testing a model, check that it answers a one-token prompt; "
+            "if it doesn't, skip its tests."
+        ),
+    )
+    parser.add_argument(
+        "--driver",
+        choices=["python", "parallel"],
+        default="python",
+        help=(
+            "How to schedule the tests: this script's own worker threads "
+            "(default), or GNU parallel, given a generated joblist and run with "
+            "-j --max-parallel. With 'parallel', only --stop-on-first-failure of "
+            "the scheduling options applies."
+        ),
+    )
+    parser.add_argument(
+        "--in-process",
+        action="store_true",
+        help=(
+            "Run each test script in a warm Python worker process instead "
+            "of starting a fresh interpreter per test. Its output "
+            "goes to the per-test log files only (python driver)."
+        ),
+    )
+    parser.add_argument(
+        "--emit-aggregate-json",
+        action="store_true",
+        help=(
+            "Also write the whole batch log as one indented JSON file at the end, "
+            "in addition to the JSONL log written as tests finish."
+        ),
+    )
     args = parser.parse_args()
 
     # Initialize logger
-    logger = BatchLogger()
-
-    logger.log("="*80)
-    logger.log("Enneagram LLM Test Suite - Batch Runner")
-    logger.log("="*80)
-
-    # Get available models
-    logger.log("Discovering available Ollama models...")
-    all_models = get_available_models()
-
-    if not all_models:
-        logger.log("No models found. Exiting.")
-        sys.exit(1)
-
-    logger.log_models_discovered(all_models)
-
-    # Filter out excluded models
-    excluded_models = args.exclude or []
-    models = [m for m in all_models if m not in excluded_models]
-
-    logger.log_models_excluded(excluded_models)
-
-    if not models:
-        logger.log("No models remaining after exclusions. Exiting.")
-        sys.exit(1)
-
-    logger.log_models_to_test(models)
-    logger.log("")
-
-    # Test scripts to run
-    test_scripts = [
-        "enneagram_runner_v3-2_3run.py",
-        "enneagram_runner_v3-2_3run_NoContext.py"
-    ]
-
-    # Track results
-    total_tests = len(models) * len(test_scripts)
-    completed = 0
-    failed = 0
-    results = []
-
-    # Run tests for each model
-    for model_idx, model in enumerate(models, 1):
-        logger.log(f"\n{'#'*80}")
-        logger.log(f"# MODEL {model_idx}/{len(models)}: {model}")
-        logger.log(f"{'#'*80}")
-
-        for script_idx, script in enumerate(test_scripts, 1):
-            test_num = (model_idx - 1) * len(test_scripts) + script_idx
-
-            # Log test start
-            start_time = logger.log_test_start(model, script, test_num, total_tests)
-
-            # Run the test
-            success, error_msg, stdout, stderr = run_test_script(script, model, runs_per_test=3)
-
-            # Log test end
-            logger.log_test_end(model, script, success, start_time, error_msg, stdout, stderr)
-
-            results.append({
-                "model": model,
-                "script": script,
-                "success": success
-            })
-
-            if success:
-                completed += 1
-            else:
-                failed += 1
-
-    # Finalize logs with summary
-    logger.finalize(total_tests, completed, failed)
-
-    # Detailed results to console
-    if failed > 0:
-        print("\nFailed tests:")
-        for r in results:
-            if not r["success"]:
-                print(f"  ❌ {r['model']} - {r['script']}")
-
-    print("\nSuccessful tests:")
-    for r in results:
-        if r["success"]:
-            print(f"  ✅ {r['model']} - {r['script']}")
-
-    print("\nAll results have been saved to the results/ directory.")
-    print("="*80)
-
-    # Exit with error code if any tests failed
-    sys.exit(0 if failed == 0 else 1)
+    logger = BatchLogger(emit_aggregate_json=args.emit_aggregate_json)
+    try:
+        logger.log_batch([
+            _SEP_EQ,
+            "Enneagram LLM Test Suite - Batch Runner",
+            _SEP_EQ,
+        ])
+
+        # Get available models
+        logger.log("Discovering available Ollama models...")
+        all_models = get_available_models()
+
+        if not all_models:
+            logger.log("No models found. Exiting.")
+            sys.exit(1)
+
+        logger.log_models_discovered(all_models)
+
+        # Filter out excluded models
+        excluded_models = args.exclude or []
+        models = [m for m in all_models if m not in excluded_models]
+
+        logger.log_models_excluded(excluded_models)
+
+        if not models:
+            logger.log("No models remaining after exclusions. Exiting.")
+            sys.exit(1)
+
+        logger.log_models_to_test(models)
+        logger.log("")
+
+        # Test scripts to run
+        test_scripts = [
+            "enneagram_runner_v3-2_3run.py",
+            "enneagram_runner_v3-2_3run_NoContext.py"
+        ]
+
+        # Track results
+        n_models = len(models)
+        n_scripts = len(test_scripts)
+        total_tests = n_models * n_scripts
+
+        if args.driver == "parallel" and shutil.which("parallel") is None:
+            logger.log("GNU parallel not found in PATH; using the python driver.")
+            args.driver = "python"
+
+        if args.driver == "parallel" and not run_with_gnu_parallel(
+            logger, models, test_scripts, max(1, args.max_parallel),
+            args.stop_on_first_failure
+        ):
+            logger.log("Falling back to the python driver.")
+            args.driver = "python"
+
+        if args.driver == "python":
+            # One job per model, in order. Each job mostly waits on its
+            # subprocesses (and those on Ollama), so a thread per job is enough.
+            max_parallel = max(1, min(args.max_parallel, n_models))
+            logger.log(
+                f"Testing up to {max_parallel} model(s) at once"
+                + (", with each model's scripts run concurrently" if args.parallel_scripts else "")
+            )
+
+            stop_event = threading.Event()
+            mp_context = worker_context() if args.in_process else None
+            with ThreadPoolExecutor(max_workers=max_parallel) as executor:
+                futures = [
+                    executor.submit(
+                        run_model, logger, model, model_idx, n_models, test_scripts,
+                        (model_idx - 1) * n_scripts + 1, total_tests,
+                        parallel_scripts=args.parallel_scripts,
+                        stop_event=stop_event,
+                        stop_on_first_failure=args.stop_on_first_failure,
+                        max_failures=args.skip_model_after_n_failures,
+                        preflight=args.preflight,
+                        mp_context=mp_context
+                    )
+                    for model_idx, model in enumerate(models, 1)
+                ]
+                for future in futures:
+                    future.result()
+
+        # The logger's test entries are the one record of the results
+        ok_list, failed_list = [], []
+        for t in logger.json_data["tests"]:
+            (ok_list if t["success"] else failed_list).append(t)
+        failed = len(failed_list)
+
+        # Finalize logs with summary
+        logger.finalize(total_tests, len(ok_list), failed)
+
+        # Detailed results to console
+        if failed > 0:
+            print("\nFailed tests:")
+            for t in failed_list:
+                print(f"  ❌ {t['model']} - {t['script']}")
+
+        print("\nSuccessful tests:")
+        for t in ok_list:
+            print(f"  ✅ {t['model']} - {t['script']}")
+
+        print("\nAll results have been saved to the results/ directory.")
+        print(_SEP_EQ)
+
+        # Exit with error code if any tests failed
+        sys.exit(0 if failed == 0 else 1)
+    finally:
+        logger.close()
 
 
 if __name__ == "__main__":